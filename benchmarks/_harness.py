@@ -0,0 +1,54 @@
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+
+type Setup = Callable[[int, Path], Callable[[], object]]
+
+@dataclass(frozen=True)
+class Benchmark:
+    group: str
+    name: str
+    setup: Setup
+    sizes: tuple[int, ...]
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}.{self.name}"
+
+BENCHMARKS: list[Benchmark] = []
+
+def benchmark(group: str, *, sizes=SIZES, name: str | None = None):
+    """
+    Register a benchmark.
+
+    The decorated function gets the problem size and a scratch directory,
+    prepares the data (not timed) and returns the callable that is timed.
+    """
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS.append(Benchmark(group, name or setup.__name__, setup, tuple(sizes)))
+        return setup
+    return decorator
+
+def time_callable(fn: Callable[[], object], *, repeat: int = 3, min_time: float = 0.2) -> dict:
+    """Seconds per call: one warm-up call, then `repeat` rounds of at least `min_time`."""
+    timer = timeit.Timer(fn)
+    first = timer.timeit(1)
+
+    if first >= min_time:
+        number = 1
+        times = [first, *timer.repeat(repeat - 1, 1)]
+    else:
+        number = max(1, int(min_time / max(first, 1e-9)))
+        times = [t / number for t in timer.repeat(repeat, number)]
+
+    times.sort()
+    return {
+        "number": number,
+        "repeat": len(times),
+        "min_s": times[0],
+        "median_s": times[len(times) // 2],
+        "times_s": times,
+    }
@@ -0,0 +1,39 @@
+from batfloman_praktikum_lib import DataCluster, MeasurementArray
+from batfloman_praktikum_lib.structs import ColumnarDataCluster
+from tests.generate_mock_data import MeasurementSetting, generate_random_columns
+
+from _harness import benchmark
+
+SETTINGS = [
+    MeasurementSetting("x", mu=10, sigma=2),
+    MeasurementSetting("y", mu=5, sigma=1),
+    2.5,
+]
+
+def _columnar(n: int) -> ColumnarDataCluster:
+    columns = generate_random_columns(n, SETTINGS, seed=0)
+    return ColumnarDataCluster.from_columns({
+        name: MeasurementArray(values, errors) if errors.any() else values
+        for name, (values, errors) in columns.items()
+    })
+
+def _cluster(n: int, backend: str) -> DataCluster:
+    cluster = _columnar(n)
+    return cluster if backend == "columnar" else cluster.to_rows()
+
+def _register(backend: str, sizes):
+    def register(op: str, make):
+        @benchmark("datacluster", sizes=sizes, name=f"{op}[{backend}]")
+        def setup(n, _):
+            return make(_cluster(n, backend))
+
+    register("values", lambda dc: lambda: dc.values("x"))
+    register("errors", lambda dc: lambda: dc.errors("x"))
+    register("column", lambda dc: lambda: dc.column("x"))
+    register("sort", lambda dc: lambda: dc.sort("y"))
+    register("filter", lambda dc: lambda: dc.filter(lambda row: row["x"] > 10))
+    register("mean", lambda dc: lambda: dc.mean())
+
+# one Python object per cell -> the row backend is capped earlier
+_register("rows", sizes=(10**3, 10**4, 10**5, 10**6))
+_register("columnar", sizes=(10**3, 10**4, 10**5, 10**6, 10**7))
@@ -0,0 +1,32 @@
+import numpy as np
+
+from batfloman_praktikum_lib.graph_fit import Gaussian, Linear, least_squares, orthogonal_distance
+
+from _harness import benchmark
+
+def _linear_data(n: int):
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 10, n)
+    y = 2 * x + 1 + rng.normal(0, 0.5, n)
+    return x, y, np.full(n, 0.5), np.full(n, 0.05)
+
+def _gaussian_data(n: int):
+    rng = np.random.default_rng(0)
+    x = np.linspace(-5, 5, n)
+    y = Gaussian.model(x, 3.0, 1.0, 0.5) + rng.normal(0, 0.05, n)
+    return x, y, np.full(n, 0.05)
+
+@benchmark("fits", sizes=(10**3, 10**4, 10**5, 10**6))
+def least_squares_linear(n, _):
+    x, y, yerr, _ = _linear_data(n)
+    return lambda: least_squares.generic_fit(Linear, x, y, yerr, ignore_warning_x_errors=True)
+
+@benchmark("fits", sizes=(10**3, 10**4, 10**5, 10**6))
+def least_squares_gaussian(n, _):
+    x, y, yerr = _gaussian_data(n)
+    return lambda: least_squares.generic_fit(Gaussian, x, y, yerr, ignore_warning_x_errors=True)
+
+@benchmark("fits", sizes=(10**3, 10**4, 10**5))
+def orthogonal_distance_linear(n, _):
+    x, y, yerr, xerr = _linear_data(n)
+    return lambda: orthogonal_distance.generic_fit(Linear, x, y, x_err=xerr, y_err=yerr, initial_guess=[2.0, 1.0])
@@ -0,0 +1,21 @@
+import numpy as np
+
+from batfloman_praktikum_lib import graph
+from batfloman_praktikum_lib.graph_fit import Gaussian, least_squares
+
+from _harness import benchmark
+
+@benchmark("graph", sizes=(10**3, 10**5))
+def plot_fit_result(n, _):
+    x = np.linspace(-5, 5, n)
+    y = Gaussian.model(x, 3.0, 1.0, 0.5) + np.random.default_rng(0).normal(0, 0.05, n)
+    result = least_squares.generic_fit(Gaussian, x, y, np.full(n, 0.05), ignore_warning_x_errors=True)
+    plot = graph.create_plot()
+    _, ax = plot
+
+    def run():
+        ax.cla()
+        ax.set_xlim(-5, 5)
+        graph.plot(result, plot=plot)
+
+    return run
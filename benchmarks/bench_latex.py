@@ -0,0 +1,17 @@
+import numpy as np
+import pandas as pd
+
+from batfloman_praktikum_lib import Measurement
+from batfloman_praktikum_lib.io.latex.formatter import format_dataframe
+from tests.generate_mock_data import generate_random_values
+
+from _harness import benchmark
+
+@benchmark("latex", sizes=(10**3, 10**4, 10**5))
+def format_dataframe_measurements(n, _):
+    values, errors = generate_random_values(n, seed=0)
+    df = pd.DataFrame({
+        "U": np.frompyfunc(Measurement.from_value_error, 2, 1)(values, errors),
+        "I": generate_random_values(n, mu=2, seed=1)[0],
+    })
+    return lambda: format_dataframe(df)
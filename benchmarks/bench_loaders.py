@@ -0,0 +1,55 @@
+import numpy as np
+
+from batfloman_praktikum_lib.io import load_cassy, load_csv, load_csv_oszi
+from tests.generate_mock_data import generate_random_values
+
+from _harness import benchmark
+
+def _table(n: int, columns: int = 3) -> np.ndarray:
+    return np.column_stack([generate_random_values(n, seed=i)[0] for i in range(columns)])
+
+def _write_csv(path, n: int):
+    with open(path, "w") as f:
+        f.write("// benchmark data\n# t, U, I\n")
+        np.savetxt(f, _table(n), delimiter=", ", fmt="%.10g")
+    return path
+
+def _write_cassy(path, n: int):
+    with open(path, "w") as f:
+        f.write('MIN=0\tMIN=0\tMIN=0\nDEF="t / s"\t"U / V"\t"I / A"\n')
+        lines = ("\t".join(f"{v:.10g}" for v in row) for row in _table(n))
+        f.write("\n".join(lines).replace(".", ",") + "\n")
+    return path
+
+def _write_oszi(path, n: int):
+    with open(path, "w") as f:
+        f.write(f"Record Length,{n}\nSampling Period,1e-6\nSource,CH1\nWaveform Data,\n")
+        np.savetxt(f, generate_random_values(n, seed=0)[0], fmt="%.6g")
+    return path
+
+@benchmark("loaders")
+def csv(n, workdir):
+    path = _write_csv(workdir / f"data_{n}.csv", n)
+    return lambda: load_csv(path)
+
+@benchmark("loaders")
+def cassy(n, workdir):
+    path = _write_cassy(workdir / f"cassy_{n}.txt", n)
+    return lambda: load_cassy(path)
+
+@benchmark("loaders")
+def cassy_cached(n, workdir):
+    path = _write_cassy(workdir / f"cassy_cached_{n}.txt", n)
+    load_cassy(path, cache=True)
+    return lambda: load_cassy(path, cache=True)
+
+@benchmark("loaders")
+def oszi(n, workdir):
+    path = _write_oszi(workdir / f"oszi_{n}.csv", n)
+    return lambda: load_csv_oszi(path)
+
+@benchmark("loaders")
+def oszi_cached(n, workdir):
+    path = _write_oszi(workdir / f"oszi_cached_{n}.csv", n)
+    load_csv_oszi(path, cache=True)
+    return lambda: load_csv_oszi(path, cache=True)
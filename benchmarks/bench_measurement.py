@@ -0,0 +1,37 @@
+import numpy as np
+
+from batfloman_praktikum_lib import Measurement, MeasurementArray
+from tests.generate_mock_data import generate_random_values
+
+from _harness import benchmark
+
+def _object_array(n: int, seed: int) -> np.ndarray:
+    values, errors = generate_random_values(n, seed=seed)
+    return np.frompyfunc(Measurement.from_value_error, 2, 1)(values, errors)
+
+@benchmark("measurement")
+def ufunc_sin_object_array(n, _):
+    arr = _object_array(n, 0)
+    return lambda: np.sin(arr)
+
+@benchmark("measurement")
+def ufunc_multiply_object_arrays(n, _):
+    a, b = _object_array(n, 0), _object_array(n, 1)
+    return lambda: a * b
+
+@benchmark("measurement")
+def ufunc_add_scalar_measurement(n, _):
+    arr = _object_array(n, 0)
+    offset = Measurement(1.0, 0.1)
+    return lambda: arr + offset
+
+@benchmark("measurement")
+def ufunc_sin_measurement_array(n, _):
+    arr = MeasurementArray(*generate_random_values(n, seed=0))
+    return lambda: np.sin(arr)
+
+@benchmark("measurement")
+def ufunc_multiply_measurement_arrays(n, _):
+    a = MeasurementArray(*generate_random_values(n, seed=0))
+    b = MeasurementArray(*generate_random_values(n, seed=1))
+    return lambda: a * b
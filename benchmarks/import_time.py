@@ -0,0 +1,113 @@
+"""
+Cold-start import cost per entry point.
+
+Every entry point is imported in a fresh interpreter with `python -X importtime`;
+the report lists the wall time, the summed import time, the number of imported
+modules and which heavy dependencies got pulled in.
+
+    python benchmarks/import_time.py                     # table
+    python benchmarks/import_time.py --json imports.json # machine readable
+    python benchmarks/import_time.py measurement graph   # selected entry points
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+ENTRY_POINTS = {
+    "package": "import batfloman_praktikum_lib",
+    "measurement": "from batfloman_praktikum_lib import Measurement",
+    "datacluster": "from batfloman_praktikum_lib import DataCluster",
+    "io": "import batfloman_praktikum_lib.io",
+    "graph": "import batfloman_praktikum_lib.graph",
+    "graph_fit": "import batfloman_praktikum_lib.graph_fit",
+    "gui": "from batfloman_praktikum_lib.graph_fit import manual_fit_setup",
+}
+
+HEAVY_MODULES = ("numpy", "scipy", "pandas", "matplotlib", "sympy", "PyQt6", "pyqtgraph")
+
+_CHILD = """
+import sys, time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+print(",".join(sorted({{name.split(".")[0] for name in sys.modules}})))
+"""
+
+def measure(statement: str) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD.format(statement=statement)],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    wall, loaded = proc.stdout.strip().splitlines()[-2:]
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+
+    top_level = set(loaded.split(","))
+    return {
+        "wall_ms": float(wall) * 1e3,
+        "import_ms": sum(self_us for self_us, _ in modules.values()) / 1e3,
+        "modules": len(modules),
+        "heavy": [name for name in HEAVY_MODULES if name in top_level],
+        "slowest": sorted(
+            ((name, cumulative / 1e3) for name, (_, cumulative) in modules.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:10],
+    }
+
+def run(names: list[str], repeat: int) -> dict:
+    results = {}
+    for name in names:
+        runs = [measure(ENTRY_POINTS[name]) for _ in range(repeat)]
+        best = min(runs, key=lambda run: run["wall_ms"])
+        results[name] = {
+            "statement": ENTRY_POINTS[name],
+            "wall_ms": statistics.median(run["wall_ms"] for run in runs),
+            "import_ms": statistics.median(run["import_ms"] for run in runs),
+            "modules": best["modules"],
+            "heavy": best["heavy"],
+            "slowest": best["slowest"],
+        }
+    return results
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("entries", nargs="*", metavar="ENTRY", help=f"one of {', '.join(ENTRY_POINTS)} (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per entry point (median is reported)")
+    parser.add_argument("--json", metavar="FILE", help="write the results as json ('-' for stdout)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.entries if name not in ENTRY_POINTS]
+    if unknown:
+        parser.error(f"unknown entry points: {', '.join(unknown)}")
+
+    results = run(args.entries or list(ENTRY_POINTS), args.repeat)
+    report = {"python": sys.version.split()[0], "results": results}
+
+    if args.json == "-":
+        print(json.dumps(report, indent=2))
+        return
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+    print(f"{'entry point':<14}{'wall [ms]':>11}{'import [ms]':>13}{'modules':>9}  heavy dependencies")
+    for name, result in results.items():
+        heavy = ", ".join(result["heavy"]) or "-"
+        print(f"{name:<14}{result['wall_ms']:>11.1f}{result['import_ms']:>13.1f}{result['modules']:>9}  {heavy}")
+
+if __name__ == "__main__":
+    main()
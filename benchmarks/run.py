@@ -0,0 +1,164 @@
+"""
+Benchmarks for the hot paths of batfloman_praktikum_lib.
+
+Every benchmark runs on synthetic data from `tests/generate_mock_data.py` for
+problem sizes between 1e3 and 1e7 (capped by `--max-size`, default 1e5).
+
+    python benchmarks/run.py                          # table on stdout
+    python benchmarks/run.py -k loaders --max-size 1e7
+    python benchmarks/run.py --json HEAD.json         # machine readable
+    python benchmarks/run.py --json new.json --compare HEAD.json
+
+Import (cold start) cost is measured separately by `benchmarks/import_time.py`.
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import traceback
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MODULES = [
+    "bench_measurement",
+    "bench_datacluster",
+    "bench_loaders",
+    "bench_fits",
+    "bench_graph",
+    "bench_latex",
+]
+
+def _setup_environment() -> None:
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    for path in (ROOT, ROOT / "src"):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _metadata() -> dict:
+    import numpy as np
+    import pandas as pd
+
+    return {
+        "commit": _git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+    }
+
+def run(args) -> list[dict]:
+    from _harness import BENCHMARKS, time_callable
+
+    for module in MODULES:
+        importlib.import_module(module)
+
+    sizes = set(args.sizes) if args.sizes else None
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bpl-bench-") as tmp:
+        workdir = Path(tmp)
+        for bench in BENCHMARKS:
+            if args.filter and not any(pattern in bench.key for pattern in args.filter):
+                continue
+            for n in bench.sizes:
+                if n > args.max_size or (sizes is not None and n not in sizes):
+                    continue
+
+                entry = {"group": bench.group, "name": bench.name, "size": n}
+                try:
+                    fn = bench.setup(n, workdir)
+                    entry.update(time_callable(fn, repeat=args.repeat, min_time=args.min_time))
+                except Exception as e:
+                    entry["error"] = f"{type(e).__name__}: {e}"
+                    if args.verbose:
+                        traceback.print_exc()
+                results.append(entry)
+                _print_entry(entry)
+    return results
+
+# ==================================================
+#    reporting
+# ==================================================
+
+def _format_time(seconds: float) -> str:
+    for unit, factor in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:8.2f} {unit:<2}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+def _print_entry(entry: dict) -> None:
+    key = f"{entry['group']}.{entry['name']}"
+    if "error" in entry:
+        print(f"{key:<48}{entry['size']:>10}  ERROR {entry['error']}", flush=True)
+        return
+    per_item = entry["median_s"] / entry["size"]
+    print(
+        f"{key:<48}{entry['size']:>10}  {_format_time(entry['median_s'])}"
+        f"  ({_format_time(per_item).strip()} / item)",
+        flush=True,
+    )
+
+def _result_key(entry: dict) -> tuple:
+    return entry["group"], entry["name"], entry["size"]
+
+def compare(results: list[dict], baseline_path: Path, threshold: float) -> int:
+    baseline = {_result_key(entry): entry for entry in json.loads(baseline_path.read_text())["results"]}
+
+    regressions = 0
+    print(f"\ncompared to {baseline_path} (ratio = new / old, slower than {1 + threshold:.2f}x is marked)")
+    for entry in results:
+        old = baseline.get(_result_key(entry))
+        if old is None or "error" in entry or "error" in old:
+            continue
+        ratio = entry["median_s"] / old["median_s"]
+        marker = ""
+        if ratio > 1 + threshold:
+            marker = "  <-- slower"
+            regressions += 1
+        elif ratio < 1 / (1 + threshold):
+            marker = "  faster"
+        key = f"{entry['group']}.{entry['name']}"
+        print(f"{key:<48}{entry['size']:>10}  {ratio:6.2f}x{marker}")
+    return regressions
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--filter", action="append", help="only run benchmarks whose 'group.name' contains this (repeatable)")
+    parser.add_argument("--max-size", type=lambda s: int(float(s)), default=10**5, help="largest problem size (default: 1e5)")
+    parser.add_argument("--sizes", type=lambda s: [int(float(v)) for v in s.split(",")], help="comma separated sizes, e.g. 1e3,1e5")
+    parser.add_argument("--repeat", type=int, default=3, help="timing rounds per benchmark (median is reported)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum duration of one timing round in seconds")
+    parser.add_argument("--json", metavar="FILE", help="write the results as json")
+    parser.add_argument("--compare", metavar="FILE", type=Path, help="json results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown reported as regression (default: 0.1)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print tracebacks of failing benchmarks")
+    args = parser.parse_args(argv)
+
+    _setup_environment()
+    results = run(args)
+
+    if args.json:
+        report = {"meta": _metadata(), "results": results}
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
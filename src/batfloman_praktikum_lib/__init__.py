@@ -1,16 +1,43 @@
-from . import structs
-from . import util
-from . import graph_fit
-from . import function_analysis
-from . import io
-
-from .structs import DataCluster, Dataset, Measurement
-# from .saving import save_latex
-from .io import to_latex, save_latex
+from typing import TYPE_CHECKING
+
+# cheap helpers are imported right away, everything else (numpy, scipy,
+# pandas, matplotlib, Qt) only when it is used for the first time
 from .path_managment import set_file, set_basedir, rel_path, ensure_extension, validate_filename
 from .flags import check_quiet
+from ._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "graph",
+        "graph_fit",
+        "io",
+        "structs",
+        "util",
+        "function_analysis",
+        "significant_rounding",
+    ],
+    attributes={
+        "DataCluster": ".structs",
+        "Dataset": ".structs",
+        "Measurement": ".structs",
+        "MeasurementArray": ".structs",
+        "to_latex": ".io",
+        "save_latex": ".io",
+    },
+)
+
+if TYPE_CHECKING:
+    from . import structs
+    from . import util
+    from . import graph_fit
+    from . import function_analysis
+    from . import io
+    from . import graph
+    from . import significant_rounding
 
-from . import graph
+    from .structs import DataCluster, Dataset, Measurement, MeasurementArray
+    from .io import to_latex, save_latex
 
 __all__ = [
     # modules
@@ -25,6 +52,7 @@ __all__ = [
     "DataCluster",
     "Dataset",
     "Measurement",
+    "MeasurementArray",
 
     # helper
     "set_file",
@@ -38,9 +66,3 @@ __all__ = [
     "validate_filename",
     "check_quiet",
 ]
-
-def lazy_imports():
-    global significant_rounding
-    import batfloman_praktikum_lib.significant_rounding as significant_rounding
-
-lazy_imports()
@@ -0,0 +1,38 @@
+import importlib
+import sys
+from collections.abc import Iterable, Mapping
+
+def attach(
+    package_name: str,
+    submodules: Iterable[str] = (),
+    attributes: Mapping[str, str] | None = None,
+):
+    """
+    Module level `__getattr__` and `__dir__` for lazily loaded package members.
+
+    `submodules` are imported on first access, `attributes` maps a public name
+    to the (relative) module it is defined in. Resolved members are stored on
+    the package, so the import only happens once.
+
+    Usage (in a package `__init__.py`):
+        __getattr__, __dir__ = attach(__name__, ["graph"], {"plot": ".graph"})
+    """
+    submodules = set(submodules)
+    attributes = dict(attributes or {})
+
+    def __getattr__(name: str):
+        if name in submodules:
+            value = importlib.import_module(f"{package_name}.{name}")
+        elif name in attributes:
+            module = importlib.import_module(attributes[name], package_name)
+            value = getattr(module, name)
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package_name])) | submodules | set(attributes))
+
+    return __getattr__, __dir__
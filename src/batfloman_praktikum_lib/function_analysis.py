@@ -1,76 +1,252 @@
-from scipy.optimize import root_scalar, minimize_scalar
+from scipy.optimize import minimize_scalar
 import numpy as np
 
-def find_max(fit_func, x_range):
+_GOLDEN = (np.sqrt(5) - 1) / 2
+_MAX_ITER = 100
+
+def find_max(fit_func, x_range, all_maxima=False, num_points=1000):
     """
     Find the maximum value of a function within a given range.
 
+    The function is evaluated once on a grid of `num_points` points (as an
+    array), every local maximum of the grid is then refined in one batched
+    golden-section search.
+
     Parameters:
-    fit_func (callable): The function to find the maximum of.
-    x_range (tuple, optional): The range (start, end) within which to search for the maximum.
-                               Defaults to None, which corresponds to the entire real line.
+    fit_func (callable | FitResult): The function to find the maximum of.
+    x_range (tuple): The range (start, end) within which to search for the maximum.
+    all_maxima (bool, optional): Return all local maxima instead of the largest one. Defaults to False.
+    num_points (int, optional): Number of grid points used to find the starting brackets. Defaults to 1000.
 
     Returns:
     max_x (float): The x-coordinate of the maximum point.
-    max_val (float): The maximum value of the function.
+    max_val (float | Measurement): The maximum value of the function
+                                   (with its 1-sigma error for a FitResult).
+    With `all_maxima=True` a list of (max_x, max_val) sorted by x.
     """
-    result = minimize_scalar(lambda x: -fit_func(x), bounds=x_range, method='bounded')
-    max_x = result.x
-    max_val = -result.fun  # Note: Since we minimized -fit_func, we need to negate the result to get the maximum value
-    return max_x, max_val
+    func, fit_result = _model_function(fit_func)
+    evaluate = _vectorized(func)
+    x_min, x_max = x_range
+
+    x = np.linspace(x_min, x_max, num_points)
+    y = evaluate(x)
+
+    # interior grid maxima, refined within their neighbouring grid points
+    with np.errstate(invalid="ignore"):
+        peak = np.flatnonzero((y[1:-1] > y[:-2]) & (y[1:-1] >= y[2:])) + 1
+    max_xs = _golden_section_max(evaluate, x[peak - 1], x[peak + 1])
+    max_vals = evaluate(max_xs) if max_xs.size else max_xs
+
+    if not all_maxima:
+        # the maximum can also sit on the boundary of the range
+        candidates_x = np.concatenate([max_xs, x[[0, -1]]])
+        candidates_y = np.concatenate([max_vals, y[[0, -1]]])
+        if np.all(np.isnan(candidates_y)):
+            # no usable grid, fall back to a local search
+            result = minimize_scalar(lambda x_val: -func(x_val), bounds=x_range, method='bounded')
+            return result.x, _with_error(fit_result, result.x, -result.fun)
+        best = np.nanargmax(candidates_y)
+        return float(candidates_x[best]), _with_error(fit_result, candidates_x[best], candidates_y[best])
+
+    return [(float(mx), _with_error(fit_result, mx, my)) for mx, my in zip(max_xs, max_vals)]
 
 def find_x_for_y(fit_func, target_y, x_range, num_points=1000, tol=1e-5):
     """
     Find the x values for which the function evaluates to a specific y value.
 
+    The function is evaluated once on the grid, only the intervals with a
+    sign change of fit_func(x) - target_y are refined (batched bracketing
+    search).
+
     Parameters:
-    fit_func (callable): The function to evaluate.
-    target_y (float): The target y value to find corresponding x values for.
+    fit_func (callable | FitResult): The function to evaluate.
+    target_y (float | Measurement): The target y value to find corresponding x values for.
     x_range (tuple): The range (start, end) within which to search for x values.
     num_points (int, optional): Number of points to divide the range into for searching. Defaults to 1000.
     tol (float, optional): Tolerance for considering two x values as the same. Defaults to 1e-5.
 
     Returns:
     x_values (list): A list of x values for which fit_func(x) = target_y.
+                     For a FitResult (or a Measurement as target_y) the x values are
+                     Measurements, the error is propagated via the slope: σ_x = σ_y / |f'(x)|.
     """
-    x_values = []
-    x_min, x_max = x_range
-    x_points = np.linspace(x_min, x_max, num_points)
-
-    # Scan the interval in small segments
-    for i in range(len(x_points) - 1):
-        x0, x1 = x_points[i], x_points[i + 1]
-        
-        # Define the function to find the root of
-        def func_to_solve(x):
-            return fit_func(x) - target_y
-        
-        # Try to find a root in the interval [x0, x1]
-        try:
-            sol = root_scalar(func_to_solve, bracket=[x0, x1], method='brentq')
-            if sol.converged:
-                root = sol.root
-                # Check if the root is not too close to already found roots
-                if not any(np.isclose(root, existing_root, atol=tol) for existing_root in x_values):
-                    x_values.append(root)
-        except ValueError:
-            # No root found in this interval
-            continue
-    
-    return x_values
+    func, fit_result = _model_function(fit_func)
+    evaluate = _vectorized(func)
+    y_value = float(getattr(target_y, "value", target_y))
+    y_error = float(getattr(target_y, "error", 0.0))
+
+    roots = _find_roots(lambda x: evaluate(x) - y_value, x_range, num_points)
+    roots = _deduplicate(roots, tol)
+
+    if fit_result is None and not hasattr(target_y, "error"):
+        return [float(root) for root in roots]
+    return _roots_with_error(evaluate, fit_result, roots, y_error, x_range, num_points)
 
 def find_intersections(f, g, x_min, x_max, n_points=1000):
     """Find all intersections of f(x) and g(x) in [x_min, x_max]."""
-    def h(x):
-        return np.array(f(x)) - np.array(g(x))
-
-    xs = np.linspace(x_min, x_max, n_points)
-    hs = h(xs)
-
-    roots = []
-    for i in range(len(xs) - 1):
-        if hs[i] * hs[i+1] < 0:  # Vorzeichenwechsel
-            sol = root_scalar(lambda xx: h(xx), bracket=[xs[i], xs[i+1]])
-            if sol.converged:
-                roots.append(sol.root)
-    return roots
+    evaluate_f = _vectorized(_model_function(f)[0])
+    evaluate_g = _vectorized(_model_function(g)[0])
+
+    roots = _find_roots(lambda x: evaluate_f(x) - evaluate_g(x), (x_min, x_max), n_points)
+    return [float(root) for root in roots]
+
+# ==================================================
+#    helper
+# ==================================================
+
+def _model_function(fit_func):
+    """Plain (error free) function to search on, plus the FitResult if one was given."""
+    from .graph_fit.fitResult import FitResult
+
+    if isinstance(fit_func, FitResult):
+        return fit_func.func_no_err, fit_func
+    return fit_func, None
+
+def _vectorized(func):
+    """
+    Evaluate `func` on whole arrays, falling back to one call per point
+    for functions that only accept scalars (`math`, `if x < 0`, ...).
+    """
+    vectorized = True
+
+    def evaluate(x):
+        nonlocal vectorized
+        x = np.asarray(x, dtype=float)
+        if vectorized:
+            try:
+                y = _values(func(x))
+                if y.shape == x.shape:
+                    return y
+                if y.size == 1:
+                    return np.full(x.shape, y.item())
+            except (TypeError, ValueError):
+                pass
+            vectorized = False
+        return np.array([_values(func(x_val)).item() for x_val in x.flat], dtype=float).reshape(x.shape)
+
+    return evaluate
+
+def _values(y) -> np.ndarray:
+    # Measurement / MeasurementArray: search on the values
+    if hasattr(y, "value"):
+        return np.asarray(y.value, dtype=float)
+    y = np.asarray(y)
+    if y.dtype == object:
+        return np.array([getattr(v, "value", v) for v in y.flat], dtype=float).reshape(y.shape)
+    return y.astype(float)
+
+def _find_roots(h, x_range, num_points) -> np.ndarray:
+    """Sorted roots of h on the grid: exact grid zeros plus refined sign changes."""
+    x_min, x_max = x_range
+    x = np.linspace(x_min, x_max, num_points)
+    hx = h(x)
+
+    with np.errstate(invalid="ignore"):
+        bracket = np.flatnonzero(np.sign(hx[:-1]) * np.sign(hx[1:]) < 0)
+    refined = _bracketed_roots(h, x[bracket], x[bracket + 1], hx[bracket], hx[bracket + 1])
+    return np.sort(np.concatenate([x[hx == 0], refined]))
+
+def _bracketed_roots(h, a, b, fa, fb, xtol=2e-12, rtol=4 * np.finfo(float).eps) -> np.ndarray:
+    """
+    Illinois (modified regula falsi) on all brackets at once.
+
+    Every iteration evaluates h once, on the array of still unconverged
+    brackets. The Illinois modification halves the stale end point's value,
+    so the brackets keep shrinking like in Brent's method.
+    """
+    a, b, fa, fb = (np.array(arr, dtype=float) for arr in (a, b, fa, fb))
+    root = (a + b) / 2
+    active = np.ones(a.shape, dtype=bool)
+    side = np.zeros(a.shape, dtype=int)  # last end point that was kept (-1: a, 1: b)
+
+    for _ in range(_MAX_ITER):
+        if not active.any():
+            break
+        idx = np.flatnonzero(active)
+        ai, bi, fai, fbi = a[idx], b[idx], fa[idx], fb[idx]
+
+        c = (ai * fbi - bi * fai) / (fbi - fai)
+        # guard against steps outside the bracket (round-off)
+        outside = ~((c > np.minimum(ai, bi)) & (c < np.maximum(ai, bi)))
+        c[outside] = ((ai + bi) / 2)[outside]
+        fc = h(c)
+        root[idx] = c
+
+        same_as_a = np.sign(fc) == np.sign(fai)
+        # replace a (root lies in [c, b]); if b was kept twice, halve f(b)
+        a[idx[same_as_a]] = c[same_as_a]
+        fa[idx[same_as_a]] = fc[same_as_a]
+        stale_b = same_as_a & (side[idx] == 1)
+        fb[idx[stale_b]] /= 2
+        # replace b (root lies in [a, c])
+        other = ~same_as_a
+        b[idx[other]] = c[other]
+        fb[idx[other]] = fc[other]
+        stale_a = other & (side[idx] == -1)
+        fa[idx[stale_a]] /= 2
+        side[idx] = np.where(same_as_a, 1, -1)
+
+        converged = (fc == 0) | (np.abs(b[idx] - a[idx]) <= xtol + rtol * np.abs(c)) | np.isnan(fc)
+        active[idx[converged]] = False
+
+    return root
+
+def _golden_section_max(evaluate, a, b, rtol=1e-10) -> np.ndarray:
+    """Batched golden-section search for the maximum inside every [a, b]."""
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    if a.size == 0:
+        return a
+    tol = rtol * np.maximum(np.abs(b - a).max(), np.abs(a).max())
+
+    c = b - _GOLDEN * (b - a)
+    d = a + _GOLDEN * (b - a)
+    fc, fd = evaluate(c), evaluate(d)
+    for _ in range(_MAX_ITER):
+        if np.all(b - a <= tol):
+            break
+        # keep the side with the larger value
+        left = fc > fd
+        b = np.where(left, d, b)
+        a = np.where(left, a, c)
+        new_c = np.where(left, b - _GOLDEN * (b - a), d)
+        new_d = np.where(left, c, a + _GOLDEN * (b - a))
+        probe = np.where(left, new_c, new_d)
+        f_probe = evaluate(probe)
+        fc, fd = np.where(left, f_probe, fd), np.where(left, fc, f_probe)
+        c, d = new_c, new_d
+
+    return (a + b) / 2
+
+def _deduplicate(roots, tol) -> np.ndarray:
+    """Drops roots within `tol` of the previously kept one (roots are sorted)."""
+    if roots.size == 0:
+        return roots
+    kept = [roots[0]]
+    for root in roots[1:]:
+        if not np.isclose(root, kept[-1], atol=tol):
+            kept.append(root)
+    return np.asarray(kept)
+
+def _with_error(fit_result, x, y):
+    """Value at a maximum; for a FitResult including its 1-sigma band."""
+    if fit_result is None:
+        return float(y)
+    return fit_result.func(float(x))
+
+def _roots_with_error(evaluate, fit_result, roots, y_error, x_range, num_points):
+    from .structs.measurement import Measurement
+
+    if roots.size == 0:
+        return []
+
+    # slope at the roots (central differences, step relative to the grid spacing)
+    step = 1e-3 * abs(x_range[1] - x_range[0]) / max(num_points - 1, 1)
+    slope = (evaluate(roots + step) - evaluate(roots - step)) / (2 * step)
+
+    model_error = np.zeros_like(roots)
+    if fit_result is not None:
+        model_error = np.asarray(fit_result.max_1sigma(roots)) - evaluate(roots)
+
+    with np.errstate(divide="ignore"):
+        x_error = np.hypot(model_error, y_error) / np.abs(slope)
+    return [Measurement(float(root), float(err)) for root, err in zip(roots, x_error)]
@@ -0,0 +1,207 @@
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.axes import Axes
+
+from ..structs.measurementArray import MeasurementArray
+
+type BatchEvaluator = Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]
+
+_INITIAL_POINTS = 65
+_MIN_POINTS = 64
+_MAX_POINTS = 10000
+_POINTS_PER_PIXEL = 2
+# allowed deviation from a straight segment, in pixels of the axes height
+_PIXEL_TOLERANCE = 0.25
+# smallest segment, as a fraction of the spacing of `max_points` uniform samples
+_MIN_SEGMENT = 0.25
+
+
+def batch_evaluator(func: Callable[..., Any]) -> BatchEvaluator:
+    """
+    Wraps `func` so that it is evaluated on a whole x array at once.
+
+    Returns `(values, errors)` as float arrays. Functions that do not accept
+    arrays (e.g. `math.sin`, `if x < 0: ...`) are evaluated point by point;
+    after the first failure the array call is not attempted again.
+    """
+    vectorized = True
+
+    def evaluate(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        nonlocal vectorized
+        if vectorized:
+            try:
+                return _value_error(func(x), x.shape)
+            except (TypeError, ValueError):
+                vectorized = False
+        return _value_error([func(x_val) for x_val in x], x.shape)
+
+    return evaluate
+
+
+def _value_error(y: Any, shape: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+    if not isinstance(y, MeasurementArray):
+        if isinstance(y, np.ndarray) and y.dtype != object:
+            y = MeasurementArray(y)
+        else:
+            y = MeasurementArray.from_measurements(np.ravel(np.asarray(y, dtype=object)) if np.ndim(y) else [y])
+
+    if y.value.shape != shape:
+        if y.value.size != 1:
+            raise ValueError(f"function returned shape {y.value.shape} for x of shape {shape}")
+        return np.full(shape, y.value.item()), np.full(shape, y.error.item())
+    return y.value, y.error
+
+
+def sampling_for_axes(ax: Axes) -> dict[str, float]:
+    """
+    `initial_points` / `max_points` / `tolerance` for `sample_curve` matching
+    the resolution of `ax`.
+
+    The initial grid has one point per (output) pixel column of the axes, so
+    that no feature wider than a pixel falls between two samples; refinement
+    adds up to a few points per pixel, until the deviation is a fraction of a
+    pixel of the axes height.
+    """
+    fig = ax.get_figure()
+    dpi = fig.dpi if fig is not None else rcParams["figure.dpi"]
+    savefig_dpi = rcParams["savefig.dpi"]
+    if isinstance(savefig_dpi, (int, float)):
+        dpi = max(dpi, savefig_dpi)
+
+    fig_width, fig_height = fig.get_size_inches() if fig is not None else rcParams["figure.figsize"]
+    position = ax.get_position()
+    width_px = position.width * fig_width * dpi
+    height_px = max(position.height * fig_height * dpi, 1.0)
+
+    initial_points = int(np.clip(width_px, _MIN_POINTS, _MAX_POINTS))
+    max_points = int(np.clip(width_px * _POINTS_PER_PIXEL, _MIN_POINTS, _MAX_POINTS))
+    return {"initial_points": initial_points, "max_points": max_points, "tolerance": _PIXEL_TOLERANCE / height_px}
+
+
+def sample_curve(
+    evaluate: BatchEvaluator,
+    xmin: float,
+    xmax: float,
+    *,
+    max_points: int = _MAX_POINTS,
+    log_scale: bool = False,
+    tolerance: float = 1e-3,
+    initial_points: int = _INITIAL_POINTS,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Adaptive sampling of a curve (and its error band) on [xmin, xmax].
+
+    Starts on a uniform grid of `initial_points` (in log10(x) for
+    `log_scale`) and bisects, in vectorized batches, only the segments whose
+    midpoint deviates from the straight line between its end points by more
+    than `tolerance` times the y span, for the value or either edge of the
+    error band. Segments are never split below a quarter of the spacing of
+    `max_points` uniform samples, and no more than `max_points` points are
+    used in total. Features narrower than the initial spacing can be missed
+    entirely, see `sampling_for_axes` for a grid matching the pixels of a plot.
+
+    Returns `(x, values, errors)`.
+    """
+    max_points = max(int(max_points), 2)
+    if log_scale:
+        tmin, tmax = np.log10(max(xmin, 1e-10)), np.log10(xmax)
+        to_x = lambda t: 10**t
+    else:
+        tmin, tmax = float(xmin), float(xmax)
+        to_x = lambda t: t
+
+    t = np.linspace(tmin, tmax, min(initial_points, max_points))
+    y, err = evaluate(to_x(t))
+    min_width = _MIN_SEGMENT * abs(tmax - tmin) / (max_points - 1)
+
+    # refinement priority of every segment, 0 = done
+    priority = _initial_priority(y, err, tolerance)
+    while True:
+        budget = max_points - len(t)
+        candidates = np.flatnonzero((priority > 0) & (np.diff(t) > 2 * min_width))
+        if budget <= 0 or candidates.size == 0:
+            break
+        if candidates.size > budget:
+            candidates = np.sort(candidates[np.argsort(-priority[candidates], kind="stable")[:budget]])
+
+        t_mid = (t[candidates] + t[candidates + 1]) / 2
+        y_mid, err_mid = evaluate(to_x(t_mid))
+
+        deviation = _deviation(y[candidates], err[candidates], y[candidates + 1], err[candidates + 1], y_mid, err_mid)
+        refine = _refinement(deviation, tolerance * _span(y, err, y_mid, err_mid))
+
+        insert_at = candidates + 1
+        t = np.insert(t, insert_at, t_mid)
+        y = np.insert(y, insert_at, y_mid)
+        err = np.insert(err, insert_at, err_mid)
+        priority = _split_priority(priority, candidates, refine)
+
+    return to_x(t), y, err
+
+
+def _initial_priority(y: np.ndarray, err: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Priorities of the segments of the initial grid, from the deviation of
+    every point from the chord between its neighbours (a quarter of it is
+    the expected deviation at the midpoint of a segment). Segments of a
+    straight stretch start out done.
+    """
+    if len(y) < 3:
+        return np.full(len(y) - 1, np.inf)
+    point = np.zeros(len(y))
+    point[1:-1] = _deviation(y[:-2], err[:-2], y[2:], err[2:], y[1:-1], err[1:-1]) / 4
+    empty = np.empty(0)
+    return _refinement(np.maximum(point[:-1], point[1:]), tolerance * _span(y, err, empty, empty))
+
+
+def _refinement(deviation: np.ndarray, allowed: float) -> np.ndarray:
+    """Priority of segments that deviate by more than `allowed`, 0 for the others."""
+    if allowed > 0:
+        deviation = deviation / allowed
+    else:
+        deviation = np.where(np.isinf(deviation), np.inf, 0.0)
+    return np.where(deviation > 1, deviation, 0.0)
+
+
+def _split_priority(priority: np.ndarray, split: np.ndarray, refine: np.ndarray) -> np.ndarray:
+    """Priorities after bisecting the (sorted) segments `split`; both halves inherit `refine`."""
+    shifted = np.arange(len(priority)) + np.searchsorted(split, np.arange(len(priority)))
+    new_priority = np.zeros(len(priority) + len(split))
+    new_priority[shifted] = priority
+    left = split + np.arange(len(split))
+    new_priority[left] = refine
+    new_priority[left + 1] = refine
+    return new_priority
+
+
+def _deviation(y_left, err_left, y_right, err_right, y_mid, err_mid) -> np.ndarray:
+    """Largest distance of the midpoint (value and band edges) from the chord."""
+    deviation = np.zeros(len(y_mid))
+    for sign in (0, -1, 1):
+        left = y_left + sign * err_left
+        right = y_right + sign * err_right
+        mid = y_mid + sign * err_mid
+        with np.errstate(invalid="ignore"):
+            distance = np.abs(mid - (left + right) / 2)
+        # segments where the curve becomes (in)finite: refine towards the edge
+        finite = np.isfinite(left) & np.isfinite(right) & np.isfinite(mid)
+        partly_finite = ~finite & (np.isfinite(left) | np.isfinite(right) | np.isfinite(mid))
+        distance = np.where(finite, distance, np.where(partly_finite, np.inf, 0.0))
+        deviation = np.maximum(deviation, distance)
+    return deviation
+
+
+def _span(y, err, y_mid, err_mid) -> float:
+    edges = np.concatenate([y - err, y + err, y_mid - err_mid, y_mid + err_mid])
+    edges = edges[np.isfinite(edges)]
+    return float(np.ptp(edges)) if edges.size else 0.0
+
+
+__all__ = [
+    "batch_evaluator",
+    "sampling_for_axes",
+    "sample_curve",
+]
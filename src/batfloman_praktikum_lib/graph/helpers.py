@@ -4,6 +4,7 @@ from typing import Sequence
 import numpy as np
 import pandas as pd
 
+from ..structs.measurementArray import MeasurementArray
 from ..structs.measurementBase import MeasurementBase
 from .types import SupportedValues
 
@@ -29,6 +30,11 @@ def dataframe_column(data: pd.DataFrame, index: str) -> pd.Series:
 def extract_value_error(
     values: Sequence[SupportedValues],
 ) -> tuple[np.ndarray, np.ndarray]:
+    if isinstance(values, MeasurementArray):
+        return values.value, values.error
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+        return values, np.zeros(values.shape, dtype=float)
+
     resolved_values = []
     errors = []
 
@@ -8,6 +8,8 @@ from matplotlib.axes import Axes
 
 from ..graph_fit.fitResult import FitResult, format_fit_quality
 from ..structs.dataCluster import DataCluster
+from ..structs.measurementArray import MeasurementArray
+from .curve_sampling import batch_evaluator, sample_curve, sampling_for_axes
 from .helpers import dataframe_column, extract_value_error, filter_nan_values
 from .plot_state import Plot, resolve_plot
 from .types import PlotResult, SupportedValues
@@ -57,6 +59,33 @@ def _auto_show_fit_error_band(
     return np.nanpercentile(band_width, 95) >= min_error_band_fraction * y_span
 
 
+def _sample_function(
+    func: Callable[..., Any],
+    ax: Axes,
+    *,
+    interval: tuple[float, float] | None,
+    log_scale: bool,
+    max_points: int | None,
+) -> tuple[np.ndarray, MeasurementArray]:
+    """Adaptively sampled curve of `func` over `interval` (default: current x limits)."""
+    xmin, xmax = ax.get_xlim() if interval is None else interval
+
+    sampling = sampling_for_axes(ax)
+    if max_points is not None:
+        sampling["max_points"] = max_points
+
+    x_smooth, y_values, y_err = sample_curve(
+        batch_evaluator(func),
+        xmin,
+        xmax,
+        log_scale=log_scale,
+        max_points=int(sampling["max_points"]),
+        tolerance=sampling["tolerance"],
+        initial_points=int(sampling["initial_points"]),
+    )
+    return x_smooth, MeasurementArray(y_values, y_err)
+
+
 def _plot_xy(
     x: Sequence[SupportedValues],
     y: Sequence[SupportedValues],
@@ -137,6 +166,7 @@ def _plot_fit_result(
     show_fit_quality_label: bool = True,
     fit_quality_label_decimal_comma: bool = True,
     fit_quality_label_decimals: int = 4,
+    max_points: int | None = None,
     **kwargs: Any,
 ) -> PlotResult:
     if args:
@@ -149,17 +179,13 @@ def _plot_fit_result(
     if with_error != "auto" and not isinstance(with_error, bool):
         raise ValueError('with_error must be True, False, or "auto".')
 
-    xmin, xmax = ax.get_xlim() if interval is None else interval
-    if log_scale:
-        xmin = np.log10(max(xmin, 1e-10))
-        xmax = np.log10(xmax)
-
-    x_smooth = np.linspace(xmin, xmax, 10000)
-    if log_scale:
-        x_smooth = 10**x_smooth
-    x_smooth = list(x_smooth)
-
-    y_smooth = [fit_result.func(x) for x in x_smooth]
+    x_smooth, y_smooth = _sample_function(
+        fit_result.func,
+        ax,
+        interval=interval,
+        log_scale=log_scale,
+        max_points=max_points,
+    )
 
     if with_error == "auto":
         with_error = _auto_show_fit_error_band(
@@ -193,23 +219,20 @@ def _plot_callable(
     change_viewport: bool = True,
     with_error: ErrorBandMode = "auto",
     log_scale: bool = False,
+    max_points: int | None = None,
     **kwargs: Any,
 ) -> PlotResult:
     _, ax = plot
     if with_error != "auto" and not isinstance(with_error, bool):
         raise ValueError('with_error must be True, False, or "auto".')
 
-    xmin, xmax = ax.get_xlim() if interval is None else interval
-    if log_scale:
-        xmin = np.log10(max(xmin, 1e-10))
-        xmax = np.log10(xmax)
-
-    x_smooth = np.linspace(xmin, xmax, 10000)
-    if log_scale:
-        x_smooth = 10**x_smooth
-    x_smooth = list(x_smooth)
-
-    y_smooth = [func(x) for x in x_smooth]
+    x_smooth, y_smooth = _sample_function(
+        func,
+        ax,
+        interval=interval,
+        log_scale=log_scale,
+        max_points=max_points,
+    )
 
     if with_error == "auto":
         with_error = True
@@ -45,6 +45,7 @@ def plot(
     show_fit_quality_label: bool = True,
     fit_quality_label_decimal_comma: bool = True,
     fit_quality_label_decimals: int = 4,
+    max_points: int | None = None,
     **kwargs: Any,
 ) -> PlotResult: ...
 
@@ -59,6 +60,7 @@ def plot(
     change_viewport: bool = True,
     with_error: ErrorBandMode = "auto",
     log_scale: bool = False,
+    max_points: int | None = None,
     **kwargs: Any,
 ) -> PlotResult: ...
 
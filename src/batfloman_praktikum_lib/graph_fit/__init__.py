@@ -1,8 +1,13 @@
+from typing import TYPE_CHECKING
+
 from .least_squares import generic_fit as least_squares_fit
 from .orthogonal_distance import generic_fit as orthogonal_distance_regression_fit
+from .linear_regression import linear_fit, york_fit
 
-from .init_params import ManualFitSetup, manual_fit_setup, manual_init_params
+from .init_params import ManualFitSetup
 from .fitResult import FitResult
+from .batch_fitting import batch_fit
+from .streaming import array_chunks, streaming_linear_fit
 from .fit_session import (
     AvailableModels,
     ComponentFitAnalysis,
@@ -14,16 +19,35 @@ from .fit_session import (
     SelectionIterable,
     FitSession,
     FitSessionModelType,
-    FitSessionModelsWindow,
-    FitSessionVisualizationWindow,
     IntervalKind,
     ModelInstance,
     SelectionRef,
     SelectionSpec,
     SessionModel,
-    manual_fit_session,
-    open_fit_session_windows,
 )
+from .._lazy import attach
+
+# GUI entry points (PyQt6 / pyqtgraph) are imported on first use
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "manual_fit_setup": ".init_params",
+        "manual_init_params": ".init_params",
+        "FitSessionModelsWindow": ".fit_session",
+        "FitSessionVisualizationWindow": ".fit_session",
+        "manual_fit_session": ".fit_session",
+        "open_fit_session_windows": ".fit_session",
+    },
+)
+
+if TYPE_CHECKING:
+    from .init_params import manual_fit_setup, manual_init_params
+    from .fit_session import (
+        FitSessionModelsWindow,
+        FitSessionVisualizationWindow,
+        manual_fit_session,
+        open_fit_session_windows,
+    )
 
 from .models import (
     ConstFunc,
@@ -44,7 +68,12 @@ from .models import (
 __all__ = [
     "least_squares_fit",
     "orthogonal_distance_regression_fit",
+    "linear_fit",
+    "york_fit",
     "FitResult",
+    "batch_fit",
+    "streaming_linear_fit",
+    "array_chunks",
     "AvailableModels",
     "ComponentFitAnalysis",
     "FitAnalysis",
@@ -0,0 +1,374 @@
+import multiprocessing
+import os
+import pickle
+import signal
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from inspect import isclass
+from typing import Any, Literal, Optional, Type
+
+import numpy as np
+
+from ..structs.dataset import Dataset
+from ..structs.measurement import Measurement
+from .fitResult import FIT_METHODS, FitResult
+from .fixed_params import FixedParamBinding, build_fixed_param_binding
+from .init_params.order_init_params import InitalParamGuess
+from .jacobian import JacobianSpec, resolve_jacobian
+from .models.fitModel import FitModel
+
+type BatchExecutor = Literal["process", "thread", "serial"]
+
+_POLL_INTERVAL = 0.05
+
+@dataclass(frozen=True)
+class _PreparedFit:
+    """Everything that is the same for all datasets of a batch (built once, sent once per worker)."""
+    model: Callable
+    model_class: Optional[Type[FitModel]]
+    param_names: list[str]
+    binding: FixedParamBinding
+    jacobian: Optional[Callable]
+    method: Optional[FIT_METHODS]
+    initial_guess: Optional[InitalParamGuess]
+
+    @property
+    def result_param_names(self) -> list[str]:
+        # fixed parameters are part of the result (with zero error)
+        return list(self.binding.full_param_names) if self.binding.fixed_params else self.param_names
+
+    def fit(self, x, y, x_err, y_err) -> FitResult:
+        from .least_squares import generic_fit as ls_fit
+        from .linear_regression import linear_fit
+        from .orthogonal_distance import generic_fit as odr_fit
+
+        method = self.method
+        if method is None:
+            method = "ODR" if x_err is not None else "least squares"
+
+        if method != "ODR" and self.model_class is not None and self.model_class.basis is not None:
+            return linear_fit(
+                self.model, x, y, y_err,
+                basis=self.model_class.basis,
+                param_names=self.param_names,
+                binding=self.binding,
+                ignore_warning_x_errors=True,
+                ignore_warning_y_errors=True,
+            )
+
+        initial_guess = self.initial_guess
+        if initial_guess is None and self.model_class is not None:
+            initial_guess = self.model_class.get_initial_guess(x, y)
+
+        if method == "ODR":
+            return odr_fit(
+                self.model, x, y,
+                x_err=x_err,
+                y_err=y_err,
+                initial_guess=initial_guess,
+                param_names=self.param_names,
+                jacobian=self.jacobian,
+                binding=self.binding,
+                ignore_warning_x_errors=True,
+                ignore_warning_y_errors=True,
+            )
+        return ls_fit(
+            self.model, x, y, y_err,
+            initial_guess=initial_guess,
+            param_names=self.param_names,
+            jacobian=self.jacobian,
+            binding=self.binding,
+            ignore_warning_x_errors=True,
+            ignore_warning_y_errors=True,
+        )
+
+def batch_fit(
+    model: Callable | Type[FitModel],
+    datasets: Sequence | Mapping,
+    *,
+    x_index: str | None = None,
+    y_index: str | None = None,
+    method: Optional[FIT_METHODS] = None,
+    initial_guess: Optional[InitalParamGuess] = None,
+    fixed_params: Mapping[str, Any] | None = None,
+    param_names: list[str] | None = None,
+    jacobian: JacobianSpec = None,
+    executor: BatchExecutor = "thread",
+    max_workers: int | None = None,
+    timeout: float | None = None,
+):
+    """
+    Fits the same model to many independent datasets.
+
+    `datasets` is a sequence (labelled 0, 1, ...) or a mapping label -> dataset.
+    A dataset is a `(x, y)`, `(x, y, y_err)` or `(x, y, x_err, y_err)` tuple
+    (values may be Measurements), or a DataCluster together with
+    `x_index` / `y_index`.
+
+    The model, parameter names, fixed-parameter binding and Jacobian are
+    prepared once and shared by all fits. Fits run on a thread pool
+    (`executor="thread"`, default), a process pool (`"process"`, fastest for
+    models that hold the GIL) or one after another (`"serial"`).
+
+    `"process"` starts new Python processes that import the calling script
+    on Windows and macOS: the script has to guard its code with
+    `if __name__ == "__main__":`, otherwise it fails there.
+
+    `timeout` limits the run time of every single fit (seconds, from the
+    moment the fit starts). A fit that raises or times out does not stop the
+    batch, its row gets NaN parameters and the message in the `error`
+    column. A timed out fit in a process is stopped (its worker is killed);
+    a thread can not be stopped and keeps running in the background.
+
+    Returns a DataCluster with one row per dataset, in input order:
+    `dataset`, the parameters (as Measurements), `chi2_red`, `method`, `error`.
+    """
+    prepared = _prepare(model, method, initial_guess, fixed_params, param_names, jacobian)
+
+    labels = list(datasets.keys()) if isinstance(datasets, Mapping) else list(range(len(datasets)))
+    items = list(datasets.values()) if isinstance(datasets, Mapping) else list(datasets)
+    arrays = [_extract_dataset(item, x_index, y_index) for item in items]
+
+    if any(y_err is None for _, _, _, y_err in arrays):
+        print("Warning: batch_fit: no y-value uncertainties for some datasets, using equal weights !")
+
+    if executor == "process" and not _is_picklable(prepared):
+        print("Warning: batch_fit: model can not be sent to worker processes, using threads instead")
+        executor = "thread"
+
+    outcomes = _run(prepared, arrays, executor, max_workers, timeout)
+    return _to_datacluster(prepared, labels, outcomes)
+
+# ==================================================
+#    preparation
+# ==================================================
+
+def _prepare(model, method, initial_guess, fixed_params, param_names, jacobian) -> _PreparedFit:
+    model_class = model if isclass(model) and issubclass(model, FitModel) else None
+    binding = build_fixed_param_binding(model, fixed_params=fixed_params)
+
+    if model_class is not None:
+        if jacobian is None:
+            jacobian = model_class.jacobian
+        model = model_class.model
+    if method not in (None, "least squares", "ODR"):
+        raise ValueError(f'method must be "least squares", "ODR" or None, got {method!r}')
+
+    return _PreparedFit(
+        model=model,
+        model_class=model_class,
+        param_names=list(param_names or binding.full_param_names),
+        binding=binding,
+        jacobian=resolve_jacobian(model, jacobian),
+        method=method,
+        initial_guess=initial_guess,
+    )
+
+def _extract_dataset(item, x_index, y_index):
+    from ..structs.dataCluster import DataCluster
+
+    if isinstance(item, DataCluster):
+        if x_index is None or y_index is None:
+            raise TypeError("batch_fit with DataClusters requires x_index and y_index.")
+        x, y = item.values(x_index), item.values(y_index)
+        x_err, y_err = item.errors(x_index), item.errors(y_index)
+    elif isinstance(item, Sequence) and len(item) in (2, 3, 4):
+        x, y = item[0], item[1]
+        x_err = item[2] if len(item) == 4 else None
+        y_err = item[-1] if len(item) >= 3 else None
+        if y_err is None:
+            y, y_err = _split_measurements(y)
+        if x_err is None:
+            x, x_err = _split_measurements(x)
+    else:
+        raise TypeError(
+            "batch_fit datasets must be (x, y), (x, y, y_err), (x, y, x_err, y_err) or DataClusters, "
+            f"got {type(item).__name__}"
+        )
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return x, y, _optional_errors(x_err), _optional_errors(y_err)
+
+def _split_measurements(values):
+    if len(values) > 0 and all(hasattr(val, "value") and hasattr(val, "error") for val in values):
+        return [val.value for val in values], [val.error for val in values]
+    return values, None
+
+def _optional_errors(errors):
+    if errors is None:
+        return None
+    errors = np.asarray(errors, dtype=float)
+    if errors.size == 0 or np.all(np.isnan(errors) | (errors == 0)):
+        return None
+    return errors
+
+def _is_picklable(prepared: _PreparedFit) -> bool:
+    try:
+        pickle.dumps(prepared)
+    except Exception:
+        return False
+    return True
+
+# ==================================================
+#    execution
+# ==================================================
+
+_worker_prepared: _PreparedFit | None = None
+_worker_started = None
+
+def _init_worker(prepared: _PreparedFit, started) -> None:
+    global _worker_prepared, _worker_started
+    _worker_prepared = prepared
+    _worker_started = started
+
+def _fit_in_worker(task: int, arrays):
+    # tell the parent when the fit really starts (queued calls already count as running)
+    _worker_started.put((task, os.getpid()))  # type: ignore[union-attr]
+    return _fit_one(_worker_prepared, arrays)
+
+def _fit_one(prepared, arrays):
+    """(FitResult parts, error message) – never raises, so one bad dataset does not kill the batch."""
+    try:
+        result = prepared.fit(*arrays)
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+    values = [param.value for param in result.params.values()]
+    errors = [param.error for param in result.params.values()]
+    return (values, errors, result.quality, result.method), None
+
+def _run(prepared, arrays, executor: BatchExecutor, max_workers, timeout):
+    if executor == "serial" or len(arrays) <= 1:
+        return [_fit_one(prepared, item) for item in arrays]
+    if executor == "process":
+        return _run_processes(prepared, arrays, max_workers, timeout)
+    if executor != "thread":
+        raise ValueError(f'executor must be "process", "thread" or "serial", got {executor!r}')
+
+    pool = ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 1) + 4))
+    futures = [pool.submit(_fit_one, prepared, item) for item in arrays]
+    outcomes: list = [None] * len(futures)
+    timed_out = False
+    try:
+        if timeout is None:
+            for i, future in enumerate(futures):
+                outcomes[i] = _outcome(future)
+        else:
+            timed_out = _collect_threads(futures, outcomes, timeout)
+    finally:
+        # a thread can not be stopped, don't wait for a timed out fit
+        pool.shutdown(wait=not timed_out, cancel_futures=True)
+    return outcomes
+
+def _outcome(future: Future):
+    try:
+        return future.result()
+    except Exception as e:  # e.g. a crashed worker process
+        return None, f"{type(e).__name__}: {e}"
+
+def _timeout_outcome(timeout: float):
+    return None, f"TimeoutError: fit did not finish within {timeout} s"
+
+def _collect_threads(futures: list[Future], outcomes: list, timeout: float) -> bool:
+    """Collects results; a fit that runs longer than `timeout` is reported as failed."""
+    index = {future: i for i, future in enumerate(futures)}
+    started: dict[Future, float] = {}
+    pending = set(futures)
+    timed_out = False
+
+    while pending:
+        done, _ = wait(pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+        for future in done:
+            outcomes[index[future]] = _outcome(future)
+        pending -= done
+
+        now = time.monotonic()
+        for future in list(pending):
+            # a thread pool only marks the call running once a thread picked it up
+            if not future.running():
+                continue
+            start = started.setdefault(future, now)
+            if now - start > timeout:
+                outcomes[index[future]] = _timeout_outcome(timeout)
+                pending.discard(future)
+                timed_out = True
+    return timed_out
+
+def _run_processes(prepared, arrays, max_workers, timeout):
+    outcomes: list = [None] * len(arrays)
+    remaining = list(range(len(arrays)))
+    while remaining:
+        remaining = _process_round(prepared, arrays, remaining, outcomes, max_workers, timeout)
+    return outcomes
+
+def _process_round(prepared, arrays, tasks: list[int], outcomes: list, max_workers, timeout) -> list[int]:
+    """
+    Runs `tasks` on a fresh process pool. A fit that runs longer than
+    `timeout` is reported as failed and its worker process is killed; this
+    breaks the pool, so the fits that did not finish are returned to be run
+    again on a new pool.
+    """
+    started_queue = multiprocessing.SimpleQueue()
+    pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(prepared, started_queue))
+    futures = {pool.submit(_fit_in_worker, task, arrays[task]): task for task in tasks}
+    started: dict[int, tuple[float, int]] = {}
+    pending = set(futures)
+    killed = False
+
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                if not (killed and isinstance(future.exception(), BrokenProcessPool)):
+                    outcomes[futures[future]] = _outcome(future)
+            pending -= done
+
+            now = time.monotonic()
+            while not started_queue.empty():
+                task, pid = started_queue.get()
+                started[task] = (now, pid)
+            if killed or timeout is None:
+                continue
+            for future in list(pending):
+                task = futures[future]
+                if task in started and now - started[task][0] > timeout and not future.done():
+                    outcomes[task] = _timeout_outcome(timeout)
+                    pending.discard(future)
+                    _kill(started[task][1])
+                    killed = True
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        started_queue.close()
+
+    return [task for task in tasks if outcomes[task] is None]
+
+def _kill(pid: int) -> None:
+    try:
+        os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+    except OSError:  # already finished
+        pass
+
+# ==================================================
+#    result table
+# ==================================================
+
+def _to_datacluster(prepared: _PreparedFit, labels, outcomes):
+    from ..structs.dataCluster import DataCluster
+
+    rows = []
+    for label, (result, error) in zip(labels, outcomes):
+        row = {"dataset": label}
+        if result is None:
+            for name in prepared.result_param_names:
+                row[name] = Measurement(np.nan, np.nan)
+            row.update({"chi2_red": np.nan, "method": "", "error": error})
+        else:
+            values, errors, quality, method = result
+            for name, value, err in zip(prepared.result_param_names, values, errors):
+                row[name] = Measurement(value, err)
+            row.update({"chi2_red": quality, "method": method, "error": ""})
+        rows.append(Dataset(row))
+    return DataCluster(rows)
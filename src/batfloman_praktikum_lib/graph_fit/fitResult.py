@@ -3,8 +3,12 @@ from typing import Callable, NamedTuple, List, Literal
 import numpy as np
 
 from batfloman_praktikum_lib.structs.measurement import Measurement
+from batfloman_praktikum_lib.structs.measurementArray import MeasurementArray
+from batfloman_praktikum_lib.structs.measurementBase import MeasurementBase
 from batfloman_praktikum_lib.structs.dataset import Dataset
+from batfloman_praktikum_lib.structs.correlation import correlated_values, is_correlation_tracking_enabled
 from .helper import evaluate_model
+from .jacobian import _DIFF_STEP
 
 type FIT_METHODS = Literal["least squares", "ODR", "idk"]
 
@@ -50,12 +54,15 @@ class FitResult(NamedTuple):
     min_1sigma: Callable[[float], float]
     max_1sigma: Callable[[float], float]
     method: FIT_METHODS
+    # model evaluations of the optimizer (None if unknown)
+    n_evaluations: int | None = None
 
     def __repr__(self):
         return (
             "FitResult(\n"
             f"  method  = {self.method}\n"
             f"  quality = {self.quality:.3f} {_get_quality_statement(self.quality)}\n"
+            f"  evaluations = {self.n_evaluations}\n"
             f"  params  = {{{self.params}}}\n"
             f"  cov=\n{self.cov}\n"
             f"  func        = {self.func}\n"
@@ -65,10 +72,115 @@ class FitResult(NamedTuple):
             ")"
         )
 
+def _is_full_cov(cov, n_params: int) -> bool:
+    return cov is not None and np.shape(cov) == (n_params, n_params) and bool(np.all(np.isfinite(cov)))
+
+# ==================================================
+#    vectorized model band
+# ==================================================
+
+def _parameter_covariance(cov, errors) -> np.ndarray:
+    """
+    Covariance of the parameters, consistent with the reported errors.
+
+    ODR reports `sd_beta` scaled by the residual variance but an unscaled
+    `cov_beta`, so the correlation structure of `cov` is rescaled to `errors`.
+    Without a usable covariance the parameters are taken as uncorrelated.
+    """
+    errors = np.asarray(errors, dtype=float)
+    n = len(errors)
+    if not _is_full_cov(cov, n):
+        return np.diag(errors**2)
+
+    cov = np.asarray(cov, dtype=float)
+    std = np.sqrt(np.clip(np.diag(cov), 0, None))
+    scale = np.divide(errors, std, out=np.ones_like(errors), where=std > 0)
+    scaled = cov * np.outer(scale, scale)
+    scaled[np.diag_indices(n)] = errors**2
+    return scaled
+
+class _ModelBand:
+    """
+    Model value and 1-sigma uncertainty for a whole x array in one pass.
+
+    The uncertainty is sqrt(diag(J·C·Jᵀ)) with the Jacobian J of the model
+    with respect to the parameters (central differences, each a single
+    vectorized model call) and the parameter covariance C. The last
+    evaluation is kept, so e.g. `min_1sigma` and `max_1sigma` on the same x
+    evaluate the model only once.
+    """
+
+    def __init__(self, model: Callable, values, cov: np.ndarray):
+        self.model = model
+        self.values = np.asarray(values, dtype=float)
+        self.cov = cov
+        self._last: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+    def __call__(self, x) -> tuple[np.ndarray, np.ndarray]:
+        x = np.asarray(x, dtype=float)
+        last = self._last
+        if last is not None and last[0].shape == x.shape and np.array_equal(last[0], x, equal_nan=True):
+            return last[1], last[2]
+
+        y = self._evaluate(x, self.values)
+        jac = self.jacobian(x)
+        variance = np.einsum("...i,ij,...j->...", jac, self.cov, jac)
+        sigma = np.sqrt(np.clip(variance, 0, None))
+
+        self._last = (x.copy(), y, sigma)
+        return y, sigma
+
+    def with_x_errors(self, x: np.ndarray, x_err: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Like calling the band, for uncertain x: the x errors are independent
+        of the parameters and add in quadrature to the full J·C·Jᵀ band.
+        """
+        y, sigma = self(x)
+        step = _DIFF_STEP * np.maximum(np.abs(x), 1.0)
+        slope = (self._evaluate(x + step, self.values) - self._evaluate(x - step, self.values)) / (2 * step)
+        return y, np.hypot(sigma, slope * x_err)
+
+    def jacobian(self, x: np.ndarray) -> np.ndarray:
+        """d model / d param_i at every x, shape `x.shape + (n_params,)`."""
+        jac = np.zeros(x.shape + (len(self.values),), dtype=float)
+        for i, value in enumerate(self.values):
+            if self.cov[i, i] == 0:
+                continue  # fixed parameter, does not contribute
+            step = _DIFF_STEP * max(abs(value), np.sqrt(self.cov[i, i]))
+            upper = self.values.copy()
+            lower = self.values.copy()
+            upper[i] += step
+            lower[i] -= step
+            jac[..., i] = (self._evaluate(x, upper) - self._evaluate(x, lower)) / (2 * step)
+        return jac
+
+    def _evaluate(self, x: np.ndarray, params) -> np.ndarray:
+        try:
+            y = evaluate_model(self.model, x, *params)
+        except TypeError:
+            # model only works on scalars (e.g. uses `math`)
+            y = np.asarray([self.model(float(x_val), *params) for x_val in x.flat]).reshape(x.shape)
+        return np.broadcast_to(np.asarray(y, dtype=float), x.shape)
+
+def _is_array(x_val) -> bool:
+    return isinstance(x_val, (list, tuple, np.ndarray, MeasurementArray)) and np.ndim(x_val) > 0
+
+def _contains_measurement(x_val) -> bool:
+    if isinstance(x_val, (MeasurementBase, MeasurementArray)):
+        return True
+    if isinstance(x_val, np.ndarray):
+        return x_val.dtype == object and any(isinstance(x, MeasurementBase) for x in x_val.flat)
+    if isinstance(x_val, (list, tuple)):
+        return any(isinstance(x, MeasurementBase) for x in x_val)
+    return False
+
+# ==================================================
+
 def generate_fit_result(model, values, errors, cov, 
     param_names = None, 
     quality=None, 
     method: FIT_METHODS = "idk",
+    n_evaluations: int | None = None,
 ) -> FitResult:
     if param_names is None:
         param_names = [f"param_{i}" for i in range(len(values))]
@@ -76,31 +188,51 @@ def generate_fit_result(model, values, errors, cov,
         param_names += [f"param_{i}" for i in range(len(param_names), len(values))]
 
     # Create a Dataset object to hold the fit parameters and their uncertainties
-    params = Dataset({
-        name: Measurement(values[i], errors[i]) for i, name in enumerate(param_names)
-    })
+    if is_correlation_tracking_enabled() and _is_full_cov(cov, len(values)):
+        # parameters share the fit covariance in later calculations
+        correlated = correlated_values(values, cov, errors)
+        params = Dataset({
+            name: correlated[i] for i, name in enumerate(param_names)
+        })
+    else:
+        params = Dataset({
+            name: Measurement(values[i], errors[i]) for i, name in enumerate(param_names)
+        })
+
+    band = _ModelBand(model, values, _parameter_covariance(cov, errors))
 
     def func_no_err(x_val):
         return evaluate_model(model, x_val, *values)
 
     def fit_func(x_val):
-        fit_params = [params[name] for name in param_names]
-        if isinstance(x_val, (list, np.ndarray)):
-            return [evaluate_model(model, x, *fit_params) for x in x_val]
-        return evaluate_model(model, x_val, *fit_params)
+        if is_correlation_tracking_enabled():
+            # propagate through the model with the correlated parameters (keeps correlations with x)
+            fit_params = [params[name] for name in param_names]
+            if _is_array(x_val):
+                return [evaluate_model(model, x, *fit_params) for x in x_val]
+            return evaluate_model(model, x_val, *fit_params)
 
-    # # Define min and max functions based on the `fit_func` uncertainty
+        if _contains_measurement(x_val):
+            x = x_val if _is_array(x_val) else [x_val]
+            x = x if isinstance(x, MeasurementArray) else MeasurementArray.from_measurements(x)
+            y, sigma = band.with_x_errors(x.value, x.error)
+            if _is_array(x_val):
+                return MeasurementArray(y, sigma)
+            return Measurement(float(y[0]), float(sigma[0]))
+
+        y, sigma = band(x_val)
+        if _is_array(x_val):
+            return MeasurementArray(y, sigma)
+        return Measurement(float(y), float(sigma))
+
+    # min and max reuse the same (cached) band evaluation
     def min_1sigma(x_val):
-        results = fit_func(x_val);
-        if isinstance(results, Measurement):
-            return results.value - results.error
-        return np.asarray([res.value - res.error for res in results])
+        y, sigma = band(x_val)
+        return y - sigma if _is_array(x_val) else float(y - sigma)
 
     def max_1sigma(x_val):
-        results = fit_func(x_val);
-        if isinstance(results, Measurement):
-            return results.value + results.error
-        return np.asarray([res.value + res.error for res in results])
+        y, sigma = band(x_val)
+        return y + sigma if _is_array(x_val) else float(y + sigma)
 
     return FitResult(
         func=fit_func,
@@ -111,4 +243,39 @@ def generate_fit_result(model, values, errors, cov,
         min_1sigma=min_1sigma,
         max_1sigma=max_1sigma,
         method = method,
+        n_evaluations=n_evaluations,
+    )
+
+# ==================================================
+#    plain-data form (worker processes, caches)
+# ==================================================
+
+def fit_result_to_state(fit_result: FitResult) -> dict:
+    """
+    The numbers of a FitResult as plain (JSON-serializable) data.
+
+    The functions of a FitResult are closures and can not be pickled or
+    saved; `fit_result_from_state` rebuilds them from the model.
+    """
+    cov = None if fit_result.cov is None else np.asarray(fit_result.cov, dtype=float)
+    return {
+        "param_names": [str(name) for name in fit_result.params.keys()],
+        "values": [float(param.value) for param in fit_result.params.values()],
+        "errors": [float(param.error) for param in fit_result.params.values()],
+        "cov": None if cov is None or not np.all(np.isfinite(cov)) else cov.tolist(),
+        "quality": None if fit_result.quality is None else float(fit_result.quality),
+        "method": fit_result.method,
+        "n_evaluations": fit_result.n_evaluations,
+    }
+
+def fit_result_from_state(model: Callable, state: dict) -> FitResult:
+    return generate_fit_result(
+        model,
+        np.asarray(state["values"], dtype=float),
+        np.asarray(state["errors"], dtype=float),
+        None if state.get("cov") is None else np.asarray(state["cov"], dtype=float),
+        param_names=list(state["param_names"]),
+        quality=state.get("quality"),
+        method=state.get("method", "idk"),
+        n_evaluations=state.get("n_evaluations"),
     )
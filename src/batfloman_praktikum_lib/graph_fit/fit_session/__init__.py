@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from .analysis import ComponentFitAnalysis, FitAnalysis
 from .selection import (
     FitSelection,
@@ -16,13 +18,28 @@ from .session import (
     ModelInstance,
     SessionModel,
 )
-from .interactive import manual_fit_session
-from .windows import (
-    FitSessionModelsWindow,
-    FitSessionVisualizationWindow,
-    open_fit_session_windows,
+from ..._lazy import attach
+
+# windows (and the interactive entry point using them) need PyQt6 -> imported on first use
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=["windows", "interactive"],
+    attributes={
+        "manual_fit_session": ".interactive",
+        "FitSessionModelsWindow": ".windows",
+        "FitSessionVisualizationWindow": ".windows",
+        "open_fit_session_windows": ".windows",
+    },
 )
 
+if TYPE_CHECKING:
+    from .interactive import manual_fit_session
+    from .windows import (
+        FitSessionModelsWindow,
+        FitSessionVisualizationWindow,
+        open_fit_session_windows,
+    )
+
 __all__ = [
     "FitSession",
     "IntervalKind",
@@ -0,0 +1,146 @@
+import hashlib
+import json
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from ..fitResult import FIT_METHODS, FitResult, fit_result_from_state, fit_result_to_state
+from ..init_params.fitSetup import ManualFitSetup
+from .parallel import model_function
+
+_MAX_ENTRIES = 256
+
+
+def fit_cache_path(cache_path: Path) -> Path:
+    """The fit results are stored next to the session state: `session.json` -> `session.fits.json`."""
+    return cache_path.with_name(f"{cache_path.stem}.fits.json")
+
+
+def fit_cache_key(
+    setup: ManualFitSetup,
+    components: Sequence[Any],
+    method: Optional[FIT_METHODS],
+    kwargs: Mapping[str, Any],
+) -> str:
+    """
+    Content hash of everything a fit result depends on: the data subset
+    (values and errors), the component models (including their code), fixed
+    params, initial guess, selection and fit method / options.
+    """
+    digest = hashlib.sha256()
+    for values in (setup.x, setup.y, setup.xerr, setup.yerr):
+        _update_values(digest, values)
+    for key in sorted(kwargs):
+        digest.update(key.encode())
+        _update_values(digest, kwargs[key])
+
+    description = {
+        "components": [_describe_model(model_type) for model_type in components],
+        "initial_guess": _sorted_items(setup.initial_guess),
+        "fixed_params": _sorted_items(setup.fixed_params),
+        "interval": None if setup.interval_indices is None else [int(idx) for idx in setup.interval_indices],
+        "excluded": sorted(int(idx) for idx in setup.excluded_indices),
+        "method": method,
+    }
+    digest.update(json.dumps(description, sort_keys=True, default=repr).encode())
+    return digest.hexdigest()
+
+
+class FitCache:
+    """
+    Fit results by `fit_cache_key`, as plain data (see `fit_result_to_state`).
+
+    Lookups rebuild the FitResult from the model, so a hit costs no fit.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, dict] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str | None, model) -> FitResult | None:
+        if key is None or key not in self._entries:
+            return None
+        entry = self._entries.pop(key)
+        self._entries[key] = entry  # most recently used last
+        return fit_result_from_state(model_function(model), entry["result"])
+
+    def put(self, key: str | None, result, method: Optional[FIT_METHODS]) -> None:
+        # results of stand-in setups (tests, custom objects) are not cached
+        if key is None or not isinstance(result, FitResult):
+            return
+        self._entries.pop(key, None)
+        self._entries[key] = {"method": method, "result": fit_result_to_state(result)}
+        while len(self._entries) > _MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+
+    def method_for(self, key: str) -> Optional[FIT_METHODS]:
+        return self._entries[key]["method"]
+
+    def save(self, path: Path, keys: Sequence[str | None]) -> None:
+        """Writes the entries of `keys` (the results the session currently shows)."""
+        entries = {key: self._entries[key] for key in keys if key is not None and key in self._entries}
+        if not entries and not path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(entries, indent=2))
+
+    def load(self, path: Path) -> None:
+        if not path.exists():
+            return
+        try:
+            entries = json.loads(path.read_text())
+        except (OSError, ValueError) as exc:
+            print(f"Warning: could not read fit cache '{path}': {exc}")
+            return
+        self._entries.update(entries)
+
+
+# ==================================================
+#    hashing
+# ==================================================
+
+def _update_values(digest, values) -> None:
+    if values is None:
+        digest.update(b"none")
+        return
+    arr = np.asarray(values, dtype=object)
+    try:
+        nominal = np.array([getattr(val, "value", val) for val in arr.flat], dtype=float)
+        errors = np.array([getattr(val, "error", 0.0) for val in arr.flat], dtype=float)
+    except (TypeError, ValueError):
+        digest.update(repr(arr.tolist()).encode())
+        return
+    digest.update(str(arr.shape).encode())
+    digest.update(nominal.tobytes())
+    digest.update(errors.tobytes())
+
+
+def _describe_model(model_type) -> list[str]:
+    """Name plus a hash of the model code, so an edited model in a script is refitted."""
+    name = f"{getattr(model_type, '__module__', '')}.{getattr(model_type, '__qualname__', repr(model_type))}"
+    code = getattr(model_function(model_type), "__code__", None)
+    if code is None:
+        return [name]
+    digest = hashlib.sha256()
+    _update_code(digest, code)
+    return [name, digest.hexdigest()]
+
+
+def _update_code(digest, code) -> None:
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        # nested functions: their repr contains a memory address
+        if hasattr(const, "co_code"):
+            _update_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _sorted_items(values: Mapping[str, float] | None):
+    if values is None:
+        return None
+    return sorted((str(key), float(value)) for key, value in values.items())
@@ -0,0 +1,179 @@
+import os
+import pickle
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from inspect import isclass
+from typing import Any, Optional
+
+from ..fitResult import FIT_METHODS, FitResult, fit_result_from_state, fit_result_to_state
+from ..init_params.fitSetup import ManualFitSetup
+from ..models import FitModel
+
+# (FitResult, None) on success, (None, exception) on failure
+type FitOutcome = tuple[FitResult | None, Exception | None]
+
+
+def compose_model(model_types: Sequence[Any]):
+    """Sum of the (enabled) component models, None without components."""
+    if not model_types:
+        return None
+
+    model = model_types[0]
+    for component in model_types[1:]:
+        model = model + component
+    return model
+
+
+def model_function(model) -> Callable:
+    return model.model if isclass(model) and issubclass(model, FitModel) else model
+
+
+@dataclass(frozen=True)
+class _FitTask:
+    """
+    A runtime setup in a form that can be sent to a worker process.
+
+    Composite models are classes created on the fly (`Gaussian + Linear`) and
+    can not be pickled, so the worker rebuilds them from their components.
+    """
+    components: tuple[Any, ...]
+    x: Any
+    y: Any
+    xerr: Any
+    yerr: Any
+    initial_guess: dict[str, float] | None
+    fixed_params: dict[str, float] | None
+    interval_indices: tuple[int, int] | None
+    excluded_indices: tuple[int, ...]
+    method: Optional[FIT_METHODS]
+    warm_start: dict[str, float] | None = None
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def run(self) -> tuple[dict | None, Exception | None]:
+        setup = ManualFitSetup(
+            model=compose_model(self.components),
+            x=self.x,
+            y=self.y,
+            xerr=self.xerr,
+            yerr=self.yerr,
+            initial_guess=self.initial_guess,
+            fixed_params=self.fixed_params,
+            interval_indices=self.interval_indices,
+            excluded_indices=self.excluded_indices,
+        )
+        result, error = _fit_setup(setup, self.method, self.warm_start, self.kwargs)
+        if error is not None:
+            return None, error
+        # FitResult holds closures -> only its numbers go back to the parent
+        return fit_result_to_state(result), None
+
+
+def fit_setups_in_parallel(
+    setups: Mapping[int, ManualFitSetup],
+    components: Mapping[int, Sequence[Any]],
+    *,
+    method: Optional[FIT_METHODS] = None,
+    max_workers: int | None = None,
+    warm_starts: Mapping[int, dict[str, float] | None] | None = None,
+    **kwargs,
+) -> dict[int, FitOutcome]:
+    """
+    Fits independent runtime setups concurrently (process pool).
+
+    `components` are the model types each setup model is composed of,
+    `warm_starts` optional start parameters per setup. If a setup can not be
+    sent to a worker process (e.g. a model defined inside a function), all
+    setups are fitted on a thread pool instead.
+
+    On Windows and macOS every worker process imports the calling script,
+    which therefore needs an `if __name__ == "__main__":` guard. Without it
+    the workers fail to start, the pool breaks and the setups are fitted on
+    a thread pool instead (with a warning).
+    """
+    warm_starts = warm_starts or {}
+    tasks = {
+        model_id: _FitTask(
+            components=tuple(components[model_id]),
+            x=setup.x,
+            y=setup.y,
+            xerr=setup.xerr,
+            yerr=setup.yerr,
+            initial_guess=setup.initial_guess,
+            fixed_params=setup.fixed_params,
+            interval_indices=setup.interval_indices,
+            excluded_indices=tuple(setup.excluded_indices),
+            method=method,
+            warm_start=warm_starts.get(model_id),
+            kwargs=dict(kwargs),
+        )
+        for model_id, setup in setups.items()
+    }
+
+    if len(tasks) <= 1 or max_workers == 1:
+        return {
+            model_id: _fit_setup(setup, method, warm_starts.get(model_id), kwargs)
+            for model_id, setup in setups.items()
+        }
+
+    if not _is_picklable(tasks):
+        print("Warning: FitSession.fit: models can not be sent to worker processes, using threads instead")
+        return _fit_on_threads(setups, method, warm_starts, kwargs, max_workers)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {model_id: pool.submit(_run_task, task) for model_id, task in tasks.items()}
+        outcomes = {model_id: _outcome(future) for model_id, future in futures.items()}
+
+    if all(isinstance(error, BrokenProcessPool) for _, error in outcomes.values()):
+        # typically a script without `if __name__ == "__main__":` on a spawn platform
+        print("Warning: FitSession.fit: worker processes could not be started, using threads instead")
+        return _fit_on_threads(setups, method, warm_starts, kwargs, max_workers)
+
+    return {
+        model_id: (None, error) if error is not None else
+        (fit_result_from_state(model_function(setups[model_id].model), state), None)
+        for model_id, (state, error) in outcomes.items()
+    }
+
+
+# ==================================================
+#    execution
+# ==================================================
+
+def _run_task(task: _FitTask):
+    return task.run()
+
+
+def _fit_setup(setup: ManualFitSetup, method, warm_start, kwargs) -> FitOutcome:
+    if warm_start:
+        kwargs = {**kwargs, "warm_start": warm_start}
+    try:
+        return setup.fit(method=method, **kwargs), None
+    except Exception as exc:
+        return None, exc
+
+
+def _fit_on_threads(setups, method, warm_starts, kwargs, max_workers) -> dict[int, FitOutcome]:
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            model_id: pool.submit(_fit_setup, setup, method, warm_starts.get(model_id), kwargs)
+            for model_id, setup in setups.items()
+        }
+        return {model_id: _outcome(future) for model_id, future in futures.items()}
+
+
+def _outcome(future: Future):
+    try:
+        return future.result()
+    except Exception as exc:  # e.g. a crashed worker process or an unpicklable exception
+        return None, exc
+
+
+def _is_picklable(tasks) -> bool:
+    try:
+        pickle.dumps(tasks)
+    except Exception:
+        return False
+    return True
@@ -19,7 +19,9 @@ from .selection import (
     SelectionSpec,
 )
 from ..fitResult import FIT_METHODS, FitResult
-from ..init_params import ManualFitSetup, manual_fit_setup
+from ..init_params.fitSetup import ManualFitSetup
+from .fit_cache import FitCache, fit_cache_key, fit_cache_path
+from .parallel import compose_model, fit_setups_in_parallel
 
 IntervalKind = Literal["index", "x"]
 IntervalDisplayMode = Literal["off", "selected-only", "always"]
@@ -27,6 +29,12 @@ type FitSessionModelType = Callable[..., Any] | type[Any]
 type AvailableModels = Mapping[str, FitSessionModelType]
 
 
+def manual_fit_setup(*args, **kwargs) -> ManualFitSetup:
+    # the interactive setup needs PyQt6 -> only imported when it is used
+    from ..init_params.manual_init_params import manual_fit_setup as _manual_fit_setup
+    return _manual_fit_setup(*args, **kwargs)
+
+
 def _format_available(values) -> str:
     resolved_values = list(values)
     if not resolved_values:
@@ -72,6 +80,9 @@ class SessionModel:
     fixed_params: dict[str, float] | None = None
     setup: ManualFitSetup | None = None
     result: FitResult | None = None
+    fit_key: str | None = None
+    # parameters of the last converged fit, kept when the model is invalidated
+    warm_start_params: dict[str, float] | None = None
     last_error: str | None = None
     load_warning: str | None = None
     show_1sigma_band: bool = True
@@ -81,19 +92,15 @@ class SessionModel:
     def display_name(self) -> str:
         return self.name or str(self.id)
 
-    def build_model(self):
-        active_components = [
+    def active_model_types(self) -> list[FitSessionModelType]:
+        return [
             component.model_type
             for component in self.components
             if component.enabled and component.model_type is not None
         ]
-        if not active_components:
-            return None
 
-        model = active_components[0]
-        for component in active_components[1:]:
-            model = model + component
-        return model
+    def build_model(self):
+        return compose_model(self.active_model_types())
 
 
 ModelInstance = SessionModel
@@ -133,6 +140,7 @@ class FitSession:
         self.models: list[SessionModel] = []
         self._next_model_id = 1
         self._next_color_index = 0
+        self._fit_cache = FitCache()
         self.load_state()
 
     def _build_available_models(
@@ -292,6 +300,7 @@ class FitSession:
                 registry_key=self._registry_key_for_model_type(model_type),
             )
         )
+        session_model.warm_start_params = None
         self.invalidate_model(model_id)
         self.save_state()
         return resolved_id
@@ -305,6 +314,7 @@ class FitSession:
                     for candidate in session_model.components
                     if candidate.id != component_id
                 ]
+                session_model.warm_start_params = None
                 self.invalidate_model(model_id)
                 self.save_state()
                 return component
@@ -330,6 +340,7 @@ class FitSession:
                 f"Component '{component.display_name}' cannot be enabled because its saved model type is unavailable."
             )
         component.enabled = enabled
+        self.get_model(model_id).warm_start_params = None
         self.invalidate_model(model_id)
         self.save_state()
 
@@ -373,6 +384,11 @@ class FitSession:
             mapping=session_model.fixed_params,
             old_components=old_components,
         )
+        session_model.warm_start_params = self._remap_param_mapping_for_component_order(
+            session_model,
+            mapping=session_model.warm_start_params,
+            old_components=old_components,
+        )
         self.invalidate_model(model_id)
         self.save_state()
 
@@ -398,6 +414,7 @@ class FitSession:
         session_model = self.get_model(model_id)
         session_model.setup = None
         session_model.result = None
+        session_model.fit_key = None
         session_model.last_error = None
 
     def set_interval(
@@ -465,9 +482,12 @@ class FitSession:
         )
         try:
             instance.result = instance.setup.fit()
+            instance.fit_key = None
             instance.last_error = None
+            self._remember_params(instance, instance.result)
         except Exception as exc:
             instance.result = None
+            instance.fit_key = None
             instance.last_error = f"{type(exc).__name__}: {exc}"
             self.save_state()
             raise
@@ -620,34 +640,202 @@ class FitSession:
         *,
         method: Optional[FIT_METHODS] = None,
         model_ids: Optional[list[int]] = None,
+        parallel: bool = False,
+        max_workers: int | None = None,
+        warm_start: bool = False,
         **kwargs,
     ) -> dict[int, FitResult]:
-        results: dict[int, FitResult] = {}
+        """
+        Fits the selected models (all by default).
+
+        With `warm_start=True` the optimizer starts from the parameters of the
+        model's last converged fit (kept when the interval, excluded points or
+        fixed params change) and only falls back to the initial guess if that
+        fit fails. `result.n_evaluations` shows the model evaluations needed.
+
+        Results are cached by a hash of everything the fit depends on (data
+        subset, components, fixed params, initial guess, method), so refitting
+        an unchanged model is a lookup. The cache is saved next to
+        `cache_path` and restores the results when the session is reopened.
+
+        With `parallel=True` the (independent) models are fitted concurrently
+        in a process pool of `max_workers` processes. Every model gets its
+        `result` / `last_error`, the first error is raised afterwards.
+        The state is saved once, after all fits. On Windows and macOS the
+        worker processes import the calling script: guard it with
+        `if __name__ == "__main__":`, otherwise the fits fall back to threads.
+        """
         instances = self._resolve_instances(model_ids)
+        try:
+            if parallel:
+                return self._fit_parallel(
+                    instances,
+                    method=method,
+                    max_workers=max_workers,
+                    warm_start=warm_start,
+                    **kwargs,
+                )
+            return self._fit_serial(instances, method=method, warm_start=warm_start, **kwargs)
+        finally:
+            self.save_state()
 
+    def _fit_serial(
+        self,
+        instances: list[SessionModel],
+        *,
+        method,
+        warm_start: bool = False,
+        **kwargs,
+    ) -> dict[int, FitResult]:
+        results: dict[int, FitResult] = {}
         for instance in instances:
             try:
                 setup = self._build_runtime_setup(instance)
-                instance.result = setup.fit(method=method, **kwargs)
-                instance.last_error = None
-                results[instance.id] = instance.result
+                key = self._fit_key_for(instance, setup, method, kwargs)
+                result = self._fit_cache.get(key, setup.model)
+                if result is None:
+                    result = setup.fit(method=method, **self._warm_start_kwargs(instance, warm_start), **kwargs)
+                self._store_fit(instance, key, result, method)
+                results[instance.id] = result
             except Exception as exc:
                 instance.last_error = f"{type(exc).__name__}: {exc}"
                 raise
 
         return results
 
+    def _fit_parallel(
+        self,
+        instances: list[SessionModel],
+        *,
+        method,
+        max_workers: int | None,
+        warm_start: bool = False,
+        raise_errors: bool = True,
+        **kwargs,
+    ) -> dict[int, FitResult]:
+        setups: dict[int, ManualFitSetup] = {}
+        keys: dict[int, str | None] = {}
+        cached: dict[int, FitResult] = {}
+        errors: dict[int, Exception] = {}
+        for instance in instances:
+            try:
+                setup = self._build_runtime_setup(instance)
+            except Exception as exc:
+                errors[instance.id] = exc
+                continue
+            keys[instance.id] = self._fit_key_for(instance, setup, method, kwargs)
+            cached_result = self._fit_cache.get(keys[instance.id], setup.model)
+            if cached_result is not None:
+                cached[instance.id] = cached_result
+            else:
+                setups[instance.id] = setup
+
+        outcomes = fit_setups_in_parallel(
+            setups,
+            {model_id: self.get_model(model_id).active_model_types() for model_id in setups},
+            method=method,
+            max_workers=max_workers,
+            warm_starts={
+                model_id: self._warm_start_kwargs(self.get_model(model_id), warm_start).get("warm_start")
+                for model_id in setups
+            },
+            **kwargs,
+        )
+
+        results: dict[int, FitResult] = {}
+        for instance in instances:
+            if instance.id in cached:
+                result, error = cached[instance.id], None
+            else:
+                result, error = outcomes.get(instance.id, (None, errors.get(instance.id)))
+            if error is not None:
+                instance.last_error = f"{type(error).__name__}: {error}"
+                errors[instance.id] = error
+                continue
+            self._store_fit(instance, keys.get(instance.id), result, method)
+            results[instance.id] = result
+
+        if raise_errors:
+            for instance in instances:
+                if instance.id in errors:
+                    raise errors[instance.id]
+        return results
+
+    def _fit_key_for(self, instance: SessionModel, setup: ManualFitSetup, method, kwargs) -> str | None:
+        try:
+            return fit_cache_key(setup, instance.active_model_types(), method, kwargs)
+        except Exception:
+            # not hashable (e.g. a stand-in setup) -> not cached
+            return None
+
+    def _store_fit(self, instance: SessionModel, key: str | None, result, method) -> None:
+        instance.result = result
+        instance.fit_key = key if key is not None and isinstance(result, FitResult) else None
+        instance.last_error = None
+        self._remember_params(instance, result)
+        self._fit_cache.put(key, result, method)
+
+    def _remember_params(self, instance: SessionModel, result) -> None:
+        if isinstance(result, FitResult):
+            instance.warm_start_params = {
+                str(name): float(param.value)
+                for name, param in result.params.items()
+            }
+
+    def _warm_start_kwargs(self, instance: SessionModel, warm_start: bool) -> dict[str, Any]:
+        """`warm_start=...` for `ManualFitSetup.fit`, if there are usable parameters of a previous fit."""
+        if not warm_start or not instance.warm_start_params:
+            return {}
+        model = instance.build_model()
+        try:
+            param_names = self._component_param_names(model)
+        except (TypeError, ValueError):
+            return {}
+        if set(param_names) != set(instance.warm_start_params):
+            return {}
+        return {"warm_start": dict(instance.warm_start_params)}
+
+    def _restore_fit(self, instance: SessionModel, key: str) -> None:
+        """Cached result of the last fit, if the model and its data did not change since."""
+        if key not in self._fit_cache:
+            return
+        try:
+            setup = self._build_runtime_setup(instance)
+            if self._fit_key_for(instance, setup, self._fit_cache.method_for(key), {}) != key:
+                return
+            instance.result = self._fit_cache.get(key, setup.model)
+            instance.fit_key = key
+            self._remember_params(instance, instance.result)
+        except Exception:
+            return
+
     def try_fit_models(
         self,
         *,
         method: Optional[FIT_METHODS] = None,
         model_ids: Optional[list[int]] = None,
+        parallel: bool = False,
+        max_workers: int | None = None,
+        warm_start: bool = False,
         **kwargs,
     ) -> dict[int, FitResult]:
+        if parallel:
+            try:
+                return self._fit_parallel(
+                    self._resolve_instances(model_ids),
+                    method=method,
+                    max_workers=max_workers,
+                    warm_start=warm_start,
+                    raise_errors=False,
+                    **kwargs,
+                )
+            finally:
+                self.save_state()
+
         results: dict[int, FitResult] = {}
         for instance in self._resolve_instances(model_ids):
             try:
-                results[instance.id] = self.fit_model(instance.id, method=method, **kwargs)
+                results[instance.id] = self.fit_model(instance.id, method=method, warm_start=warm_start, **kwargs)
             except Exception:
                 continue
         return results
@@ -1045,6 +1233,7 @@ class FitSession:
                     "fixed_params": None if instance.fixed_params is None else dict(instance.fixed_params),
                     "show_1sigma_band": instance.show_1sigma_band,
                     "interval_display_mode": instance.interval_display_mode,
+                    "fit_key": instance.fit_key,
                 }
                 for instance in self.models
             ]
@@ -1053,11 +1242,16 @@ class FitSession:
     def save_state(self) -> None:
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
         self.cache_path.write_text(json.dumps(self._serialize_state(), indent=2))
+        self._fit_cache.save(
+            fit_cache_path(self.cache_path),
+            [instance.fit_key for instance in self.models],
+        )
 
     def load_state(self) -> None:
         if not self.cache_path.exists():
             return
         state = json.loads(self.cache_path.read_text())
+        self._fit_cache.load(fit_cache_path(self.cache_path))
         self.models = []
         max_model_number = 0
 
@@ -1122,6 +1316,10 @@ class FitSession:
                     excluded_indices=instance.excluded_indices,
                 )
 
+            fit_key = model_data.get("fit_key")
+            if fit_key is not None:
+                self._restore_fit(instance, fit_key)
+
             self.models.append(instance)
 
             max_model_number = max(max_model_number, model_id)
@@ -1411,7 +1411,8 @@ class FitSessionModelsWindow(QWidget):
         if model_id is None:
             return
         try:
-            self.session.fit_model(model_id)
+            # interval dragging: start from the previous optimum
+            self.session.fit_model(model_id, warm_start=True)
         except Exception:
             pass
         self.refresh(select_model_id=model_id)
@@ -1,5 +1,6 @@
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from functools import cached_property
 from inspect import isclass
 import inspect
 from typing import Any, Callable, Type
@@ -32,24 +33,60 @@ class FixedParamBinding:
             for param_name in self.full_param_names
         ]
 
+    def __getstate__(self):
+        # generated code can not be pickled (worker processes), it is rebuilt on first use
+        state = dict(self.__dict__)
+        state.pop("_compiled_model", None)
+        return state
+
     def wrap_model(self) -> Callable:
-        full_param_names = list(self.full_param_names)
-        fixed_params = dict(self.fixed_params)
-        free_param_names = list(self.free_param_names)
-        model = self.model
+        return self._compiled_model
+
+    @cached_property
+    def _compiled_model(self) -> Callable:
+        """
+        `model(x, *free_values)` with the fixed values filled in.
+
+        Generated once per binding: the call `model(x, a, <fixed b>, c)` is
+        written out, so an evaluation costs no more than calling the model.
+        """
+        free_args = [f"p{idx}" for idx in range(len(self.free_param_names))]
+        free_arg_lookup = dict(zip(self.free_param_names, free_args))
+        call_args = [
+            f"_fixed_{idx}" if param_name in self.fixed_params else free_arg_lookup[param_name]
+            for idx, param_name in enumerate(self.full_param_names)
+        ]
+        code = f"def wrapped({', '.join(['x', *free_args])}):\n"
+        code += f"    return _model({', '.join(['x', *call_args])})\n"
+
+        namespace: dict[str, Any] = {"_model": self.model}
+        for idx, param_name in enumerate(self.full_param_names):
+            if param_name in self.fixed_params:
+                namespace[f"_fixed_{idx}"] = self.fixed_params[param_name]
+        exec(code, namespace)
+        return namespace["wrapped"]
+
+    @cached_property
+    def _free_indices(self) -> np.ndarray:
+        return np.asarray([
+            idx
+            for idx, param_name in enumerate(self.full_param_names)
+            if param_name not in self.fixed_params
+        ], dtype=int)
+
+    def wrap_jacobian(self, jacobian: Callable) -> Callable:
+        """Jacobian of `wrap_model()`: only the columns of the free parameters."""
+        free_indices = self._free_indices
+        full_values = np.asarray(
+            [self.fixed_params.get(param_name, 0.0) for param_name in self.full_param_names],
+            dtype=float,
+        )
 
         def wrapped(x, *free_values):
-            free_lookup = {
-                param_name: free_values[idx]
-                for idx, param_name in enumerate(free_param_names)
-            }
-            ordered_values = [
-                fixed_params[param_name]
-                if param_name in fixed_params
-                else free_lookup[param_name]
-                for param_name in full_param_names
-            ]
-            return model(x, *ordered_values)
+            values = full_values.copy()
+            values[free_indices] = free_values
+            full_jacobian = np.asarray(jacobian(x, *values), dtype=float)
+            return full_jacobian[..., free_indices]
 
         return wrapped
 
@@ -165,6 +202,7 @@ def rebuild_full_fit_result(
     cov,
     quality,
     method,
+    n_evaluations: int | None = None,
 ) -> FitResult:
     full_values = binding.merge_free_values(free_values)
     free_error_lookup = {
@@ -206,4 +244,5 @@ def rebuild_full_fit_result(
         param_names=list(binding.full_param_names),
         quality=quality,
         method=method,
+        n_evaluations=n_evaluations,
     )
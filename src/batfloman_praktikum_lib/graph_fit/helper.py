@@ -29,6 +29,18 @@ def evaluate_model(model: Callable, x, *params):
         return np.asarray([model(x_val, *params) for x_val in x])
 
 
+class CallCounter:
+    """Wraps a model and counts its evaluations (e.g. by an optimizer)."""
+
+    def __init__(self, func: Callable):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.func(*args)
+
+
 def extract_vals_and_errors(vals, errs):
     if all(hasattr(val, "value") and hasattr(val, "error") for val in vals):
         extracted_errs = np.array([val.error for val in vals])
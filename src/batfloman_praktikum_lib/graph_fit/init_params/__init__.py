@@ -1,4 +1,19 @@
-from .manual_init_params import ManualFitSetup, manual_fit_setup, manual_init_params
+from typing import TYPE_CHECKING
+
+from .fitSetup import ManualFitSetup
+from ..._lazy import attach
+
+# the interactive setup needs PyQt6 / pyqtgraph -> imported on first use
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "manual_fit_setup": ".manual_init_params",
+        "manual_init_params": ".manual_init_params",
+    },
+)
+
+if TYPE_CHECKING:
+    from .manual_init_params import manual_fit_setup, manual_init_params
 
 __all__ = [
     "ManualFitSetup",
@@ -0,0 +1,198 @@
+from dataclasses import dataclass
+from inspect import isclass
+from collections.abc import Mapping
+from typing import Any, Optional, Union, Callable, Type
+import numpy as np
+
+from ..models import FitModel
+from ..fitResult import FIT_METHODS, FitResult
+from ...structs.measurementBase import MeasurementBase
+
+# Kept free of Qt imports: fitting a prepared setup must not load the GUI.
+
+@dataclass
+class ManualFitSetup:
+    model: Union[Callable, Type[FitModel]]
+    x: Any
+    y: Any
+    xerr: Any = None
+    yerr: Any = None
+    initial_guess: dict[str, float] | None = None
+    fixed_params: dict[str, float] | None = None
+    interval_indices: tuple[int, int] | None = None
+    excluded_indices: tuple[int, ...] = ()
+
+    def fit(
+        self,
+        *,
+        method: Optional[FIT_METHODS] = None,
+        xerr=None,
+        yerr=None,
+        warm_start: Mapping[str, float] | None = None,
+    ) -> FitResult:
+        """
+        Fits the model to the selected data.
+
+        `warm_start` (e.g. the parameters of the previous fit) seeds the
+        optimizer instead of `initial_guess`, which is only used if the warm
+        started fit fails. After small changes (an interval boundary moved by
+        a few points) the fit then starts next to the optimum.
+        """
+        bound_xerr = self.xerr if xerr is None else xerr
+        bound_yerr = self.yerr if yerr is None else yerr
+
+        x_values, y_values, x_errors, y_errors = _select_fit_data(
+            self.x,
+            self.y,
+            xerr=bound_xerr,
+            yerr=bound_yerr,
+            interval_indices=self.interval_indices,
+            excluded_indices=self.excluded_indices,
+        )
+
+        if warm_start:
+            warm_guess = {**(self.initial_guess or {}), **warm_start}
+            try:
+                result = self._fit_selected(x_values, y_values, x_errors, y_errors, warm_guess, method)
+                if _is_converged(result):
+                    return result
+            except Exception:
+                pass
+
+        return self._fit_selected(x_values, y_values, x_errors, y_errors, self.initial_guess, method)
+
+    def _fit_selected(self, x_values, y_values, x_errors, y_errors, initial_guess, method) -> FitResult:
+        from ..least_squares import generic_fit as least_squares_fit
+        from ..orthogonal_distance import (
+            generic_fit as orthogonal_distance_regression_fit,
+        )
+
+        if isclass(self.model) and issubclass(self.model, FitModel):
+            return self.model.fit(
+                x_values,
+                y_values,
+                xerr=x_errors,
+                yerr=y_errors,
+                initial_guess=initial_guess,
+                fixed_params=self.fixed_params,
+                method=method,
+            )
+
+        if method == "least squares":
+            return least_squares_fit(
+                self.model,
+                x_values,
+                y_values,
+                y_errors,
+                initial_guess=initial_guess,
+                fixed_params=self.fixed_params,
+                ignore_warning_x_errors=True,
+            )
+
+        if method == "ODR" or _should_use_odr(x_values, x_errors):
+            return orthogonal_distance_regression_fit(
+                self.model,
+                x_values,
+                y_values,
+                x_err=x_errors,
+                y_err=y_errors,
+                initial_guess=initial_guess,
+                fixed_params=self.fixed_params,
+            )
+
+        return least_squares_fit(
+            self.model,
+            x_values,
+            y_values,
+            y_errors,
+            initial_guess=initial_guess,
+            fixed_params=self.fixed_params,
+        )
+
+
+def _is_converged(result: FitResult) -> bool:
+    values = [param.value for param in result.params.values()]
+    errors = [param.error for param in result.params.values()]
+    return bool(np.all(np.isfinite(values)) and np.all(np.isfinite(errors)))
+
+
+# ==================================================
+#    fit data selection
+# ==================================================
+
+def _apply_mask(values, mask):
+    if values is None:
+        return None
+    arr = np.asarray(values, dtype=object)
+    if arr.ndim == 0:
+        return values
+    return arr[mask]
+
+
+def _build_selection_mask(
+    x_data,
+    *,
+    interval_indices: tuple[int, int] | None,
+    excluded_indices: tuple[int, ...],
+):
+    mask = np.ones(len(x_data), dtype=bool)
+    if interval_indices is not None:
+        start_idx, end_idx = sorted(interval_indices)
+        if start_idx < 0 or end_idx >= len(x_data):
+            raise IndexError("Fit-interval index out of bounds.")
+        interval_mask = np.zeros(len(x_data), dtype=bool)
+        interval_mask[start_idx:end_idx + 1] = True
+        mask &= interval_mask
+
+    if excluded_indices:
+        excluded = np.array(excluded_indices, dtype=int)
+        if np.any(excluded < 0) or np.any(excluded >= len(x_data)):
+            raise IndexError("Excluded fit-point index out of bounds.")
+        mask[excluded] = False
+
+    return mask
+
+
+def _select_fit_data(
+    x_data,
+    y_data,
+    *,
+    xerr=None,
+    yerr=None,
+    interval_indices: tuple[int, int] | None,
+    excluded_indices: tuple[int, ...],
+):
+    if len(x_data) != len(y_data):
+        raise ValueError(f"x and y have different lengths: {len(x_data)} vs {len(y_data)}")
+
+    mask = _build_selection_mask(
+        x_data,
+        interval_indices=interval_indices,
+        excluded_indices=excluded_indices,
+    )
+
+    x_arr = np.asarray(x_data, dtype=object)[mask]
+    y_arr = np.asarray(y_data, dtype=object)[mask]
+    xerr_arr = _apply_mask(xerr, mask)
+    yerr_arr = _apply_mask(yerr, mask)
+    return x_arr, y_arr, xerr_arr, yerr_arr
+
+
+def _has_embedded_errors(values) -> bool:
+    try:
+        return any(
+            isinstance(val, MeasurementBase) and val.error is not None and val.error > 0
+            for val in values
+        )
+    except TypeError:
+        return False
+
+
+def _should_use_odr(x_data, xerr) -> bool:
+    if xerr is not None:
+        xerr_arr = np.asarray(xerr)
+        if xerr_arr.ndim == 0:
+            return bool(xerr_arr > 0)
+        if np.any(xerr_arr > 0):
+            return True
+    return _has_embedded_errors(x_data)
@@ -0,0 +1,99 @@
+import inspect
+from collections.abc import Callable
+from typing import Literal, Optional, Union
+
+import numpy as np
+
+from .helper import evaluate_model
+
+type JacobianFunc = Callable[..., np.ndarray]
+type JacobianSpec = Optional[Union[JacobianFunc, Literal["symbolic"]]]
+
+_DIFF_STEP = np.finfo(float).eps ** (1 / 3)  # optimal relative step for central differences
+
+# ==================================================
+#    finite differences
+# ==================================================
+
+def numerical_jacobian(model: Callable, x, params, eps: float | None = None) -> np.ndarray:
+    """
+    d model / d param_j at every x, shape `(len(x), len(params))`.
+
+    Central differences, each one a single (vectorized) model call on the
+    whole x array. Without `eps` the step is relative to every parameter.
+    """
+    x = np.asarray(x, dtype=float)
+    params = np.asarray(params, dtype=float)
+    J = np.zeros(x.shape + (len(params),))
+
+    for j, value in enumerate(params):
+        step = eps if eps is not None else _DIFF_STEP * (abs(value) if value != 0 else 1.0)
+        upper = params.copy()
+        lower = params.copy()
+        upper[j] += step
+        lower[j] -= step
+
+        f1 = np.asarray(evaluate_model(model, x, *upper), dtype=float)
+        f2 = np.asarray(evaluate_model(model, x, *lower), dtype=float)
+        J[..., j] = np.broadcast_to((f1 - f2) / (2 * step), x.shape)
+
+    return J
+
+def numerical_x_derivative(model: Callable, x, params) -> np.ndarray:
+    """d model / dx at every x (central differences, two model calls)."""
+    x = np.asarray(x, dtype=float)
+    step = _DIFF_STEP * np.maximum(np.abs(x), 1.0)
+    f1 = np.asarray(evaluate_model(model, x + step, *params), dtype=float)
+    f2 = np.asarray(evaluate_model(model, x - step, *params), dtype=float)
+    return np.broadcast_to((f1 - f2) / (2 * step), x.shape)
+
+# ==================================================
+#    analytic / symbolic
+# ==================================================
+
+def symbolic_jacobian(model: Callable) -> JacobianFunc:
+    """
+    Jacobian from symbolic derivatives (`equations.derivatives.get_derivative`)
+    of the model source, compiled to numpy functions.
+    """
+    import sympy as sp
+    from ..equations.derivatives import get_derivative
+    from ..equations.handle_sympy import to_sympy
+
+    arg_names = list(inspect.signature(model).parameters.keys())
+    symbols = [sp.Symbol(name) for name in arg_names]
+    expr = to_sympy(model)
+    derivatives = [
+        sp.lambdify(symbols, get_derivative(expr, symbol), modules="numpy")
+        for symbol in symbols[1:]
+    ]
+
+    def jacobian(x, *params):
+        x = np.asarray(x, dtype=float)
+        return np.stack([np.broadcast_to(d(x, *params), x.shape) for d in derivatives], axis=-1)
+
+    return jacobian
+
+def resolve_jacobian(model: Callable, jacobian: JacobianSpec) -> Optional[JacobianFunc]:
+    """Jacobian function for `jacobian` (a function, "symbolic" or None)."""
+    if jacobian is None:
+        return None
+    if jacobian == "symbolic":
+        return symbolic_jacobian(model)
+    if not callable(jacobian):
+        raise ValueError(f'jacobian must be a function, "symbolic" or None, got {jacobian!r}')
+    return jacobian
+
+def evaluate_jacobian(model: Callable, jacobian: Optional[JacobianFunc], x, params) -> np.ndarray:
+    """Analytic Jacobian if there is one, vectorized finite differences otherwise."""
+    if jacobian is None:
+        return numerical_jacobian(model, x, params)
+    x = np.asarray(x, dtype=float)
+    return np.broadcast_to(np.asarray(jacobian(x, *params), dtype=float), x.shape + (len(params),))
+
+def odr_jacobians(model: Callable, jacobian: JacobianFunc) -> dict[str, Callable]:
+    """`fjacb` / `fjacd` for `scipy.odr.Model` (ODR wants the Jacobian as (params, n))."""
+    return {
+        "fjacb": lambda B, x: evaluate_jacobian(model, jacobian, x, B).T,
+        "fjacd": lambda B, x: numerical_x_derivative(model, x, B),
+    }
@@ -4,16 +4,18 @@ import numpy as np
 from scipy.optimize import curve_fit
 
 from batfloman_praktikum_lib.graph_fit.models.fitModel import FitModel
-from .helper import evaluate_model, extract_vals_and_errors
+from .helper import CallCounter, evaluate_model, extract_vals_and_errors
 from ..graph.helpers import filter_nan_values
 from .fitResult import generate_fit_result, FitResult
 from .fixed_params import (
+    FixedParamBinding,
     build_fixed_param_binding,
     order_free_initial_guess,
     rebuild_full_fit_result,
 )
 
 from .init_params.order_init_params import InitalParamGuess
+from .jacobian import JacobianSpec, evaluate_jacobian, resolve_jacobian
 
 from .user_warnings import warn_user_no_y_errors_least_squares, warn_user_x_errors_least_squares
 
@@ -26,12 +28,16 @@ def generic_fit(
     initial_guess: Optional[InitalParamGuess] = None,
     fixed_params: Mapping[str, Any] | None = None,
     param_names = None,
+    jacobian: JacobianSpec = None,
+    binding: FixedParamBinding | None = None,
     ignore_warning_x_errors: bool = False,
     ignore_warning_y_errors: bool = False,
 ) -> FitResult:
     if isclass(model) and issubclass(model, FitModel):
         if not param_names:
             param_names = model.get_param_names()
+        if jacobian is None:
+            jacobian = model.jacobian
         model = model.model
 
     x_data, y_data = filter_nan_values(x_data, y_data, warn_filter_nan=True)
@@ -42,9 +48,13 @@ def generic_fit(
     y_data, y_err = extract_vals_and_errors(y_data, y_err)
     x_data, _     = extract_vals_and_errors(x_data, None)
 
-    binding = build_fixed_param_binding(model, fixed_params=fixed_params)
+    if binding is None:
+        binding = build_fixed_param_binding(model, fixed_params=fixed_params)
     fit_model = binding.wrap_model() if binding.fixed_params else model
     fit_model_eval = lambda x, *params: evaluate_model(fit_model, x, *params)
+    jacobian = resolve_jacobian(model, jacobian)
+    if jacobian is not None and binding.fixed_params:
+        jacobian = binding.wrap_jacobian(jacobian)
     fit_param_names = binding.free_param_names if binding.fixed_params else (param_names or binding.full_param_names)
     initial_guess = order_free_initial_guess(
         model,
@@ -66,13 +76,15 @@ def generic_fit(
         )
 
     # Perform the curve fit
+    counted_model = CallCounter(fit_model_eval)
     popt, pcov = curve_fit(
-        fit_model_eval,
+        counted_model,
         x_data,
         y_data,
         sigma=y_err,
         absolute_sigma=True,
         p0=initial_guess,
+        jac=(lambda x, *params: evaluate_jacobian(fit_model, jacobian, x, params)) if jacobian is not None else None,
     )
 
     # Uncertainties from covariance matrix (sqrt of diagonal elements)
@@ -88,9 +100,10 @@ def generic_fit(
             cov=pcov,
             quality=chi_squared_red,
             method="least squares",
+            n_evaluations=counted_model.calls,
         )
 
-    return generate_fit_result(fit_model_eval, popt, perr, pcov, param_names=fit_param_names, quality=chi_squared_red, method="least squares");
+    return generate_fit_result(fit_model_eval, popt, perr, pcov, param_names=fit_param_names, quality=chi_squared_red, method="least squares", n_evaluations=counted_model.calls);
 
 def _calc_chi_squared(model, x_data, y_data, yerr, popt):
     residuals = (y_data - model(x_data, *popt)) / yerr
@@ -0,0 +1,211 @@
+from typing import Callable, Mapping, Any, Optional, Type, Union
+from inspect import isclass
+import warnings
+
+import numpy as np
+
+from .fitResult import FitResult, generate_fit_result
+from .fixed_params import FixedParamBinding, build_fixed_param_binding, get_param_names, rebuild_full_fit_result
+from .helper import evaluate_model, extract_vals_and_errors
+from .models.fitModel import FitModel
+from .orthogonal_distance import _warn_user_no_errors
+from .user_warnings import warn_user_no_y_errors_least_squares, warn_user_x_errors_least_squares
+
+_YORK_MAX_ITERATIONS = 100
+_YORK_RTOL = 1e-12
+
+def linear_fit(
+    model: Union[Callable, Type[FitModel]],
+    x_data,
+    y_data,
+    y_err=None,
+    *,
+    basis: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    fixed_params: Mapping[str, Any] | None = None,
+    param_names = None,
+    binding: FixedParamBinding | None = None,
+    ignore_warning_x_errors: bool = False,
+    ignore_warning_y_errors: bool = False,
+) -> FitResult:
+    """
+    Weighted least squares for models that are linear in their parameters,
+    solved directly (QR of the weighted design matrix `basis(x) / σ`).
+
+    Same result as `least_squares.generic_fit` (absolute sigma), but without
+    an optimizer: no initial guess, no iterations, exact covariance.
+    """
+    if isclass(model) and issubclass(model, FitModel):
+        if not param_names:
+            param_names = model.get_param_names()
+        if basis is None:
+            basis = model.basis
+        model = model.model
+    if basis is None:
+        raise ValueError(f"{getattr(model, '__name__', model)} is not linear in its parameters (no basis), use least_squares_fit")
+
+    warn_user_x_errors_least_squares(x_data, ignore_warning_x_errors)
+    warn_user_no_y_errors_least_squares(y_data, y_err, ignore_warning_y_errors)
+
+    y_data, y_err = extract_vals_and_errors(y_data, y_err)
+    x_data, _     = extract_vals_and_errors(x_data, None)
+    x_data, y_data, y_err = _filter_nan_rows(x_data, y_data, y_err)
+
+    if binding is None and fixed_params:
+        binding = build_fixed_param_binding(model, fixed_params=fixed_params)
+    if binding is not None and binding.fixed_params:
+        fit_param_names = binding.free_param_names
+    else:
+        binding = None
+        fit_param_names = param_names or get_param_names(model)
+
+    A = np.asarray(basis(x_data), dtype=float)
+    A = np.broadcast_to(A, y_data.shape + A.shape[-1:])
+    if binding is not None:
+        # fixed parameters only shift the data: y - A_fixed @ p_fixed = A_free @ p_free
+        fixed_indices = [idx for idx, name in enumerate(binding.full_param_names) if name in binding.fixed_params]
+        fixed_values = [binding.fixed_params[binding.full_param_names[idx]] for idx in fixed_indices]
+        y_data = y_data - A[:, fixed_indices] @ np.asarray(fixed_values, dtype=float)
+        A = A[:, binding._free_indices]
+
+    values, cov = _solve_weighted(A / y_err[:, None], y_data / y_err)
+    chi_squared = float(np.sum(((y_data - A @ values) / y_err) ** 2))
+    dof = len(y_data) - len(values)
+    chi_squared_red = chi_squared / dof if dof > 0 else np.nan
+
+    if binding is not None:
+        return rebuild_full_fit_result(
+            binding=binding,
+            free_values=values,
+            free_errors=np.sqrt(np.diag(cov)),
+            cov=cov,
+            quality=chi_squared_red,
+            method="least squares",
+            n_evaluations=1,
+        )
+
+    fit_model_eval = lambda x, *params: evaluate_model(model, x, *params)
+    return generate_fit_result(fit_model_eval, values, np.sqrt(np.diag(cov)), cov, param_names=list(fit_param_names), quality=chi_squared_red, method="least squares", n_evaluations=1);
+
+def york_fit(
+    model: Callable,
+    x_data,
+    y_data,
+    *,
+    x_err=None,
+    y_err=None,
+    param_names = None,
+    ignore_warning_x_errors: bool = False,
+    ignore_warning_y_errors: bool = False,
+) -> FitResult:
+    """
+    Straight line `m * x + n` with uncertainties in x and y (York et al. 2004).
+
+    The exact weighted orthogonal-distance solution for a line: a fixed-point
+    iteration on the slope only, started at the ordinary least squares slope.
+    `model` is only stored in the result and must be the line `(x, m, n)`.
+    Reported like scipy's ODR: the covariance is unscaled (`cov_beta`), the
+    parameter errors are scaled by the reduced chi² of the York weights
+    (`sd_beta`), which is also the quality.
+
+    Needs x uncertainties (`x_err` or Measurements), without them use
+    `least_squares_fit` or the ODR of `orthogonal_distance`.
+    """
+    if not has_uncertainties(x_data, x_err):
+        raise ValueError("york_fit needs x uncertainties (x_err or Measurements as x data)")
+    _warn_user_no_errors(x_data, x_err, ignore_warning_x_errors, "x")
+    _warn_user_no_errors(y_data, y_err, ignore_warning_y_errors, "y")
+
+    y_data, y_err = extract_vals_and_errors(y_data, y_err)
+    x_data, x_err = extract_vals_and_errors(x_data, x_err)
+    x_data, y_data, y_err, x_err = _filter_nan_rows(x_data, y_data, y_err, x_err)
+    if len(x_data) < 2:
+        raise ValueError(f"Not enough data points ({len(x_data)}) for a straight line.")
+
+    weight_x = 1 / x_err**2
+    weight_y = 1 / y_err**2
+
+    slope = np.polyfit(x_data, y_data, 1, w=1 / y_err)[0]
+    for iteration in range(1, _YORK_MAX_ITERATIONS + 1):
+        W = weight_x * weight_y / (weight_x + slope**2 * weight_y)
+        x_bar = np.sum(W * x_data) / np.sum(W)
+        y_bar = np.sum(W * y_data) / np.sum(W)
+        U = x_data - x_bar
+        V = y_data - y_bar
+        beta = W * (U / weight_y + slope * V / weight_x)
+        new_slope = np.sum(W * beta * V) / np.sum(W * beta * U)
+        converged = abs(new_slope - slope) <= _YORK_RTOL * max(abs(new_slope), 1e-300)
+        slope = new_slope
+        if converged:
+            break
+    else:
+        print(f"Warning: york_fit did not converge after {_YORK_MAX_ITERATIONS} iterations")
+
+    W = weight_x * weight_y / (weight_x + slope**2 * weight_y)
+    x_bar = np.sum(W * x_data) / np.sum(W)
+    y_bar = np.sum(W * y_data) / np.sum(W)
+    beta = W * ((x_data - x_bar) / weight_y + slope * (y_data - y_bar) / weight_x)
+    intercept = y_bar - slope * x_bar
+
+    # uncertainties from the adjusted points x_bar + beta
+    adjusted_mean = x_bar + np.sum(W * beta) / np.sum(W)
+    u = x_bar + beta - adjusted_mean
+    var_slope = 1 / np.sum(W * u**2)
+    var_intercept = 1 / np.sum(W) + adjusted_mean**2 * var_slope
+    cov_slope_intercept = -adjusted_mean * var_slope
+    cov = np.array([[var_slope, cov_slope_intercept], [cov_slope_intercept, var_intercept]])
+
+    chi_squared = np.sum(W * (y_data - slope * x_data - intercept) ** 2)
+    dof = len(x_data) - 2
+    chi_squared_red = chi_squared / dof if dof > 0 else np.nan
+
+    return generate_fit_result(
+        model,
+        [slope, intercept],
+        np.sqrt(np.diag(cov) * chi_squared_red),
+        cov,
+        param_names=list(param_names) if param_names else ["m", "n"],
+        quality=chi_squared_red,
+        method="ODR",
+        n_evaluations=iteration,
+    )
+
+# ==================================================
+#    helper
+# ==================================================
+
+def has_uncertainties(data, err) -> bool:
+    """Whether `err` or the Measurements in `data` give (non-zero) uncertainties."""
+    if err is None:
+        try:
+            if not all(hasattr(val, "error") for val in data):
+                return False
+        except TypeError:
+            return False
+        err = [val.error for val in data]
+    err = np.asarray(err, dtype=float)
+    return err.size > 0 and not np.all(err == 0)
+
+def _solve_weighted(A_w: np.ndarray, y_w: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Least squares solution and covariance (A_wᵀ A_w)⁻¹ of the weighted system."""
+    n_params = A_w.shape[1]
+    if len(y_w) < n_params:
+        raise ValueError(f"Not enough data points ({len(y_w)}) for {n_params} parameters.")
+
+    Q, R = np.linalg.qr(A_w)
+    diag = np.abs(np.diag(R))
+    if np.any(diag <= np.finfo(float).eps * len(y_w) * diag.max(initial=0.0)):
+        # degenerate parameters (e.g. two offsets): one of the solutions, no covariance
+        print("Warning: linear_fit: parameters are degenerate, covariance could not be estimated")
+        values = np.linalg.lstsq(A_w, y_w, rcond=None)[0]
+        return values, np.full((n_params, n_params), np.inf)
+
+    # R is only n_params x n_params
+    R_inv = np.linalg.inv(R)
+    return R_inv @ (Q.T @ y_w), R_inv @ R_inv.T
+
+def _filter_nan_rows(*arrays):
+    mask = np.logical_and.reduce([np.isfinite(arr) for arr in arrays])
+    if np.all(mask):
+        return arrays
+    warnings.warn("\nFiltered NaN values.", RuntimeWarning)
+    return tuple(arr[mask] for arr in arrays)
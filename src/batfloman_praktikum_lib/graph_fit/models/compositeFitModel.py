@@ -14,27 +14,38 @@ class CompositeFitModel(FitModel):
     def get_initial_guess(x, y):
         raise NotImplementedError("Subclasses must implement get_initial_guess()")
 
-def make_static_model_full(components):
-    # Build explicit parameter names
+def _composite_param_names(components):
     param_names = []
     for idx, comp in enumerate(components):
         names = comp.get_param_names()
         for name in names:
             param_names.append(f"{name}_{idx+1}")
+    return param_names
 
-    # Build the model function
-    args_str = "x, " + ", ".join(param_names)
-    code_model = f"def model({args_str}):\n"
-    code_model += "    result = 0\n"
-    
+def _component_args(components, param_names):
+    """Comma separated parameter names of every component (in order)."""
+    args = []
     i = 0
-    for comp_idx, comp in enumerate(components):
+    for comp in components:
         n = len(comp.get_param_names())
-        comp_params = param_names[i:i+n]
-        comp_args = ", ".join(comp_params)
-        code_model += f"    result += {comp.__name__}.model(x, {comp_args})\n"
+        args.append(", ".join(param_names[i:i+n]))
         i += n
-    code_model += "    return result\n"
+    return args
+
+def make_static_model_full(components):
+    # Build explicit parameter names
+    param_names = _composite_param_names(components)
+
+    # Build the model function: a single sum expression, the component
+    # functions are bound in the namespace (no attribute lookup per call)
+    args_str = "x, " + ", ".join(param_names)
+    code_model = f"def model({args_str}):\n"
+    code_model += "    return (\n"
+    code_model += " +\n".join(
+        f"        _model_{comp_idx}(x, {comp_args})"
+        for comp_idx, comp_args in enumerate(_component_args(components, param_names))
+    )
+    code_model += "\n    )\n"
 
     # Build get_param_names function
     code_params = "def get_param_names():\n"
@@ -48,7 +59,7 @@ def make_static_model_full(components):
         return guesses
 
     # Execute model and param_names in namespace
-    namespace = {comp.__name__: comp for comp in components}
+    namespace = {f"_model_{idx}": comp.model for idx, comp in enumerate(components)}
     exec(code_model, namespace)
     exec(code_params, namespace)
 
@@ -57,3 +68,60 @@ def make_static_model_full(components):
         staticmethod(namespace["get_param_names"]),
         staticmethod(get_initial_guess)
     )
+
+def make_static_jacobian(components):
+    """
+    Jacobian of the composite model: the columns of every component, written
+    into one preallocated array.
+
+    Components with an analytic `jacobian` use it, the others are
+    differentiated numerically on their own (2 evaluations of the component
+    per parameter instead of 2 evaluations of the whole sum).
+    """
+    import numpy as np
+    from ..jacobian import numerical_jacobian
+
+    param_names = _composite_param_names(components)
+
+    args_str = "x, " + ", ".join(param_names)
+    code = f"def jacobian({args_str}):\n"
+    code += "    x = _asarray(x, dtype=float)\n"
+    code += f"    out = _empty(x.shape + ({len(param_names)},))\n"
+    i = 0
+    for comp_idx, (comp, comp_args) in enumerate(zip(components, _component_args(components, param_names))):
+        n = len(comp.get_param_names())
+        if comp.jacobian is not None:
+            code += f"    out[..., {i}:{i+n}] = _jacobian_{comp_idx}(x, {comp_args})\n"
+        else:
+            code += f"    out[..., {i}:{i+n}] = _numerical_jacobian(_model_{comp_idx}, x, [{comp_args}])\n"
+        i += n
+    code += "    return out\n"
+
+    namespace = {
+        "_asarray": np.asarray,
+        "_empty": np.empty,
+        "_numerical_jacobian": numerical_jacobian,
+    }
+    for idx, comp in enumerate(components):
+        namespace[f"_model_{idx}"] = comp.model
+        namespace[f"_jacobian_{idx}"] = comp.jacobian
+    exec(code, namespace)
+
+    return staticmethod(namespace["jacobian"])
+
+def make_static_basis(components):
+    """Basis matrix of the composite if all components are linear in their parameters, else None."""
+    import numpy as np
+
+    if any(comp.basis is None for comp in components):
+        return None
+    n_params = [len(comp.get_param_names()) for comp in components]
+
+    def basis(x):
+        x = np.asarray(x, dtype=float)
+        return np.concatenate([
+            np.broadcast_to(comp.basis(x), x.shape + (n,))
+            for comp, n in zip(components, n_params)
+        ], axis=-1)
+
+    return staticmethod(basis)
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Type
+from typing import List, Optional, Tuple, Type
 from .fitModel import FitModel
 
 class CompositeFitModel(FitModel):
@@ -21,3 +21,10 @@ def make_static_model_full(
     staticmethod   # get_initial_guess(x, y)
 ]: ...
 
+def make_static_basis(
+    components: List[Type[FitModel]]
+) -> Optional[staticmethod]: ...  # basis(x) -> (len(x), n_params) for linear components
+
+def make_static_jacobian(
+    components: List[Type[FitModel]]
+) -> staticmethod: ...  # jacobian(x, *params) -> (len(x), n_params)
@@ -8,6 +8,12 @@ from abc import ABC, abstractmethod
 import numpy as np
 
 class FitModel(ABC, metaclass=ModelMeta): # type: ignore[misc]
+    # optional analytic Jacobian: staticmethod jacobian(x, *params) -> array of shape (len(x), n_params)
+    jacobian = None
+    # only for linear-in-parameters models: staticmethod basis(x) -> array of shape (len(x), n_params),
+    # so that model(x, *params) == basis(x) @ params
+    basis = None
+
     @staticmethod
     @abstractmethod
     def model(x, *args, **kwargs) -> float:
@@ -63,12 +69,23 @@ class FitModel(ABC, metaclass=ModelMeta): # type: ignore[misc]
             y = np.array([y.value for y in y])
 
         param_names = cls.get_param_names()
+        if cls.basis is not None:
+            # linear in the parameters -> solved directly, no initial guess needed
+            from ..linear_regression import linear_fit
+            return linear_fit(cls, x, y, yerr,
+                fixed_params=fixed_params,
+                param_names=param_names,
+                ignore_warning_x_errors=ignore_warning_x_errors,
+                ignore_warning_y_errors=ignore_warning_y_errors,
+            )
+
         initial_guess = initial_guess if (initial_guess is not None) else cls.get_initial_guess(x, y)
 
         res = generic_fit(cls.model, x, y, yerr,
             initial_guess=initial_guess, 
             fixed_params=fixed_params,
             param_names=param_names,
+            jacobian=cls.jacobian,
             ignore_warning_x_errors=ignore_warning_x_errors,
             ignore_warning_y_errors=ignore_warning_y_errors,
         )
@@ -85,7 +102,7 @@ class FitModel(ABC, metaclass=ModelMeta): # type: ignore[misc]
 
         param_names = cls.get_param_names()
         initial_guess = initial_guess if (initial_guess is not None) else cls.get_initial_guess(x, y)
-        return odr_fit(cls.model, x, y, x_err=xerr, y_err=yerr, initial_guess=initial_guess, fixed_params=fixed_params, param_names=param_names)
+        return odr_fit(cls.model, x, y, x_err=xerr, y_err=yerr, initial_guess=initial_guess, fixed_params=fixed_params, param_names=param_names, jacobian=cls.jacobian)
     
     @classmethod
     def on_data(cls, data: DataCluster, x_index: str, y_index: str,
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Callable, List, Optional
 import numpy as np
 
 from batfloman_praktikum_lib.graph_fit.init_params.order_init_params import InitalParamGuess
@@ -7,6 +7,9 @@ from ..fitResult import FIT_METHODS, FitResult
 from .modelMeta import ModelMeta
 
 class FitModel(metaclass=ModelMeta):
+    jacobian: Optional[Callable[..., np.ndarray]]
+    basis: Optional[Callable[[np.ndarray], np.ndarray]]
+
     @staticmethod
     def model(x: np.ndarray, *args, **kwargs) -> float: ...
     
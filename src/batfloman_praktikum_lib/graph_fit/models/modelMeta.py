@@ -2,8 +2,17 @@ from typing import cast, List, Type
 from abc import ABCMeta, ABC
 
 class ModelMeta(ABCMeta):
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        # `basis` and `jacobian` belong to the `model` they are declared with: a
+        # subclass that redefines `model` does not inherit them (and is no longer linear)
+        if "model" in namespace:
+            for attr in ("basis", "jacobian"):
+                if attr not in namespace:
+                    setattr(cls, attr, None)
+
     def __add__(cls, other):
-        from .compositeFitModel import CompositeFitModel, make_static_model_full
+        from .compositeFitModel import CompositeFitModel, make_static_basis, make_static_jacobian, make_static_model_full
 
         # Collect components from both sides
         cls_components = getattr(cls, "_components", [cls])
@@ -15,6 +24,8 @@ class ModelMeta(ABCMeta):
         class MergedComposite(CompositeFitModel):
             _components = new_components
             model = model_func
+            jacobian = make_static_jacobian(new_components)
+            basis = make_static_basis(new_components)
             get_param_names = get_param_names_func
             get_initial_guess = get_initial_guess_func
 
@@ -26,7 +37,7 @@ class ModelMeta(ABCMeta):
 
     def __rmul__(cls, other):
         if isinstance(other, int):
-            from .compositeFitModel import CompositeFitModel, make_static_model_full
+            from .compositeFitModel import CompositeFitModel, make_static_basis, make_static_jacobian, make_static_model_full
             from .fitModel import FitModel
 
             components = [cls] * other
@@ -36,6 +47,8 @@ class ModelMeta(ABCMeta):
             class RepeatedComposite(CompositeFitModel):
                 _components = components
                 model = model_func
+                jacobian = make_static_jacobian(components)
+                basis = make_static_basis(components)
                 get_param_names = get_param_names_func
                 get_initial_guess = get_initial_guess_func
 
@@ -6,6 +6,14 @@ class ConstFunc(FitModel):
     @staticmethod
     def model(x, b):
         return b;
+
+    @staticmethod
+    def jacobian(x, b):
+        return np.ones(np.shape(x) + (1,))
+
+    @staticmethod
+    def basis(x):
+        return np.ones(np.shape(x) + (1,))
     
     @staticmethod
     def get_param_names():
@@ -21,6 +29,16 @@ class Linear(FitModel):
     def model(x, m, n):
         return m * x + n
 
+    @staticmethod
+    def jacobian(x, m, n):
+        x = np.asarray(x, dtype=float)
+        return np.stack([x, np.ones_like(x)], axis=-1)
+
+    @staticmethod
+    def basis(x):
+        x = np.asarray(x, dtype=float)
+        return np.stack([x, np.ones_like(x)], axis=-1)
+
     @staticmethod
     def get_param_names():
         return ["m", "n"]
@@ -35,12 +53,31 @@ class Linear(FitModel):
         n = y[start_idx] - m * x[start_idx]
         return [m, n]
 
+    @classmethod
+    def odr_fit(cls, x, y, xerr = None, yerr = None,
+        *,
+        initial_guess = None,
+        fixed_params = None,
+    ):
+        # errors in x and y: York regression, the closed-form ODR for a line
+        # (without x uncertainties: scipy's ODR as for every other model)
+        # (only for the straight line itself, not for subclasses with their own model)
+        from ..linear_regression import has_uncertainties, york_fit
+        if cls.model is not Linear.model or fixed_params or not has_uncertainties(x, xerr):
+            return super().odr_fit(x, y, xerr=xerr, yerr=yerr, initial_guess=initial_guess, fixed_params=fixed_params)
+        return york_fit(cls.model, x, y, x_err=xerr, y_err=yerr, param_names=cls.get_param_names())
+
 
 class LinearShifted(FitModel):
     @staticmethod
     def model(x, m, x0, n):
         return m * (x - x0) + n
 
+    @staticmethod
+    def jacobian(x, m, x0, n):
+        x = np.asarray(x, dtype=float)
+        return np.stack([x - x0, np.full_like(x, -m), np.ones_like(x)], axis=-1)
+
     @staticmethod
     def get_param_names():
         return ["m", "x0", "n"]
@@ -62,6 +99,16 @@ class Quadratic(FitModel):
     def model(x, a, b, c):
         return a * x**2 + b * x + c
 
+    @staticmethod
+    def jacobian(x, a, b, c):
+        x = np.asarray(x, dtype=float)
+        return np.stack([x**2, x, np.ones_like(x)], axis=-1)
+
+    @staticmethod
+    def basis(x):
+        x = np.asarray(x, dtype=float)
+        return np.stack([x**2, x, np.ones_like(x)], axis=-1)
+
     @staticmethod
     def get_param_names():
         return ["a", "b", "c"]
@@ -78,6 +125,12 @@ class Exponential(FitModel):
     @staticmethod
     def model(x, a, b, x0):
         return np.exp(a * (x-x0)) + b;
+
+    @staticmethod
+    def jacobian(x, a, b, x0):
+        x = np.asarray(x, dtype=float)
+        e = np.exp(a * (x - x0))
+        return np.stack([(x - x0) * e, np.ones_like(x), -a * e], axis=-1)
     
     @staticmethod
     def get_param_names():
@@ -100,6 +153,12 @@ class LimitedGrowth(FitModel):
     def model(x, a, b, max_value):
         return max_value - a * np.exp(b * x);
 
+    @staticmethod
+    def jacobian(x, a, b, max_value):
+        x = np.asarray(x, dtype=float)
+        e = np.exp(b * x)
+        return np.stack([-e, -a * x * e, np.ones_like(x)], axis=-1)
+
     @staticmethod
     def get_param_names():
         return ["a", "b", "max"]
@@ -171,6 +230,12 @@ class Gaussian(FitModel):
     def model(x, A, sigma, x0):
         return A * np.exp(- (x-x0)**2 / (2*sigma**2) )
 
+    @staticmethod
+    def jacobian(x, A, sigma, x0):
+        x = np.asarray(x, dtype=float)
+        g = np.exp(- (x-x0)**2 / (2*sigma**2) )
+        return np.stack([g, A * g * (x-x0)**2 / sigma**3, A * g * (x-x0) / sigma**2], axis=-1)
+
     @staticmethod
     def get_param_names():
         return ["A", "sigma", "x0"]
@@ -7,9 +7,11 @@ from scipy.odr import ODR, Model, RealData
 from batfloman_praktikum_lib.io.termColors import bcolors
 
 from ..graph.helpers import filter_nan_values
-from .helper import evaluate_model, extract_vals_and_errors
+from .helper import CallCounter, evaluate_model, extract_vals_and_errors
 from .fitResult import generate_fit_result, FitResult
+from .jacobian import JacobianSpec, evaluate_jacobian, numerical_jacobian, odr_jacobians, resolve_jacobian
 from .fixed_params import (
+    FixedParamBinding,
     build_fixed_param_binding,
     order_free_initial_guess,
     rebuild_full_fit_result,
@@ -38,21 +40,6 @@ def _warn_user_no_errors(y_data, y_err, ignore_y_errors: bool, coord: Literal["x
         print(f"\tin {frame.filename}:{frame.lineno}:0")
         print(f"{bcolors.WARNING} - Call with `ignore_warning_{coord}_error = True` to surpress this warning!{bcolors.ENDC}")
 
-def numerical_jacobian(model, x, params, eps=1e-8):
-    params = np.array(params)
-    J = np.zeros((len(x), len(params)))
-
-    for j in range(len(params)):
-        dp = np.zeros_like(params)
-        dp[j] = eps
-
-        f1 = np.array([model(xi, *(params + dp)) for xi in x])
-        f2 = np.array([model(xi, *(params - dp)) for xi in x])
-
-        J[:, j] = (f1 - f2) / (2 * eps)
-
-    return J
-
 def generic_fit(
     model: Union[Callable, Type[FitModel]],
     x_data, 
@@ -63,12 +50,16 @@ def generic_fit(
     initial_guess= None, 
     fixed_params: Mapping[str, Any] | None = None,
     param_names =  None,
+    jacobian: JacobianSpec = None,
+    binding: FixedParamBinding | None = None,
     ignore_warning_x_errors: bool = False,
     ignore_warning_y_errors: bool = False,
 ) -> FitResult:
     if isclass(model) and issubclass(model, FitModel):
         if not param_names:
             param_names = model.get_param_names()
+        if jacobian is None:
+            jacobian = model.jacobian
         model = model.model
 
     x_data, y_data = filter_nan_values(x_data, y_data, warn_filter_nan=True)
@@ -79,9 +70,13 @@ def generic_fit(
     y_data, y_err = extract_vals_and_errors(y_data, y_err)
     x_data, x_err = extract_vals_and_errors(x_data, x_err)
 
-    binding = build_fixed_param_binding(model, fixed_params=fixed_params)
+    if binding is None:
+        binding = build_fixed_param_binding(model, fixed_params=fixed_params)
     fit_model = binding.wrap_model() if binding.fixed_params else model
     fit_param_names = binding.free_param_names if binding.fixed_params else (param_names or binding.full_param_names)
+    jacobian = resolve_jacobian(model, jacobian)
+    if jacobian is not None and binding.fixed_params:
+        jacobian = binding.wrap_jacobian(jacobian)
     initial_guess = order_free_initial_guess(
         model,
         initial_guess,
@@ -100,17 +95,30 @@ def generic_fit(
 
     # Prepare data for ODR
     data = RealData(x_data, y_data, sx=x_err, sy=y_err)
-    wrapped_model = Model(lambda B, x: _odr_wrapper(B, x, fit_model))
-    odr = ODR(data, wrapped_model, beta0=initial_guess)
+    counted_model = CallCounter(lambda B, x: _odr_wrapper(B, x, fit_model))
+    if jacobian is not None:
+        wrapped_model = Model(counted_model, **odr_jacobians(fit_model, jacobian))
+        odr = ODR(data, wrapped_model, beta0=initial_guess)
+        odr.set_job(deriv=2) # user supplied derivatives, checked against finite differences
+    else:
+        wrapped_model = Model(counted_model)
+        odr = ODR(data, wrapped_model, beta0=initial_guess)
 
     # Run the fit
     out = odr.run()
 
+    if jacobian is not None and "Error in derivatives" in out.stopreason:
+        # ODRPACK rejected the jacobian (e.g. it belongs to another model) -> finite differences
+        print(f"{bcolors.WARNING}Warning: the jacobian does not match the model, using finite differences instead{bcolors.ENDC}")
+        jacobian = None
+        odr = ODR(data, Model(counted_model), beta0=initial_guess)
+        out = odr.run()
+
     if out.res_var < 1e-12 or not np.all(np.isfinite(out.sd_beta)) or np.all(out.sd_beta < 1e-14):
     # Degenerate case
         if y_err is not None:
             print("Warning: Using error estimate fallback for fit")
-            J = numerical_jacobian(fit_model, x_data, out.beta)
+            J = evaluate_jacobian(fit_model, jacobian, x_data, out.beta)
 
             W = 1 / y_err**2
             JT_W = J.T * W  # broadcasting
@@ -127,9 +135,10 @@ def generic_fit(
             cov=out.cov_beta,
             quality=out.res_var,
             method="ODR",
+            n_evaluations=counted_model.calls,
         )
 
-    return generate_fit_result(fit_model, out.beta, out.sd_beta, cov=out.cov_beta, param_names=fit_param_names, quality=out.res_var, method="ODR");
+    return generate_fit_result(fit_model, out.beta, out.sd_beta, cov=out.cov_beta, param_names=fit_param_names, quality=out.res_var, method="ODR", n_evaluations=counted_model.calls);
 
 def _odr_wrapper(B, x, model):
     """Wrapper to adapt curve_fit-style functions for ODR."""
@@ -0,0 +1,147 @@
+from collections.abc import Callable, Iterable, Iterator
+from inspect import isclass
+from typing import Optional, Type
+
+import numpy as np
+from scipy.linalg import solve_triangular
+
+from .fitResult import FitResult, generate_fit_result
+from .fixed_params import get_param_names
+from .models.fitModel import FitModel
+
+_CHUNK_SIZE = 1 << 20
+
+def streaming_linear_fit(
+    model: Callable | Type[FitModel],
+    chunks: Iterable,
+    *,
+    basis: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    param_names: list[str] | None = None,
+) -> FitResult:
+    """
+    Weighted least squares for models that are linear in their parameters,
+    reading the data chunk by chunk (constant memory).
+
+    `model` is a FitModel with a `basis` (Linear, Quadratic, ConstFunc and
+    sums of them) or any model function together with `basis(x)`, the
+    matrix of shape `(len(x), n_params)` with `model(x, *p) == basis(x) @ p`.
+
+    `chunks` yields `(x, y)` or `(x, y, y_err)` arrays, e.g. `array_chunks`
+    over (memory-mapped) arrays or `io.csv.iter_csv_oszi`. NaN rows are
+    skipped. Only a small triangular factor of the weighted design matrix is
+    kept between chunks (incremental QR, same solution as the normal
+    equations JᵀWJ p = JᵀWy without squaring their condition number).
+
+    Returns the same FitResult as `least_squares_fit` (absolute sigma):
+    params, covariance and reduced chi².
+    """
+    model_class = model if isclass(model) and issubclass(model, FitModel) else None
+    if model_class is not None:
+        basis = basis or model_class.basis
+        param_names = param_names or list(model_class.get_param_names())
+        model = model_class.model
+    if basis is None:
+        raise ValueError(f"{getattr(model, '__name__', model)} is not linear in its parameters (no basis), use least_squares_fit")
+    param_names = param_names or get_param_names(model)
+
+    accumulator = _QRAccumulator(len(param_names))
+    missing_errors = False
+    for chunk in chunks:
+        x, y, y_err = _unpack_chunk(chunk)
+        missing_errors |= y_err is None
+        accumulator.add(basis, x, y, y_err)
+
+    if missing_errors:
+        print("Warning: streaming_linear_fit: no y-value uncertainties for some chunks, using equal weights !")
+
+    values, cov, chi2, n_points = accumulator.solve()
+    dof = n_points - len(param_names)
+    chi2_red = chi2 / dof if dof > 0 else np.nan
+
+    return generate_fit_result(
+        model,
+        values,
+        np.sqrt(np.diag(cov)),
+        cov,
+        param_names=list(param_names),
+        quality=chi2_red,
+        method="least squares",
+    )
+
+def array_chunks(x, y, y_err=None, *, chunk_size: int = _CHUNK_SIZE) -> Iterator[tuple]:
+    """
+    `(x, y[, y_err])` slices of at most `chunk_size` points.
+
+    Slices of memory-mapped arrays are only read when the fit uses them.
+    `y_err` may be a scalar (same error for all points).
+    """
+    n = len(y)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        if y_err is None:
+            yield x[start:stop], y[start:stop]
+        elif np.ndim(y_err) == 0:
+            yield x[start:stop], y[start:stop], np.full(stop - start, float(y_err))
+        else:
+            yield x[start:stop], y[start:stop], y_err[start:stop]
+
+# ==================================================
+#    accumulation
+# ==================================================
+
+class _QRAccumulator:
+    """
+    Upper triangular R of the weighted, augmented design matrix [A | y] / σ.
+
+    R[:p, :p] p = R[:p, p] is the least squares solution, (R[:p, :p]ᵀ R[:p, :p])⁻¹
+    its covariance and R[p, p]² the chi² of all rows added so far.
+    """
+
+    def __init__(self, n_params: int):
+        self.n_params = n_params
+        self.R = np.zeros((0, n_params + 1))
+        self.n_points = 0
+
+    def add(self, basis, x, y, y_err) -> None:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        valid = np.isfinite(x) & np.isfinite(y)
+        if y_err is not None:
+            y_err = np.broadcast_to(np.asarray(y_err, dtype=float), y.shape)
+            valid &= np.isfinite(y_err)
+            if np.any(y_err[valid] <= 0):
+                raise ValueError("Error values must be positive and non-zero for meaningful fitting.")
+        if not np.all(valid):
+            x, y = x[valid], y[valid]
+            y_err = None if y_err is None else y_err[valid]
+        if y.size == 0:
+            return
+
+        A = np.broadcast_to(np.asarray(basis(x), dtype=float), y.shape + (self.n_params,))
+        rows = np.empty((y.size, self.n_params + 1))
+        rows[:, :-1] = A
+        rows[:, -1] = y
+        if y_err is not None:
+            rows /= y_err[:, None]
+
+        self.R = np.linalg.qr(np.vstack([self.R, rows]), mode="r")
+        self.n_points += y.size
+
+    def solve(self) -> tuple[np.ndarray, np.ndarray, float, int]:
+        p = self.n_params
+        if self.n_points < p:
+            raise ValueError(f"Not enough data points ({self.n_points}) for {p} parameters.")
+        R = self.R[:p, :p]
+        values = solve_triangular(R, self.R[:p, p])
+        R_inv = solve_triangular(R, np.eye(p))
+        cov = R_inv @ R_inv.T
+        chi2 = float(self.R[p, p] ** 2) if self.R.shape[0] > p else 0.0
+        return values, cov, chi2, self.n_points
+
+def _unpack_chunk(chunk):
+    if len(chunk) == 2:
+        x, y = chunk
+        return x, y, None
+    if len(chunk) == 3:
+        return chunk
+    raise TypeError(f"chunks must be (x, y) or (x, y, y_err), got {len(chunk)} arrays")
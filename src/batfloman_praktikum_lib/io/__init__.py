@@ -2,13 +2,14 @@ from .latex import to_latex, save_latex
 from .table_metadata import TableColumnMetadata, TableMetadataManager, TableColumnMetadataClass, TableColumnMetadataDict
 from .termColors import bcolors
 
-from .cassy import load_cassy
+from .cassy import load_cassy, load_cassy_datacluster
 from .csv import (
     load_csv,
     load_csv_consts,
     load_csv_datacluster,
     load_csv_oszi,
     load_csv_oszi_with_x,
+    iter_csv_oszi,
 )
 
 
@@ -22,9 +23,11 @@ __all__ = [
     "to_latex",
     "save_latex",
     "load_cassy",
+    "load_cassy_datacluster",
     "load_csv",
     "load_csv_consts",
     "load_csv_datacluster",
     "load_csv_oszi",
     "load_csv_oszi_with_x",
+    "iter_csv_oszi",
 ]
@@ -1,5 +1,6 @@
-from .load import load_cassy
+from .load import load_cassy, load_cassy_datacluster
 
 __all__ = [
     "load_cassy",
+    "load_cassy_datacluster",
 ]
@@ -1,28 +1,142 @@
+import hashlib
+import io
+import os
+import warnings
+import zipfile
+from pathlib import Path
 import numpy as np
 import pandas as pd
 
 from ...path_managment import PathInput, validate_filename
 
-def load_cassy(filename: PathInput) -> pd.DataFrame:
+def load_cassy(filename: PathInput, cache: bool = False) -> pd.DataFrame:
+    """
+    Load a CASSY Lab text export (tab separated, decimal comma).
+
+    The column names are taken from the `DEF=` line, the data block below it
+    is decoded in one vectorized pass. With `cache=True` the parsed block is
+    stored as `<file>.txt.npz` next to the export and reused until the
+    content hash of the export changes.
+    """
+    header, data = _load_cassy_block(filename, cache)
+    return pd.DataFrame(data, columns=header)
+
+def load_cassy_datacluster(filename: PathInput, cache: bool = False):
+    """
+    Like `load_cassy`, but returns a `ColumnarDataCluster` backed by the parsed columns.
+
+    Repeated column names (e.g. two channels both called "U / V") are kept
+    apart as "U / V 2", "U / V 3", ...
+    """
+    from ...structs.columnarDataCluster import ColumnarDataCluster
+
+    header, data = _load_cassy_block(filename, cache)
+    names = _unique_names(header) if header is not None else range(data.shape[1])
+    columns = np.ascontiguousarray(data.T)
+    return ColumnarDataCluster.from_columns(dict(zip(names, columns)), copy=False)
+
+# ==================================================
+#    parsing
+# ==================================================
+
+def _load_cassy_block(filename: PathInput, cache: bool) -> tuple[list[str] | None, np.ndarray]:
     filename = validate_filename(filename, ".txt")
 
-    with open(filename, 'r') as file:
-        lines = file.readlines()
+    raw = filename.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest() if cache else None
+    if cache:
+        cached = _load_cache(filename, digest)
+        if cached is not None:
+            return cached
+
+    # same decoding (and newline handling) as `open(filename, "r")`
+    text = io.TextIOWrapper(io.BytesIO(raw)).read()
+    header, data = _parse(text)
+
+    if cache:
+        _save_cache(filename, digest, header, data)
+    return header, data
 
+def _parse(text: str) -> tuple[list[str] | None, np.ndarray]:
     # Locate header and data start
-    data_start_index = 0
     header = None
-    for i, line in enumerate(lines):
-        if "DEF=" in line:
-            header = line.strip().replace('"', '').replace("DEF=", "").split("\t")
-            data_start_index = i + 1  # Data starts after the header line
-            break  # Stop searching after finding the header
-
-    # Process data
-    data = []
-    for line in lines[data_start_index:]:
-        values = line.replace(",", ".").strip().split("\t")
-        data.append([float(v) if v != "NAN" else np.nan for v in values])  # Convert to float, handle "NAN"
-
-    # Convert to DataFrame
-    return pd.DataFrame(data, columns=header if header else None)
+    block = text
+    pos = text.find("DEF=")
+    if pos != -1:
+        line_start = text.rfind("\n", 0, pos) + 1
+        line_end = text.find("\n", pos)
+        line_end = len(text) if line_end == -1 else line_end
+        header = text[line_start:line_end].strip().replace('"', '').replace("DEF=", "").split("\t")
+        block = text[line_end + 1:]
+
+    # decimal comma -> decimal point for the whole block at once
+    block = block.replace(",", ".")
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning) # header without data
+            data = np.loadtxt(io.StringIO(block), delimiter="\t", comments=None, dtype=float, ndmin=2)
+    except ValueError:
+        data = _parse_rows(block)
+
+    if data.size == 0:
+        data = data.reshape(0, len(header) if header else 0)
+    return header, data
+
+def _unique_names(header: list[str]) -> list[str]:
+    names: list[str] = []
+    for name in header:
+        candidate = name
+        suffix = 2
+        while candidate in names:
+            candidate = f"{name} {suffix}"
+            suffix += 1
+        if candidate != name:
+            print(f"Warning: column '{name}' appears more than once, renamed to '{candidate}'")
+        names.append(candidate)
+    return names
+
+def _parse_rows(block: str) -> np.ndarray:
+    """Row by row fallback (ragged rows are padded with NaN)."""
+    rows = []
+    for line in block.splitlines():
+        if not line.strip():
+            continue
+        values = line.strip().split("\t")
+        rows.append([float(v) if v != "NAN" else np.nan for v in values])  # Convert to float, handle "NAN"
+    return pd.DataFrame(rows).to_numpy(dtype=float)
+
+# ==================================================
+#    parsed-file cache
+# ==================================================
+
+def _cache_path(filename: Path) -> Path:
+    return filename.with_name(filename.name + ".npz")
+
+def _load_cache(filename: Path, digest: str) -> tuple[list[str] | None, np.ndarray] | None:
+    path = _cache_path(filename)
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as cached:
+            if str(cached["hash"]) != digest:
+                return None
+            header = [str(name) for name in cached["header"]] if bool(cached["has_header"]) else None
+            return header, cached["data"]
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+def _save_cache(filename: Path, digest: str, header: list[str] | None, data: np.ndarray) -> None:
+    path = _cache_path(filename)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                hash=np.array(digest),
+                has_header=np.array(header is not None),
+                header=np.array(header if header is not None else [], dtype=str),
+                data=data,
+            )
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: could not write cache for '{filename}': {e}")
@@ -1,10 +1,11 @@
-from .load_oszi import load_csv_oszi_with_x, load_csv_oszi
+from .load_oszi import load_csv_oszi_with_x, load_csv_oszi, iter_csv_oszi
 from .load_csv import load_csv
 from .load_as_struct import load_csv_consts, load_csv_datacluster
 
 __all__ = [
     "load_csv_oszi_with_x",
     "load_csv_oszi",
+    "iter_csv_oszi",
     "load_csv",
     "load_csv_consts",
     "load_csv_datacluster"
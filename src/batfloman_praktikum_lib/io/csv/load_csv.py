@@ -1,5 +1,7 @@
+import io
 import re
 import csv
+import numpy as np
 import pandas as pd
 
 from batfloman_praktikum_lib.path_managment import PathInput, validate_filename
@@ -11,56 +13,186 @@ _COMMENT_PATTERN = re.compile(r"//.*$")
 def load_csv(filename: PathInput, section: str | None = None) -> pd.DataFrame:
     filename = validate_filename(filename, ".csv")
 
-    data = []
+    with open(filename, newline="") as file:
+        text = file.read()
+
+    if '"' in text:
+        # quoted cells may hide delimiters or line breaks -> leave them to csv.reader
+        return _load_csv_rows(text, filename, section)
+
+    headers, lines, width = _scan_lines(text, filename, section)
+    return _parse_block(lines, headers, width)
+
+# ==================================================
+#    fast path
+# ==================================================
+
+def _scan_lines(text: str, filename, section: str | None) -> tuple[list[str] | None, list[str], int | None]:
+    """
+    Single pass over the file: resolves sections, headers and comments and
+    collects the (stripped) data lines without splitting them into cells.
+
+    Also returns the common number of cells per data line (None if the
+    lines differ).
+    """
+    lines = []
     headers = None
+    expected = None
+    common_width = -1
     in_section = section is None  # True if no section specified
     section_found = section is None  # track if section ever appears
 
-    with open(filename, newline="") as file:
-        reader = csv.reader(file)
-        for i, row in enumerate(reader):
-            if not row:
-                continue  # skip empty lines
-
-            line = ",".join(row).strip()
-            line = _remove_comments(line);
-            if not line:
-                continue; # skip comment only lines
+    for i, line in enumerate(text.splitlines()):
+        line = line.strip()
+        if "//" in line:
+            line = _remove_comments(line)
+        if not line:
+            continue # skip empty and comment only lines
 
-            # Section handling
+        first = line[0]
+        if first == "[" and section is not None:
             matchSection = _SECTION_PATTERN.match(line)
-            if matchSection and section is not None:
+            if matchSection:
                 in_section = (matchSection.group("name") == section)
                 if in_section:
                     section_found = True
-                continue;
-            if not in_section:
-                continue;
+                continue
+        if not in_section:
+            continue
 
-            # Header row
+        if first == "#":
             matchHeader = _HEADER_PATTERN.match(line)
             if matchHeader:
                 headers = [x.strip() for x in matchHeader.group("header").split(",")]
+                expected = len(headers)
                 continue
 
-            # Data row → apply type conversion
+        width = line.count(",") + 1
+        if expected is None:
+            expected = width
+        if width != common_width:
+            common_width = width if common_width == -1 else None
+        if width < expected:
             row_clean = [x.strip() for x in line.split(",")]
+            print(f"Warning: row in line {i+1} has only {width} columns, expected {expected}: {row_clean}")
 
-            if headers:
-                expected = len(headers)
-            else:
-                expected = len(data[0]) if data else len(row_clean)
+        lines.append(line)
+
+    if section is not None and not section_found:
+        raise ValueError(f"Section '{section}' not found in {filename}")
+
+    return headers, lines, common_width
+
+def _parse_block(lines: list[str], headers: list[str] | None, width: int | None) -> pd.DataFrame:
+    """
+    Parse the collected data lines in one go.
 
-            if len(row_clean) < expected:
-                print(f"Warning: row in line {i+1} has only {len(row_clean)} columns, expected {expected}: {row_clean}")
+    Purely numeric blocks go through `np.loadtxt`; otherwise the pandas C
+    parser types the columns and only columns it can not read as numbers
+    (e.g. `1.23(4)`, `5%`, `nan`, empty cells) are converted cell by cell
+    with `_maybe_number`.
+    """
+    if not lines:
+        return pd.DataFrame([], columns=headers if headers else None)
 
-            data.append([_maybe_number(x) for x in row_clean])
+    if width is None or (headers and len(headers) != width):
+        # keep the row based behaviour (padding / errors) for irregular blocks
+        data = [[_maybe_number(x.strip()) for x in line.split(",")] for line in lines]
+        return pd.DataFrame(data, columns=headers if headers else None)
+
+    block = "\n".join(lines)
+    try:
+        values = np.loadtxt(io.StringIO(block), delimiter=",", comments=None, dtype=float, ndmin=2)
+        df = pd.DataFrame(values)
+    except ValueError:
+        df = _read_mixed_block(block)
+
+    df.columns = headers if headers else pd.RangeIndex(width)
+    return df
+
+def _read_mixed_block(block: str) -> pd.DataFrame:
+    df = _read_block(block)
+
+    fallback = [col for col in df.columns if df[col].dtype.kind not in "iuf"]
+    if fallback:
+        raw = _read_block(block, usecols=fallback, dtype=str)
+        for col in fallback:
+            df[col] = [_maybe_number(x.strip()) for x in raw[col]]
+
+    numeric = [col for col in df.columns if col not in fallback]
+    if numeric:
+        df[numeric] = df[numeric].astype(float)
+    return df
+
+def _read_block(block: str, **kwargs) -> pd.DataFrame:
+    # round_trip: same (correctly rounded) floats as `float()`
+    return pd.read_csv(
+        io.StringIO(block),
+        header=None,
+        na_filter=False,
+        skipinitialspace=True,
+        float_precision="round_trip",
+        **kwargs,
+    )
+
+# ==================================================
+#    row based path
+# ==================================================
+
+def _load_csv_rows(text: str, filename, section: str | None) -> pd.DataFrame:
+    data = []
+    headers = None
+    in_section = section is None  # True if no section specified
+    section_found = section is None  # track if section ever appears
+
+    reader = csv.reader(io.StringIO(text, newline=""))
+    for i, row in enumerate(reader):
+        if not row:
+            continue  # skip empty lines
+
+        line = ",".join(row).strip()
+        line = _remove_comments(line);
+        if not line:
+            continue; # skip comment only lines
+
+        # Section handling
+        matchSection = _SECTION_PATTERN.match(line)
+        if matchSection and section is not None:
+            in_section = (matchSection.group("name") == section)
+            if in_section:
+                section_found = True
+            continue;
+        if not in_section:
+            continue;
+
+        # Header row
+        matchHeader = _HEADER_PATTERN.match(line)
+        if matchHeader:
+            headers = [x.strip() for x in matchHeader.group("header").split(",")]
+            continue
+
+        # Data row → apply type conversion
+        row_clean = [x.strip() for x in line.split(",")]
+
+        if headers:
+            expected = len(headers)
+        else:
+            expected = len(data[0]) if data else len(row_clean)
+
+        if len(row_clean) < expected:
+            print(f"Warning: row in line {i+1} has only {len(row_clean)} columns, expected {expected}: {row_clean}")
+
+        data.append([_maybe_number(x) for x in row_clean])
 
     if section is not None and not section_found:
         raise ValueError(f"Section '{section}' not found in {filename}")
 
     return pd.DataFrame(data, columns=headers if headers else None)
 
+# ==================================================
+#    helper
+# ==================================================
+
 def _maybe_number(x: str):
     """Try to convert to float, otherwise return original string."""
     try:
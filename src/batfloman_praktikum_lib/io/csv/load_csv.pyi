@@ -20,6 +20,10 @@ def load_csv(filename: PathInput, section: str | None = None) -> pd.DataFrame:
     - Rows that contain fewer columns than expected emit a warning but are still
       included in the DataFrame.
     - Values are parsed as floats whenever possible; otherwise, they remain strings.
+    - The file is scanned once and each block of data rows is parsed in one
+      vectorized call. Only columns with non-numeric cells (e.g. `1.23(4)` or
+      `5%`) are converted cell by cell. Files with quoted cells are read row by
+      row with `csv.reader`.
 
     Parameters
     ----------
@@ -1,50 +1,54 @@
-import numpy as np
 import csv
+import json
+import os
+import warnings
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+import numpy as np
 
 from batfloman_praktikum_lib.path_managment import PathInput, validate_filename
 
-def load_csv_oszi(filename: PathInput) -> tuple[list[float], dict[str, str]]:
+_CHUNK_LINES = 1 << 16
+_LENGTH_KEYS = ("Record Length", "Memory Length")
+
+def load_csv_oszi(
+    filename: PathInput,
+    cache: bool = False,
+    chunk_lines: int = _CHUNK_LINES,
+) -> tuple[np.ndarray, dict[str, str]]:
     """
     Liest eine CSV-Datei vom Oszilloskop ein.
-    
+
+    Der Kopfbereich wird einmal geparst, der Block "Waveform Data" danach in
+    Stücken von `chunk_lines` Zeilen direkt in ein float-Array geschrieben.
+
+    Mit `cache=True` werden die Messwerte zusätzlich als `<datei>.csv.npy`
+    (und die Metadaten als `<datei>.csv.npy.json`) neben der Datei abgelegt.
+    Solange sich Änderungszeit und Größe der CSV-Datei nicht ändern, wird beim
+    nächsten Aufruf nur noch dieses Array (memory-mapped) geladen.
+
     Rückgabe:
-        data     : list   # Liste der Messwerte (als float)
-        metadata : dict   # Kopfbereich mit Infos (Sampling Period, Scale, etc.)
+        data     : np.ndarray # Messwerte (float)
+        metadata : dict       # Kopfbereich mit Infos (Sampling Period, Scale, etc.)
     """
     filename = validate_filename(filename, ".csv")
 
-    metadata = {}
-    data = []
-    reading_data = False
+    if cache:
+        cached = _load_cache(filename)
+        if cached is not None:
+            return cached
 
     with open(filename, "r") as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if not row:  # leere Zeilen überspringen
-                continue
+        metadata = _read_metadata(f)
+        data = _read_waveform(f, chunk_lines, _length_hint(metadata, filename))
 
-            # Beginn der Messdaten
-            if "Waveform Data" in row[0]:
-                reading_data = True
-                continue
-
-            if reading_data:
-                # nur Zahlenzeilen
-                try:
-                    val = float(row[0])
-                    data.append(val)
-                except ValueError:
-                    pass
-            else:
-                # Metadaten
-                if len(row) >= 2:
-                    key = row[0].strip()
-                    value = row[1].strip()
-                    metadata[key] = value
+    if cache:
+        _save_cache(filename, data, metadata)
 
     return data, metadata
 
-def load_csv_oszi_with_x(filename: PathInput) -> tuple[np.ndarray, np.ndarray, dict[str, str]]:
+def load_csv_oszi_with_x(filename: PathInput, cache: bool = False) -> tuple[np.ndarray, np.ndarray, dict[str, str]]:
     """
     Liest Oszi-CSV und gibt (x, y, metadata) zurück.
     x = Zeitachse in Sekunden
@@ -53,11 +57,142 @@ def load_csv_oszi_with_x(filename: PathInput) -> tuple[np.ndarray, np.ndarray, d
     filename = validate_filename(filename, ".csv")
 
     # load yData and metadata
-    data, metadata = load_csv_oszi(filename)
+    data, metadata = load_csv_oszi(filename, cache=cache)
 
     # calculate xData from sampling rate
     sampling_period = float(metadata.get("Sampling Period", 1.0))
     n = len(data)
     x = np.arange(n) * sampling_period
 
-    return x, np.array(data), metadata
+    return x, np.asarray(data), metadata
+
+def iter_csv_oszi(
+    filename: PathInput,
+    chunk_lines: int = _CHUNK_LINES,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Liest eine Oszilloskop-CSV stückweise: liefert `(x, y)` für je
+    `chunk_lines` Zeilen, ohne die ganze Aufnahme im Speicher zu halten
+    (z.B. für `graph_fit.streaming_linear_fit`).
+
+    x = Zeitachse in Sekunden (aus "Sampling Period"), y = Messwerte (float)
+    """
+    filename = validate_filename(filename, ".csv")
+
+    with open(filename, "r") as f:
+        metadata = _read_metadata(f)
+        sampling_period = float(metadata.get("Sampling Period", 1.0))
+        n = 0
+        while True:
+            lines = list(islice(f, chunk_lines))
+            if not lines:
+                break
+            values = _parse_chunk(lines)
+            if len(values) == 0:
+                continue
+            yield (n + np.arange(len(values))) * sampling_period, values
+            n += len(values)
+
+# ==================================================
+#    parsing
+# ==================================================
+
+def _read_metadata(f) -> dict[str, str]:
+    """Reads the header up to (and including) the "Waveform Data" line."""
+    metadata = {}
+    for row in csv.reader(f):
+        if not row:  # leere Zeilen überspringen
+            continue
+
+        # Beginn der Messdaten
+        if "Waveform Data" in row[0]:
+            break
+
+        if len(row) >= 2:
+            key = row[0].strip()
+            value = row[1].strip()
+            metadata[key] = value
+    return metadata
+
+def _read_waveform(f, chunk_lines: int, capacity: int) -> np.ndarray:
+    data = np.empty(max(capacity, 1), dtype=float)
+    n = 0
+    while True:
+        lines = list(islice(f, chunk_lines))
+        if not lines:
+            break
+
+        values = _parse_chunk(lines)
+        if n + len(values) > len(data):
+            data.resize(max(2 * len(data), n + len(values)), refcheck=False)
+        data[n:n + len(values)] = values
+        n += len(values)
+
+    data.resize(n, refcheck=False)
+    return data
+
+def _parse_chunk(lines: list[str]) -> np.ndarray:
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning) # chunk of empty lines
+            return np.loadtxt(lines, delimiter=",", usecols=0, comments=None, dtype=float, ndmin=1)
+    except ValueError:
+        # nur Zahlenzeilen (Text, Leerzeilen, Anführungszeichen)
+        return np.fromiter(_numbers(csv.reader(lines)), dtype=float)
+
+def _numbers(rows):
+    for row in rows:
+        if not row:
+            continue
+        try:
+            yield float(row[0])
+        except ValueError:
+            pass
+
+def _length_hint(metadata: dict[str, str], filename: Path) -> int:
+    """Sample count announced in the header, bounded by what the file can hold."""
+    for key in _LENGTH_KEYS:
+        try:
+            length = int(float(metadata[key]))
+        except (KeyError, ValueError):
+            continue
+        # every sample needs at least a digit and a line break
+        return max(0, min(length, os.path.getsize(filename) // 2))
+    return _CHUNK_LINES
+
+# ==================================================
+#    sidecar cache
+# ==================================================
+
+def _cache_paths(filename: Path) -> tuple[Path, Path]:
+    data_path = filename.with_name(filename.name + ".npy")
+    return data_path, data_path.with_name(data_path.name + ".json")
+
+def _cache_key(filename: Path) -> dict[str, int]:
+    stat = filename.stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+def _load_cache(filename: Path) -> tuple[np.ndarray, dict[str, str]] | None:
+    data_path, meta_path = _cache_paths(filename)
+    if not data_path.exists() or not meta_path.exists():
+        return None
+    try:
+        info = json.loads(meta_path.read_text())
+        if info.get("key") != _cache_key(filename):
+            return None
+        data = np.load(data_path, mmap_mode="c")
+    except (OSError, ValueError):
+        return None
+    return data, info["metadata"]
+
+def _save_cache(filename: Path, data: np.ndarray, metadata: dict[str, str]) -> None:
+    data_path, meta_path = _cache_paths(filename)
+    info = {"key": _cache_key(filename), "metadata": metadata}
+    try:
+        tmp_path = data_path.with_name(data_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, data)
+        os.replace(tmp_path, data_path)
+        meta_path.write_text(json.dumps(info))
+    except OSError as e:
+        print(f"Warning: could not write cache for '{filename}': {e}")
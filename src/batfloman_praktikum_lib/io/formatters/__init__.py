@@ -1,5 +1,9 @@
-from .formatters import custom_format
+from .formatters import custom_format, format_many
+from .spec import CompiledFormatSpec, compile_format_spec
 
 __all__ = [
     "custom_format",
+    "format_many",
+    "CompiledFormatSpec",
+    "compile_format_spec",
 ]
@@ -1,7 +1,10 @@
 import numbers
-from batfloman_praktikum_lib.io.formatters.measurement import custom_format_measurement
+import numpy as np
+
+from batfloman_praktikum_lib.io.formatters.measurement import format_compiled_measurement, format_measurement_array
 from batfloman_praktikum_lib.structs.measurementBase import MeasurementBase
-from .helpers import get_3n_exponent, extract_precision
+from .helpers import get_3n_exponent
+from .spec import CompiledFormatSpec, compile_format_spec
 
 type FormattingSupported = numbers.Real | MeasurementBase
 
@@ -11,18 +14,54 @@ def custom_format(
 ) -> str:
     from batfloman_praktikum_lib.structs.measurement import Measurement
 
+    compiled = compile_format_spec(format_spec)
     if isinstance(value, Measurement):
-        return custom_format_measurement(value, format_spec)
+        if not np.isfinite(value.error) or value.error <= 0:
+            return format(value.value, format_spec)
+        return format_compiled_measurement(value.value, value.error, compiled)
+
+    return _format_number(float(value), compiled)
+
+def format_many(values, errors=None, format_spec: str = "") -> list[str]:
+    """
+    `custom_format` for a whole column, the spec is parsed once.
+
+    - `values` and `errors`: measurements as two arrays
+    - only `values`: numbers, `Measurement`s (mixed) or a `MeasurementArray`
+    """
+    from batfloman_praktikum_lib.structs.measurement import Measurement
+    from batfloman_praktikum_lib.structs.measurementArray import MeasurementArray
+
+    compiled = compile_format_spec(format_spec)
+    if errors is not None:
+        return format_measurement_array(values, errors, compiled)
+    if isinstance(values, MeasurementArray):
+        return format_measurement_array(values.value, values.error, compiled)
+
+    formatted: list[str | None] = [None] * len(values)
+    measurement_indices, measurement_values, measurement_errors = [], [], []
+    for idx, value in enumerate(values):
+        if isinstance(value, Measurement):
+            measurement_indices.append(idx)
+            measurement_values.append(value.value)
+            measurement_errors.append(value.error)
+        else:
+            formatted[idx] = _format_number(float(value), compiled)
 
-    fval = float(value)
+    if measurement_indices:
+        strings = format_measurement_array(measurement_values, measurement_errors, compiled)
+        for idx, string in zip(measurement_indices, strings):
+            formatted[idx] = string
+    return formatted  # type: ignore[return-value]
 
-    if "e3" in format_spec:
+def _format_number(fval: float, compiled: CompiledFormatSpec) -> str:
+    if compiled.number_e3:
         exp = get_3n_exponent(fval)
         val = fval / 10**exp
-        pre = extract_precision(format_spec) or 0
+        pre = compiled.number_decimals
 
         exp_str = "" if exp == 0 else f"e{exp}"
 
         return f"{val:.{pre}f}{exp_str}"
     else:
-        return format(fval, format_spec)
+        return format(fval, compiled.spec)
@@ -1,34 +1,49 @@
 from typing import Literal
-from enum import Enum
 import numpy as np
 
 from batfloman_praktikum_lib.structs.measurementBase import MeasurementBase
-from batfloman_praktikum_lib.significant_rounding import get_sig_digit_position, round_sig_fixed
-from .helpers import get_3n_exponent, extract_precision, get_first_digit_position
-
-class UncertaintyNotation(Enum):
-    PlusMinus = "pm"     # für ±-Notation, z.B. 1.23 ± 0.01
-    Parentheses = "brk" # für Klammer-Notation, z.B. 1.23(1)
+from batfloman_praktikum_lib.significant_rounding import get_sig_digit_position, get_sig_digit_positions, round_sig_fixed
+from .helpers import get_3n_exponent, get_first_digit_position
+from .spec import CompiledFormatSpec, SpecStyle, UncertaintyNotation, compile_format_spec, spec_styles
 
 def custom_format_measurement(value: MeasurementBase, format_spec: str) -> str:
+    compiled = compile_format_spec(format_spec)
     if not np.isfinite(value.error) or value.error <= 0:
-        return format(value.value, format_spec)
+        return format(value.value, compiled.spec)
+
+    return format_compiled_measurement(value.value, value.error, compiled)
+
+def format_compiled_measurement(value: float, uncertainty: float, compiled: CompiledFormatSpec) -> str:
+    """`format_measurement` with an already parsed spec (value with uncertainty)."""
+    if compiled.notation == UncertaintyNotation.PlusMinus:
+        return _display_plusminus_styled(value, uncertainty, compiled.plusminus_style, compiled.decimals)
+    return _display_parenthesis_styled(value, uncertainty, compiled.parenthesis_style, compiled.decimals)
+
+def format_measurement_array(values, errors, format_spec: str | CompiledFormatSpec = "") -> list[str]:
+    """
+    `custom_format_measurement` for whole arrays of values and errors.
 
-    notation = UncertaintyNotation.Parentheses
+    The parenthesis notation with the default or a fixed point spec (what
+    tables use) is rounded on the arrays, grouped by the number of decimals.
+    Every other notation / spec is formatted element by element.
+    """
+    compiled = format_spec if isinstance(format_spec, CompiledFormatSpec) else compile_format_spec(format_spec)
+    values = np.asarray(values, dtype=float)
+    errors = np.asarray(errors, dtype=float)
+    formatted: list[str | None] = [None] * values.size
+
+    has_error = np.isfinite(errors) & (errors > 0)
+    for idx in np.flatnonzero(~has_error):
+        formatted[idx] = format(float(values[idx]), compiled.spec)
 
-    if UncertaintyNotation.PlusMinus.value in format_spec:
-        notation = UncertaintyNotation.PlusMinus
-        format_spec = format_spec.replace(UncertaintyNotation.PlusMinus.value, ""); 
-    elif UncertaintyNotation.Parentheses.value in format_spec:
-        notation = UncertaintyNotation.Parentheses
-        format_spec = format_spec.replace(UncertaintyNotation.Parentheses.value, ""); 
+    vectorized = compiled.notation == UncertaintyNotation.Parentheses and compiled.parenthesis_style in ("f", "auto")
+    fast = has_error & np.isfinite(values) if vectorized else np.zeros(values.shape, dtype=bool)
+    for idx in np.flatnonzero(has_error & ~fast):
+        formatted[idx] = format_compiled_measurement(float(values[idx]), float(errors[idx]), compiled)
 
-    return format_measurement(
-        value.value,
-        value.error,
-        mode = notation,
-        format_spec = format_spec,
-    )
+    if np.any(fast):
+        _display_parenthesis_array(formatted, np.flatnonzero(fast), values, errors, compiled)
+    return formatted  # type: ignore[return-value]
 
 def format_measurement(
     value: float,
@@ -73,17 +88,19 @@ def _display_plusminus_float(val: float, err: float, decimals: int = 0) -> str:
     return f"{val_str} ± {err_str}"
 
 def _display_plusminus(val: float, err: float, format_spec: str = "") -> str:
-    decimals = extract_precision(format_spec) or 0;
+    decimals, style, _ = spec_styles(format_spec)
+    return _display_plusminus_styled(val, err, style, decimals)
 
-    if format_spec.endswith(("e3", "e")):
-        exponent = get_3n_exponent(err) if format_spec.endswith("e3") else get_sig_digit_position(err)
+def _display_plusminus_styled(val: float, err: float, style: SpecStyle, decimals: int) -> str:
+    if style in ("e3", "e"):
+        exponent = get_3n_exponent(err) if style == "e3" else get_sig_digit_position(err)
         return _display_plusminus_exponent(val, err, exponent, decimals);
-    if format_spec.endswith("f"):
+    if style == "f":
         return _display_plusminus_float(val, err, decimals)
     
     exponent = get_sig_digit_position(err);
     if abs(exponent) < 6:
-        decimals = max(0, -get_sig_digit_position(err))
+        decimals = max(0, -exponent)
         return _display_plusminus_float(val, err, decimals)
     else:
         return _display_plusminus_exponent(val, err, exponent, 0)
@@ -113,10 +130,49 @@ def _display_parenthesis_float(val: float, err: float, decimals: int = 0) -> str
 
     return f"{val_str}({err_str})"
 
+def _display_parenthesis_array(formatted: list, indices: np.ndarray, values: np.ndarray, errors: np.ndarray, compiled: CompiledFormatSpec) -> None:
+    """`_display_parenthesis` (default and "f" style) for `values[indices]`, written into `formatted`."""
+    decimals = compiled.decimals
+    val = values[indices]
+    err = errors[indices]
+    err_exp = get_sig_digit_positions(err)
+
+    if compiled.parenthesis_style == "f":
+        use_float = np.ones(indices.shape, dtype=bool)
+        exponent = err_exp
+    else:
+        with np.errstate(divide="ignore"):
+            first = np.floor(np.log10(np.abs(val)))
+        exponent = np.where(val == 0, err_exp, first).astype(int)
+        use_float = (-3 <= exponent) & (exponent < 6) & (err_exp < exponent)
+
+    # fixed point: decimals down to the significant digit of the error
+    float_decimals = -np.minimum(err_exp, 0) + decimals
+    for d in np.unique(float_decimals[use_float]):
+        d = int(d)
+        sel = use_float & (float_decimals == d)
+        val_r = np.round(val[sel], d)
+        err_r = np.ceil(err[sel] * 10**d) / 10**d * 10**d
+        for idx, v, e in zip(indices[sel].tolist(), val_r.tolist(), err_r.tolist()):
+            formatted[idx] = f"{v:.{d}f}({e:.0f})"
+
+    # exponent notation
+    exp_decimals = np.maximum(exponent - err_exp, 0) + decimals
+    groups = np.unique(np.stack([exponent, exp_decimals], axis=-1)[~use_float], axis=0)
+    for exp, d in groups.tolist():
+        sel = ~use_float & (exponent == exp) & (exp_decimals == d)
+        val_r = np.round(val[sel] / 10**exp, d)
+        err_r = np.ceil(err[sel] / 10**(exp - d) * 1) / 1
+        exp_str = f"e{exp}" if exp != 0 else ""
+        for idx, v, e in zip(indices[sel].tolist(), val_r.tolist(), err_r.tolist()):
+            formatted[idx] = f"{v:.{d}f}({e:.0f}){exp_str}"
+
 def _display_parenthesis(val: float, err: float, format_spec: str = "") -> str:
-    decimals = extract_precision(format_spec) or 0;
+    decimals, _, style = spec_styles(format_spec)
+    return _display_parenthesis_styled(val, err, style, decimals)
 
-    if "e3" in format_spec:
+def _display_parenthesis_styled(val: float, err: float, style: SpecStyle, decimals: int) -> str:
+    if style == "e3":
         exponent = get_3n_exponent(val)
         err_exp = get_sig_digit_position(err)
         offset = max(exponent - err_exp, 0)
@@ -124,10 +180,10 @@ def _display_parenthesis(val: float, err: float, format_spec: str = "") -> str:
             exponent = get_3n_exponent(err)
         return _display_parenthesis_exponent(val, err, exponent, offset + decimals)
 
-    if "f" in format_spec:
+    if style == "f":
         return _display_parenthesis_float(val, err, decimals);
 
-    if "e" in format_spec:
+    if style == "e":
         err_exp = get_sig_digit_position(err)
         exponent = err_exp if (tmp := get_first_digit_position(val)) is None else tmp
         offset = max(exponent - err_exp, 0)
@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Literal
+
+from .helpers import extract_precision
+
+# distinct format specs kept compiled (a report uses a handful)
+SPEC_CACHE_SIZE = 256
+
+class UncertaintyNotation(Enum):
+    PlusMinus = "pm"     # für ±-Notation, z.B. 1.23 ± 0.01
+    Parentheses = "brk" # für Klammer-Notation, z.B. 1.23(1)
+
+type SpecStyle = Literal["e3", "e", "f", "auto"]
+
+@dataclass(frozen=True)
+class CompiledFormatSpec:
+    """
+    A format spec parsed once: which notation, which style and how many
+    decimals. Built by `compile_format_spec`, used by `custom_format`,
+    `custom_format_measurement` and `format_many`.
+    """
+    # as given: plain values and measurements without uncertainty
+    spec: str
+    notation: UncertaintyNotation
+    # without the notation, e.g. ".2f" for ".2fpm"
+    measurement_spec: str
+    decimals: int
+    # ±-notation: what `measurement_spec` ends with
+    plusminus_style: SpecStyle
+    # parenthesis notation: what `measurement_spec` contains ("e3" before "f" before "e")
+    parenthesis_style: SpecStyle
+    # plain numbers: "e3" anywhere in `spec`
+    number_e3: bool
+    number_decimals: int
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def compile_format_spec(format_spec: str) -> CompiledFormatSpec:
+    notation = UncertaintyNotation.Parentheses
+    measurement_spec = format_spec
+    if UncertaintyNotation.PlusMinus.value in format_spec:
+        notation = UncertaintyNotation.PlusMinus
+        measurement_spec = format_spec.replace(UncertaintyNotation.PlusMinus.value, "")
+    elif UncertaintyNotation.Parentheses.value in format_spec:
+        measurement_spec = format_spec.replace(UncertaintyNotation.Parentheses.value, "")
+
+    decimals, plusminus_style, parenthesis_style = spec_styles(measurement_spec)
+    return CompiledFormatSpec(
+        spec=format_spec,
+        notation=notation,
+        measurement_spec=measurement_spec,
+        decimals=decimals,
+        plusminus_style=plusminus_style,
+        parenthesis_style=parenthesis_style,
+        number_e3="e3" in format_spec,
+        number_decimals=extract_precision(format_spec) or 0,
+    )
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def spec_styles(format_spec: str) -> tuple[int, SpecStyle, SpecStyle]:
+    """Decimals, ±-style and parenthesis style of a spec without notation."""
+    return (
+        extract_precision(format_spec) or 0,
+        _plusminus_style(format_spec),
+        _parenthesis_style(format_spec),
+    )
+
+def _plusminus_style(format_spec: str) -> SpecStyle:
+    if format_spec.endswith("e3"):
+        return "e3"
+    if format_spec.endswith("e"):
+        return "e"
+    if format_spec.endswith("f"):
+        return "f"
+    return "auto"
+
+def _parenthesis_style(format_spec: str) -> SpecStyle:
+    if "e3" in format_spec:
+        return "e3"
+    if "f" in format_spec:
+        return "f"
+    if "e" in format_spec:
+        return "e"
+    return "auto"
@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Sequence
 from typing import Optional
 
 import numpy as np
@@ -15,6 +16,7 @@ from ._dataframe_helper import (
 )
 from ._number_helper import format_unit_latex
 from .format_values import format_value
+from batfloman_praktikum_lib.io.formatters import format_many
 
 
 def _format_symbol(name: str) -> str:
@@ -78,23 +80,75 @@ def format_table_value(value, metadata: TableColumnMetadata) -> str:
     )
 
 
+def format_table_column(values, metadata: TableColumnMetadata) -> list[str]:
+    """
+    `format_table_value` for every value of a column.
+
+    The metadata is resolved once and the measurements of the column are
+    rounded together (`format_many`) instead of cell by cell.
+    """
+    metadata = normalize_metadata(metadata)
+    display_exponent = metadata.display_exponent if hasattr(metadata, "display_exponent") else 0
+    format_spec = metadata.format_spec or ""
+    measurement_spec = format_spec
+    if metadata.enforce_display_exponent and "e" not in format_spec:
+        measurement_spec = "f"
+
+    formatted: list[str | None] = [None] * len(values)
+    number_indices, numbers = [], []
+    measurement_indices, measurement_values, measurement_errors = [], [], []
+
+    for idx, value in enumerate(values):
+        if isinstance(value, Measurement):
+            measurement_indices.append(idx)
+            measurement_values.append(value.value)
+            measurement_errors.append(value.error)
+            continue
+
+        if isinstance(value, (str, np.str_)):
+            try:
+                value = float(value)
+            except ValueError:
+                formatted[idx] = str(value)
+                continue
+
+        if isinstance(value, float) and np.isnan(value):
+            formatted[idx] = "NaN"
+            continue
+
+        number_indices.append(idx)
+        numbers.append(value / 10**display_exponent if display_exponent else value)
+
+    for idx, number in zip(number_indices, format_many(numbers, format_spec=format_spec)):
+        formatted[idx] = rf"\num{{{number}}}"
+
+    if measurement_indices:
+        values_arr = np.asarray(measurement_values, dtype=float)
+        errors_arr = np.asarray(measurement_errors, dtype=float)
+        if display_exponent:
+            values_arr = values_arr / 10**display_exponent
+            errors_arr = errors_arr / 10**display_exponent
+        for idx, number in zip(measurement_indices, format_many(values_arr, errors_arr, measurement_spec)):
+            formatted[idx] = rf"\num{{{number}}}"
+
+    return formatted  # type: ignore[return-value]
+
+
 def render_latex(
     column_format: str,
     formatted_headers: list[str],
-    formatted_rows: list[list[str]],
+    formatted_rows: Iterable[Sequence[str]],
 ) -> str:
-    latex_str = ""
-    latex_str += r"\begin{tabular}{" + column_format + "}" + "\n"
-    latex_str += "\t" + r"\toprule" + "\n"
-    latex_str += "\t" + (" & ".join(formatted_headers)) + r"\\" + "\n"
-    latex_str += "\t" + r"\midrule" + "\n"
-
-    for row in formatted_rows:
-        latex_str += "\t" + (" & ".join(row)) + r"\\" + "\n"
-
-    latex_str += "\t" + r"\bottomrule" + "\n"
-    latex_str += r"\end{tabular}" + "\n"
-    return latex_str
+    lines = [
+        r"\begin{tabular}{" + column_format + "}",
+        "\t" + r"\toprule",
+        "\t" + (" & ".join(formatted_headers)) + r"\\",
+        "\t" + r"\midrule",
+    ]
+    lines.extend("\t" + " & ".join(row) + r"\\" for row in formatted_rows)
+    lines.append("\t" + r"\bottomrule")
+    lines.append(r"\end{tabular}")
+    return "\n".join(lines) + "\n"
 
 
 def format_dataframe(
@@ -116,11 +170,11 @@ def format_dataframe(
         for col in indices
     ]
 
-    formatted_rows = []
-    for _, row in df.iterrows():
-        formatted_rows.append([
-            format_table_value(value, metadata.get_metadata(index))
-            for index, value in zip(indices, row[indices])
-        ])
+    # column by column, then transposed into rows
+    formatted_columns = [
+        format_table_column(df[index].to_numpy(dtype=object), metadata.get_metadata(index))
+        for index in indices
+    ]
+    formatted_rows = zip(*formatted_columns) if formatted_columns else ([] for _ in range(len(df)))
 
     return render_latex(column_format, formatted_headers, formatted_rows)
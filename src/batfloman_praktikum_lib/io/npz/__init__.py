@@ -0,0 +1,7 @@
+from .load import load_npz
+from .save import save_npz
+
+__all__ = [
+    "load_npz",
+    "save_npz",
+]
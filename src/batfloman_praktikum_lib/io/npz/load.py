@@ -0,0 +1,78 @@
+import json
+import struct
+import zipfile
+
+import numpy as np
+
+from ...path_managment import PathInput, validate_filename
+from ...structs.columnarDataCluster import ColumnarDataCluster, _Column
+from ..json import from_json_data
+from .save import COLUMN_BUFFERS, HEADER_KEY, NPZ_FORMAT, NPZ_VERSION
+
+# local file header of a zip member: fixed part, name length at 26, extra length at 28
+_ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+def load_npz(path: PathInput, *, mmap: bool = False) -> ColumnarDataCluster:
+    """
+    Load a DataCluster saved with `save_npz`.
+
+    The column arrays become the buffers of a `ColumnarDataCluster` without
+    copying or per-cell parsing. With `mmap=True` the buffers of an
+    uncompressed file are memory-mapped (copy-on-write: changes stay in
+    memory), so only the parts that are used are read from disk.
+    """
+    path = validate_filename(path, ".npz")
+
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as file:
+        members = {info.filename.removesuffix(".npy"): info for info in archive.infolist()}
+        if HEADER_KEY not in members:
+            raise ValueError(f"{path} is not a DataCluster npz file (no header)")
+
+        def read(key: str) -> np.ndarray:
+            info = members[key]
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                return _memmap_member(file, path, info)
+            with archive.open(info) as member:
+                return np.lib.format.read_array(member, allow_pickle=False)
+
+        header = json.loads(read(HEADER_KEY).tobytes().decode("utf-8"))
+        if header.get("format") != NPZ_FORMAT or header.get("version", 0) > NPZ_VERSION:
+            raise ValueError(f"{path}: unsupported npz format {header.get('format')} (version {header.get('version')})")
+
+        cluster = ColumnarDataCluster()
+        for info in header["columns"]:
+            values, errors, mask, measured = (read(f"{info['key']}.{buffer}") for buffer in COLUMN_BUFFERS)
+            objects = None
+            if "objects" in info:
+                objects = np.empty(len(info["objects"]), dtype=object)
+                # plain strings / numbers stay as they are, only stored structs are rebuilt
+                objects[:] = [
+                    from_json_data(cell) if isinstance(cell, (dict, list)) else cell
+                    for cell in info["objects"]
+                ]
+            cluster._columns[info["name"]] = _Column(info["mode"], values, errors, mask, measured, objects)
+
+    cluster._row_ids = cluster._new_row_ids(header["length"])
+    for index, metadata in header.get("metadata", {}).items():
+        cluster.metadata_manager.set_metadata(index, metadata)
+    return cluster
+
+def _memmap_member(file, path, info: zipfile.ZipInfo) -> np.ndarray:
+    """Map an uncompressed `.npy` member of the zip file directly."""
+    file.seek(info.header_offset)
+    signature, name_length, extra_length = _ZIP_LOCAL_HEADER.unpack(file.read(_ZIP_LOCAL_HEADER_SIZE))
+    if signature != b"PK\x03\x04":
+        raise ValueError(f"{path}: corrupt zip member {info.filename}")
+    file.seek(info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_length + extra_length)
+
+    version = np.lib.format.read_magic(file)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+    if dtype.hasobject:
+        raise ValueError(f"{path}: object arrays are not supported")
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="c", offset=file.tell(), shape=shape, order="F" if fortran_order else "C")
@@ -0,0 +1,74 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+
+from ...path_managment import PathInput, create_dirs, ensure_extension
+from ...structs.dataCluster import DataCluster
+from ..json import to_json_data
+
+# identifies the header written by `save_npz`
+NPZ_FORMAT = "batfloman-datacluster"
+NPZ_VERSION = 1
+HEADER_KEY = "__header__"
+# buffers stored for every column, as `<column key>.<buffer>`
+COLUMN_BUFFERS = ("values", "errors", "mask", "measured")
+
+def save_npz(
+    cluster: DataCluster,
+    path: PathInput,
+    *,
+    compressed: bool = False,
+) -> Path:
+    """
+    Save a DataCluster as binary columns (`.npz`).
+
+    Every column is stored as its value / error / mask arrays, the column
+    names, the table metadata and non-numeric cells (strings, ...) as a small
+    JSON header. Uncompressed files (default) can be loaded memory-mapped
+    with `load_npz(path, mmap=True)`.
+    """
+    path = ensure_extension(path, ".npz")
+    create_dirs(path)
+
+    columnar = cluster.to_columnar()
+    arrays: dict[str, np.ndarray] = {}
+    columns = []
+    for idx, (name, column) in enumerate(columnar._columns.items()):
+        key = f"c{idx}"
+        for buffer in COLUMN_BUFFERS:
+            arrays[f"{key}.{buffer}"] = np.ascontiguousarray(getattr(column, buffer))
+
+        info = {"name": name, "key": key, "mode": column.mode}
+        if column.objects is not None:
+            info["objects"] = [_json_cell(cell) for cell in column.objects]
+        columns.append(info)
+
+    header = {
+        "format": NPZ_FORMAT,
+        "version": NPZ_VERSION,
+        "length": len(columnar),
+        "columns": columns,
+        "metadata": {
+            index: asdict(metadata)
+            for index, metadata in cluster.metadata_manager._metadata.items()
+        },
+    }
+    try:
+        header_json = json.dumps(header)
+    except TypeError as e:
+        raise TypeError(f"Cannot store the entries of the DataCluster in an npz file: {e}") from None
+    arrays[HEADER_KEY] = np.frombuffer(header_json.encode("utf-8"), dtype=np.uint8)
+
+    with open(path, "wb") as file:
+        if compressed:
+            np.savez_compressed(file, **arrays)  # type: ignore[arg-type]
+        else:
+            np.savez(file, **arrays)  # type: ignore[arg-type]
+    return path
+
+def _json_cell(cell):
+    if isinstance(cell, np.generic):
+        cell = cell.item()
+    return to_json_data(cell)
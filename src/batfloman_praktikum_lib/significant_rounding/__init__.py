@@ -1,10 +1,20 @@
 from .formatter import UncertaintyNotation, format_measurement
-from .core import get_sig_digit_position, round_sig, round_sig_fixed
+from .core import (
+    get_sig_digit_position,
+    get_sig_digit_positions,
+    round_sig,
+    round_sig_array,
+    round_sig_fixed,
+    round_sig_fixed_array,
+)
 
 __all__ = [
     "UncertaintyNotation",
     "format_measurement",
     "get_sig_digit_position", 
+    "get_sig_digit_positions",
     "round_sig",
-    "round_sig_fixed"
+    "round_sig_array",
+    "round_sig_fixed",
+    "round_sig_fixed_array",
 ]
@@ -16,13 +16,52 @@ def get_sig_digit_position(uncertainty: float) -> int:
     else:
         return exponent
 
+def get_sig_digit_positions(uncertainties) -> np.ndarray:
+    uncertainties = np.asarray(uncertainties, dtype=float)
+    if not np.all(np.isfinite(uncertainties) & (uncertainties > 0)):
+        raise ValueError("Uncertainty must be finite and positive.")
+
+    exponent = np.floor(np.log10(uncertainties)).astype(int)
+    leading_digit = (uncertainties / 10.0**exponent + 1e-12).astype(int)
+
+    # DIN-Norm: leading digit 1 or 2 → two significant digits
+    return np.where((leading_digit == 1) | (leading_digit == 2), exponent - 1, exponent)
+
 def round_sig(value: float, uncertainty: float) -> Tuple[float, float]:
     sig_digit_pos = get_sig_digit_position(uncertainty);
     val = util.round(value, -sig_digit_pos)
     err = util.ceil(uncertainty, -sig_digit_pos)
     return (val, err)
 
+def round_sig_array(values, errors) -> Tuple[np.ndarray, np.ndarray]:
+    values = np.array(values, dtype=float)
+    errors = np.array(errors, dtype=float)
+    values, errors = np.broadcast_arrays(values, errors)
+
+    # without a (finite, positive) uncertainty there is nothing to round to
+    valid = np.isfinite(errors) & (errors > 0)
+    decimals = np.zeros(errors.shape, dtype=int)
+    decimals[valid] = -get_sig_digit_positions(errors[valid])
+    return _round_fixed(values, errors, decimals, valid)
+
 def round_sig_fixed(value: float, uncertainty: float, decimals: int) -> Tuple[float, float]:
     val = util.round(value, decimals)
     err = util.ceil(uncertainty, decimals)
     return (val, err)
+
+def round_sig_fixed_array(values, errors, decimals) -> Tuple[np.ndarray, np.ndarray]:
+    values = np.array(values, dtype=float)
+    errors = np.array(errors, dtype=float)
+    values, errors = np.broadcast_arrays(values, errors)
+    decimals = np.broadcast_to(np.asarray(decimals, dtype=int), values.shape)
+    return _round_fixed(values, errors, decimals, np.ones(values.shape, dtype=bool))
+
+def _round_fixed(values: np.ndarray, errors: np.ndarray, decimals: np.ndarray, selected: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # one `round_sig_fixed` per distinct number of decimals (usually only a few)
+    rounded_values = values.copy()
+    rounded_errors = errors.copy()
+    for d in np.unique(decimals[selected]).tolist():
+        sel = selected & (decimals == d)
+        rounded_values[sel] = util.round(values[sel], d)
+        rounded_errors[sel] = util.ceil(errors[sel], d)
+    return rounded_values, rounded_errors
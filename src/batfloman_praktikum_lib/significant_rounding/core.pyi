@@ -1,5 +1,8 @@
 from typing import Tuple
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 def get_sig_digit_position(uncertainty: float) -> int:
     """
     Return the significant digit of an (uncertainty) value using the DIN-Norm
@@ -7,8 +10,28 @@ def get_sig_digit_position(uncertainty: float) -> int:
     """
     ...
 
+def get_sig_digit_positions(uncertainties: ArrayLike) -> np.ndarray:
+    """
+    `get_sig_digit_position` for a whole array (np.log10 / np.floor),
+    every uncertainty must be finite and positive
+    """
+    ...
+
 def round_sig(value: float, uncertainty: float) -> Tuple[float, float]:
     ...
 
+def round_sig_array(values: ArrayLike, errors: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `round_sig` for whole columns (e.g. `MeasurementArray.value` / `.error`)
+    entries whose error is zero, NaN or inf are returned unchanged
+    """
+    ...
+
 def round_sig_fixed(value: float, uncertainty: float, decimals: int) -> Tuple[float, float]:
     ...
+
+def round_sig_fixed_array(values: ArrayLike, errors: ArrayLike, decimals: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `round_sig_fixed` for whole columns, `decimals` may differ per entry
+    """
+    ...
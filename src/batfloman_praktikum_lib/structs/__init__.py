@@ -1,5 +1,44 @@
+from typing import TYPE_CHECKING
+
 from .measurement import Measurement 
+from .measurementArray import MeasurementArray
 from .dataset import Dataset
-from .dataCluster import DataCluster
+from .correlation import (
+    enable_correlation_tracking,
+    is_correlation_tracking_enabled,
+    track_correlations,
+    correlated_values,
+    covariance,
+    covariance_matrix,
+)
+from .._lazy import attach
+
+# the data clusters need pandas -> imported on first use
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "DataCluster": ".dataCluster",
+        "ColumnarDataCluster": ".columnarDataCluster",
+        "DatasetView": ".columnarDataCluster",
+    },
+)
+
+if TYPE_CHECKING:
+    from .dataCluster import DataCluster
+    from .columnarDataCluster import ColumnarDataCluster, DatasetView
+
+__all__ = [
+    'Measurement',
+    'MeasurementArray',
+    'Dataset',
+    'DataCluster',
+    'ColumnarDataCluster',
+    'DatasetView',
 
-__all__ = ['Measurement', 'Dataset', 'DataCluster']
+    'enable_correlation_tracking',
+    'is_correlation_tracking_enabled',
+    'track_correlations',
+    'correlated_values',
+    'covariance',
+    'covariance_matrix',
+]
@@ -0,0 +1,619 @@
+import copy
+from collections.abc import Iterable, Mapping
+from typing import Callable, Literal, Optional
+
+import numpy as np
+
+from .dataCluster import DataCluster, _is_missing_entry
+from .dataset import Dataset
+from .measurement import Measurement
+from .measurementArray import MeasurementArray
+from .measurementBase import MeasurementBase
+
+type ColumnMode = Literal["float", "integer", "object"] | None
+
+# ==================================================
+#    Column storage
+# ==================================================
+
+def _classify(cell) -> Literal["float", "integer", "measurement", "object"]:
+    if isinstance(cell, MeasurementBase):
+        return "measurement"
+    if isinstance(cell, bool):
+        return "object"
+    if isinstance(cell, (int, np.integer)):
+        return "integer"
+    if isinstance(cell, (float, np.floating)):
+        return "float"
+    return "object"
+
+def _accepts(mode: ColumnMode, kind: str) -> bool:
+    match mode:
+        case "object":
+            return True
+        case "float":
+            return kind in ("float", "measurement")
+        case "integer":
+            return kind == "integer"
+    return False
+
+def _mode_for(kind: str) -> ColumnMode:
+    return "float" if kind in ("float", "measurement") else kind  # type: ignore[return-value]
+
+def _unpack_cell(cell) -> tuple[float, float]:
+    """Value / error as `DataCluster.values` and `DataCluster.errors` report them."""
+    if _is_missing_entry(cell):
+        return np.nan, np.nan
+    if isinstance(cell, MeasurementBase):
+        return cell.value, cell.error
+    try:
+        return float(cell), 0.0
+    except (ValueError, TypeError):
+        return np.nan, 0.0
+
+class _Column:
+    """
+    One column as contiguous buffers.
+
+    `values` / `errors` hold what `values()` / `errors()` return (NaN where the
+    entry is missing), `mask` marks rows that have an entry at all and
+    `measured` marks entries that are a `Measurement`. Columns with
+    non-numeric entries (strings, ...) additionally keep the original cells
+    in `objects`.
+    """
+    __slots__ = ("mode", "values", "errors", "mask", "measured", "objects")
+
+    def __init__(self, mode: ColumnMode, values, errors, mask, measured, objects=None):
+        self.mode = mode
+        self.values = values
+        self.errors = errors
+        self.mask = mask
+        self.measured = measured
+        self.objects = objects
+
+    @classmethod
+    def missing(cls, length: int) -> "_Column":
+        return cls(
+            None,
+            np.full(length, np.nan),
+            np.full(length, np.nan),
+            np.zeros(length, dtype=bool),
+            np.zeros(length, dtype=bool),
+        )
+
+    @classmethod
+    def from_cells(cls, cells: list, present: list[bool] | None = None) -> "_Column":
+        if present is None:
+            present = [True] * len(cells)
+
+        kinds = {_classify(cell) for cell, has in zip(cells, present) if has}
+        if not kinds:
+            return cls.missing(len(cells))
+
+        if "object" in kinds or ("integer" in kinds and len(kinds) > 1):
+            mode: ColumnMode = "object"
+        elif kinds == {"integer"}:
+            mode = "integer"
+        else:
+            mode = "float"
+
+        column = cls.missing(len(cells))
+        column.mode = mode
+        if mode == "object":
+            column.objects = np.empty(len(cells), dtype=object)
+        for idx, (cell, has) in enumerate(zip(cells, present)):
+            if has:
+                column._write(idx, cell)
+        return column
+
+    @classmethod
+    def from_measurements(cls, array: MeasurementArray, *, copy: bool = True) -> "_Column":
+        length = len(array)
+        return cls(
+            "float",
+            np.array(array.value, dtype=float, copy=copy),
+            np.array(array.error, dtype=float, copy=copy),
+            np.ones(length, dtype=bool),
+            np.ones(length, dtype=bool),
+        )
+
+    @classmethod
+    def from_floats(cls, values: np.ndarray, *, copy: bool = True) -> "_Column":
+        length = len(values)
+        return cls(
+            "float",
+            np.array(values, dtype=float, copy=copy),
+            np.where(np.isnan(values), np.nan, 0.0),
+            np.ones(length, dtype=bool),
+            np.zeros(length, dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    # ==================================================
+
+    def cell(self, idx: int):
+        match self.mode:
+            case "object":
+                return self.objects[idx]  # type: ignore[index]
+            case "integer":
+                return int(self.values[idx])
+        if self.measured[idx]:
+            return Measurement.from_value_error(self.values[idx], self.errors[idx])
+        return float(self.values[idx])
+
+    def set(self, idx: int, cell) -> None:
+        kind = _classify(cell)
+        if self.mode is None and not self.mask.any():
+            self.mode = _mode_for(kind)
+            if self.mode == "object":
+                self.objects = np.empty(len(self), dtype=object)
+        elif not _accepts(self.mode, kind):
+            self.to_object()
+        self._write(idx, cell)
+
+    def unset(self, idx: int) -> None:
+        self.mask[idx] = False
+        self.measured[idx] = False
+        self.values[idx] = np.nan
+        self.errors[idx] = np.nan
+        if self.objects is not None:
+            self.objects[idx] = None
+
+    def _write(self, idx: int, cell) -> None:
+        self.mask[idx] = True
+        if self.mode == "object":
+            self.objects[idx] = cell  # type: ignore[index]
+            self.values[idx], self.errors[idx] = _unpack_cell(cell)
+            self.measured[idx] = isinstance(cell, MeasurementBase)
+        elif isinstance(cell, MeasurementBase):
+            self.values[idx] = cell.value
+            self.errors[idx] = cell.error
+            self.measured[idx] = True
+        else:
+            value = float(cell)
+            self.values[idx] = value
+            self.errors[idx] = np.nan if np.isnan(value) else 0.0
+            self.measured[idx] = False
+
+    def to_object(self) -> None:
+        if self.mode == "object":
+            return
+        objects = np.empty(len(self), dtype=object)
+        for idx in np.flatnonzero(self.mask):
+            objects[idx] = self.cell(idx)
+        self.objects = objects
+        self.mode = "object"
+
+    # ==================================================
+
+    def take(self, indices, *, deep: bool = False) -> "_Column":
+        objects = None
+        if self.objects is not None:
+            objects = self.objects[indices]
+            if deep:
+                copied = np.empty(len(objects), dtype=object)
+                copied[:] = [copy.deepcopy(item) for item in objects]
+                objects = copied
+        return _Column(
+            self.mode,
+            self.values[indices],
+            self.errors[indices],
+            self.mask[indices],
+            self.measured[indices],
+            objects,
+        )
+
+    @staticmethod
+    def concat(first: "_Column", second: "_Column") -> "_Column":
+        mode = first.mode if second.mode is None else second.mode
+        if first.mode is not None and second.mode is not None and first.mode != second.mode:
+            mode = "object"
+        if mode == "object":
+            for part in (first, second):
+                if part.mode is None:
+                    part.objects = np.empty(len(part), dtype=object)
+                    part.mode = "object"
+                else:
+                    part.to_object()
+
+        return _Column(
+            mode,
+            np.concatenate([first.values, second.values]),
+            np.concatenate([first.errors, second.errors]),
+            np.concatenate([first.mask, second.mask]),
+            np.concatenate([first.measured, second.measured]),
+            np.concatenate([first.objects, second.objects]) if mode == "object" else None,  # type: ignore[list-item]
+        )
+
+# ==================================================
+#    Row view
+# ==================================================
+
+class DatasetView(Dataset):
+    """
+    A row of a `ColumnarDataCluster`.
+
+    Behaves like a `Dataset`, but reads and writes go straight to the column
+    buffers of the cluster. The view follows its row through `sort`.
+    """
+
+    def __init__(self, cluster: "ColumnarDataCluster", row_id: int):
+        self._cluster = cluster
+        self._row_id = row_id
+
+    @property
+    def measurements(self) -> dict:  # type: ignore[override]
+        return self._cluster._row_dict(self._row_id)
+
+    def __getitem__(self, index):
+        return self._cluster._get_cell(self._row_id, index)
+
+    def __setitem__(self, index, value):
+        self._cluster._set_cell(self._row_id, index, value)
+
+    def __delitem__(self, index):
+        self._cluster._del_cell(self._row_id, index)
+
+    def __contains__(self, key):
+        return self._cluster._has_cell(self._row_id, key)
+
+    def __eq__(self, other):
+        if not isinstance(other, DatasetView):
+            return NotImplemented
+        return other._cluster is self._cluster and other._row_id == self._row_id
+
+    def __hash__(self):
+        return hash((id(self._cluster), self._row_id))
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def update(self, other: Mapping | Iterable[tuple] = (), **kwargs) -> None:
+        for key, value in dict(other, **kwargs).items():
+            self[key] = value
+
+# ==================================================
+#    Cluster
+# ==================================================
+
+class ColumnarDataCluster(DataCluster):
+    """
+    `DataCluster` that stores every column as contiguous value / error arrays.
+
+    `values`, `errors` and `measurements` copy the column buffers instead of
+    iterating rows, and the schema is cached. Rows are exposed as
+    `DatasetView`s, so the row-oriented API keeps working; `data` is a tuple
+    of these views, rows are added and removed through the cluster.
+    """
+
+    def __init__(self, datasets=None):
+        from batfloman_praktikum_lib.io.table_metadata import TableMetadataManager
+
+        self.metadata_manager = TableMetadataManager()
+        self._columns: dict[str, _Column] = {}
+        self._row_ids = np.zeros(0, dtype=np.int64)
+        self._next_row_id = 0
+        self._positions: dict[int, int] | None = None
+        self._views: tuple[Dataset, ...] | None = None
+
+        if isinstance(datasets, ColumnarDataCluster):
+            indices = np.arange(len(datasets))
+            self._columns = {name: column.take(indices) for name, column in datasets._columns.items()}
+            self._row_ids = self._new_row_ids(len(datasets))
+            return
+
+        self._extend_rows(self._normalize_datasets(datasets))
+
+    @classmethod
+    def from_columns(cls, columns: Mapping, *, copy: bool = True) -> "ColumnarDataCluster":
+        """
+        Build a cluster directly from column arrays.
+
+        Values may be `MeasurementArray`s, float arrays or any sequence of
+        cells. With `copy=False` float buffers are adopted as they are.
+        """
+        cluster = cls()
+        length = None
+        for name, column in columns.items():
+            cluster._columns[name] = _to_column(column, copy=copy)
+            if length is None:
+                length = len(cluster._columns[name])
+            elif len(cluster._columns[name]) != length:
+                raise ValueError("All columns must have the same length")
+        cluster._row_ids = cluster._new_row_ids(length or 0)
+        return cluster
+
+    def to_rows(self) -> DataCluster:
+        """Row-oriented copy of this cluster."""
+        rows = DataCluster([dict(row.measurements) for row in self])
+        rows.metadata_manager = copy.deepcopy(self.metadata_manager)
+        return rows
+
+    def to_columnar(self) -> "ColumnarDataCluster":
+        return self
+
+    # ==================================================
+    #    bookkeeping
+
+    @property
+    def data(self) -> tuple[Dataset, ...]:  # type: ignore[override]
+        # the views follow their row, so they only change with the row order;
+        # a tuple, as adding to it would not reach the column buffers
+        if self._views is None:
+            self._views = tuple(DatasetView(self, row_id) for row_id in self._row_ids.tolist())
+        return self._views
+
+    @data.setter
+    def data(self, datasets) -> None:
+        self._columns = {}
+        self._row_ids = np.zeros(0, dtype=np.int64)
+        self._rows_changed()
+        self._extend_rows(self._normalize_datasets(datasets))
+
+    def _new_row_ids(self, count: int) -> np.ndarray:
+        row_ids = np.arange(self._next_row_id, self._next_row_id + count, dtype=np.int64)
+        self._next_row_id += count
+        self._rows_changed()
+        return row_ids
+
+    def _rows_changed(self) -> None:
+        self._positions = None
+        self._views = None
+
+    def _position(self, row_id: int) -> int:
+        if self._positions is None:
+            self._positions = {int(row_id): pos for pos, row_id in enumerate(self._row_ids)}
+        try:
+            return self._positions[row_id]
+        except KeyError:
+            raise IndexError("Row is no longer part of this DataCluster") from None
+
+    def _take(self, indices, *, deep: bool = False) -> "ColumnarDataCluster":
+        cluster = ColumnarDataCluster()
+        cluster._columns = {name: column.take(indices, deep=deep) for name, column in self._columns.items()}
+        cluster._row_ids = cluster._new_row_ids(len(self._row_ids[indices]))
+        return cluster
+
+    def _reorder(self, indices) -> None:
+        self._columns = {name: column.take(indices) for name, column in self._columns.items()}
+        self._row_ids = self._row_ids[indices]
+        self._rows_changed()
+
+    def _extend_rows(self, rows: list[Dataset]) -> None:
+        if len(rows) == 0:
+            return
+
+        old_length = len(self)
+        names = list(self._columns)
+        for row in rows:
+            for key in row.keys():
+                if key not in self._columns and key not in names:
+                    names.append(key)
+
+        for name in names:
+            present = [name in row for row in rows]
+            cells = [row[name] if has else None for row, has in zip(rows, present)]
+            chunk = _Column.from_cells(cells, present)
+            existing = self._columns.get(name, _Column.missing(old_length))
+            self._columns[name] = _Column.concat(existing, chunk) if old_length else chunk
+
+        self._row_ids = np.concatenate([self._row_ids, self._new_row_ids(len(rows))])
+
+    # ==================================================
+    #    cell access (used by DatasetView)
+
+    def _get_cell(self, row_id: int, key):
+        column = self._columns.get(key)
+        pos = self._position(row_id)
+        if column is None or not column.mask[pos]:
+            raise KeyError(key)
+        return column.cell(pos)
+
+    def _has_cell(self, row_id: int, key) -> bool:
+        column = self._columns.get(key)
+        return column is not None and bool(column.mask[self._position(row_id)])
+
+    def _set_cell(self, row_id: int, key, value) -> None:
+        pos = self._position(row_id)
+        if key not in self._columns:
+            self._columns[key] = _Column.missing(len(self))
+        self._columns[key].set(pos, value)
+
+    def _del_cell(self, row_id: int, key) -> None:
+        if not self._has_cell(row_id, key):
+            raise KeyError(key)
+        self._columns[key].unset(self._position(row_id))
+
+    def _row_dict(self, row_id: int) -> dict:
+        pos = self._position(row_id)
+        return {
+            name: column.cell(pos)
+            for name, column in self._columns.items()
+            if column.mask[pos]
+        }
+
+    # ==================================================
+
+    def __len__(self) -> int:
+        return len(self._row_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            return self.column(index)
+        if isinstance(index, slice):
+            return self._take(np.arange(len(self))[index])
+        return DatasetView(self, int(self._row_ids[index]))
+
+    def __setitem__(self, index, value):
+        if isinstance(index, str):
+            self._set_column(index, value)
+            return
+
+        if isinstance(index, slice):
+            rows = list(self.data)
+            rows[index] = self._normalize_datasets(value)
+            self.data = [dict(row.measurements) for row in rows]
+            return
+
+        if isinstance(value, Mapping) or isinstance(value, Dataset):
+            replacement = dict(value.items())
+        else:
+            raise TypeError("Expected Dataset or mapping")
+
+        pos = int(np.arange(len(self))[index])
+        for name, column in self._columns.items():
+            if name not in replacement:
+                column.unset(pos)
+        row = DatasetView(self, int(self._row_ids[pos]))
+        for key, item in replacement.items():
+            row[key] = item
+
+    def _set_column(self, index: str, value) -> None:
+        if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+            if len(self) == 0:
+                raise IndexError("Cannot assign a scalar column on an empty DataCluster")
+            column = _Column.from_cells([value] * len(self))
+        else:
+            column = _to_column(value)
+            if len(self) == 0:
+                self._row_ids = self._new_row_ids(len(column))
+            elif len(column) != len(self):
+                raise ValueError("Column length must match the number of datasets")
+
+        self._columns[index] = column
+
+    def __iter__(self):
+        return iter(self.data)
+
+    # ==================================================
+
+    def add(self, to_add) -> None:
+        if isinstance(to_add, (Dataset, dict)):
+            add_arr = [to_add]
+        elif isinstance(to_add, Iterable):
+            add_arr = list(to_add)
+        else:
+            raise TypeError("Invalid input")
+
+        normalized = []
+        for item in add_arr:
+            if isinstance(item, Dataset):
+                normalized.append(Dataset(dict(item.items())) if isinstance(item, DatasetView) else item)
+            elif isinstance(item, dict):
+                normalized.append(Dataset(item))
+            else:
+                raise TypeError("Expected Dataset or dict")
+
+        self._extend_rows(normalized)
+
+    def remove(self, to_remove) -> None:
+        if not isinstance(to_remove, list):
+            to_remove = [to_remove]
+        removed_ids = [
+            item._row_id
+            for item in to_remove
+            if isinstance(item, DatasetView) and item._cluster is self
+        ]
+        keep = ~np.isin(self._row_ids, removed_ids)
+        self._reorder(np.flatnonzero(keep))
+
+    def get_column_names(self) -> list[str]:
+        return list(self._columns)
+
+    # ==================================================
+
+    def sort(self, *keys: str) -> "ColumnarDataCluster":
+        if len(keys) == 0:
+            raise ValueError("At least one sort key must be provided")
+        if not all(isinstance(key, str) for key in keys):
+            raise TypeError("Sort keys must be strings")
+
+        columns = [self._columns.get(key, _Column.missing(len(self))) for key in keys]
+        if all(column.mode != "object" for column in columns):
+            # rows without the key first (like DataCluster.sort), then by value
+            sort_keys = []
+            for column in reversed(columns):
+                sort_keys.extend([column.values, column.mask])
+            order = np.lexsort(sort_keys)
+        else:
+            def normalize_value(column: _Column, pos: int):
+                if not column.mask[pos]:
+                    return (False, None)
+                if column.mode != "object":
+                    return (True, column.values[pos])
+                value = column.objects[pos]  # type: ignore[index]
+                if isinstance(value, MeasurementBase):
+                    return (True, value.value)
+                try:
+                    return (True, float(value))
+                except (ValueError, TypeError):
+                    return (True, value)
+
+            order = sorted(
+                range(len(self)),
+                key=lambda pos: tuple(normalize_value(column, pos) for column in columns),
+            )
+
+        self._reorder(np.asarray(order, dtype=np.int64))
+        return self
+
+    def filter(self, condition: Callable[[Dataset], bool]) -> "ColumnarDataCluster":
+        keep = [pos for pos, row in enumerate(self) if condition(row)]
+        return self._take(np.asarray(keep, dtype=np.int64), deep=True)
+
+    # ==================================================
+
+    def column(self, index: str) -> np.ndarray | MeasurementArray:
+        """
+        The entries of column `index`, NaN where a row has none.
+
+        A copy of the value buffer for number columns and a `MeasurementArray`
+        if every row holds a `Measurement` (no boxing either way). Other
+        columns (integers, strings, mixed) are boxed into an object array like
+        `DataCluster.column`. Like for `DataCluster`, changing the result does
+        not change the cluster.
+        """
+        if index not in self._columns:
+            raise IndexError()
+
+        column = self._columns[index]
+        if column.mode == "float":
+            if not column.measured.any():
+                return column.values.copy()
+            if column.measured.all():
+                return MeasurementArray(column.values.copy(), column.errors.copy())
+
+        result = np.full(len(self), np.nan, dtype=object)
+        for pos in np.flatnonzero(column.mask):
+            value = column.cell(pos)
+            if not _is_missing_entry(value):
+                result[pos] = value
+        return result
+
+    def values(self, index: str) -> np.ndarray:
+        if index not in self._columns:
+            raise IndexError()
+        return self._columns[index].values.copy()
+
+    def errors(self, index: str) -> np.ndarray:
+        if index not in self._columns:
+            raise IndexError()
+        return self._columns[index].errors.copy()
+
+    def measurements(self, index: str) -> MeasurementArray:
+        return MeasurementArray(self.values(index), self.errors(index))
+
+    def mask(self, index: str) -> np.ndarray:
+        """Rows that have an entry in column `index`."""
+        if index not in self._columns:
+            raise IndexError()
+        return self._columns[index].mask.copy()
+
+def _to_column(value, *, copy: bool = True) -> _Column:
+    if isinstance(value, MeasurementArray):
+        return _Column.from_measurements(value, copy=copy)
+    if isinstance(value, np.ndarray) and value.dtype.kind == "f":
+        return _Column.from_floats(value, copy=copy)
+    return _Column.from_cells(list(value))
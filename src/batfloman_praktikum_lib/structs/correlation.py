@@ -0,0 +1,342 @@
+from contextlib import contextmanager
+from typing import Iterable, Sequence
+import numpy as np
+
+# ==================================================
+#    opt-in switch
+# ==================================================
+
+_tracking_enabled = False
+
+def enable_correlation_tracking(enabled: bool = True) -> None:
+    """
+    Switch linear error propagation with correlations on (or off).
+
+    While enabled, every measurement that takes part in a calculation carries a
+    sparse gradient over independent source variables, so e.g. `x - x` has
+    zero uncertainty and fit parameters keep their covariance. The value /
+    error buffers of a `MeasurementArray` carry no gradients, so arithmetic
+    with them raises a TypeError while tracking is enabled.
+    """
+    global _tracking_enabled
+    _tracking_enabled = bool(enabled)
+
+def is_correlation_tracking_enabled() -> bool:
+    return _tracking_enabled
+
+def untracked_operand_error(operand: str) -> TypeError:
+    return TypeError(
+        f"{operand} does not track correlations, use an object array of measurements "
+        "while correlation tracking is enabled"
+    )
+
+@contextmanager
+def track_correlations(enabled: bool = True):
+    """Context manager version of `enable_correlation_tracking`."""
+    global _tracking_enabled
+    previous = _tracking_enabled
+    _tracking_enabled = bool(enabled)
+    try:
+        yield
+    finally:
+        _tracking_enabled = previous
+
+# ==================================================
+#    gradients
+# ==================================================
+
+class _Source:
+    """Independent variable; only identity and standard deviation matter."""
+    __slots__ = ("std",)
+
+    def __init__(self, std: float):
+        self.std = float(std)
+
+type Gradient = dict[_Source, float]
+
+class _LinearCombination:
+    """
+    Pending gradient `sum(coefficient * gradient)` of a calculation result.
+
+    Results only link to the gradients of their inputs; the sum over the
+    sources is expanded once, when the error (or a covariance) is needed.
+    Chaining n operations therefore stays linear instead of copying a growing
+    gradient n times.
+    """
+    __slots__ = ("terms", "expanded")
+
+    def __init__(self, terms: "tuple[tuple[float, Gradient | _LinearCombination], ...]"):
+        self.terms = terms
+        self.expanded: Gradient | None = None
+
+type LazyGradient = Gradient | _LinearCombination
+
+def gradient_of(item) -> LazyGradient:
+    """
+    Gradient of a measurement (or number) over the independent sources.
+
+    Measurements without a gradient become their own independent source on
+    first use, numbers have an empty gradient. A gradient only belongs to the
+    error it was built for: after the error was changed in place
+    (`modify.set_error`, `modify.round`, ...) the measurement is a new
+    independent source.
+    """
+    gradient = getattr(item, "_gradient", None)
+    if gradient is not None and _error_pending(item):
+        return gradient
+    error = getattr(item, "error", None)
+    if gradient is not None and _same_error(getattr(item, "_gradient_error", None), error):
+        return gradient
+    if error is None:
+        return {}
+
+    gradient = {_Source(error): 1.0} if error != 0 else {}
+    attach_gradient(item, gradient)
+    return gradient
+
+def attach_gradient(item, gradient: LazyGradient) -> None:
+    item._gradient = gradient
+    item._gradient_error = item.error
+
+def attach_pending_gradient(item, gradient: LazyGradient) -> None:
+    """Attach `gradient` without computing the error, see `materialize_error`."""
+    item._gradient = gradient
+    item._gradient_error = None
+
+def materialize_error(item) -> float:
+    """Compute (and store) the error of a result whose gradient is still pending."""
+    error = error_from_gradient(item._gradient)
+    item.error = error
+    item._gradient_error = error
+    return error
+
+def _error_pending(item) -> bool:
+    # results of tracked calculations get their `error` attribute on first access
+    return "error" not in getattr(item, "__dict__", {"error": None})
+
+def _same_error(cached, error) -> bool:
+    return cached == error or (cached != cached and error != error)  # NaN == NaN
+
+def combine_gradients(terms: Iterable[tuple[float, LazyGradient]]) -> LazyGradient:
+    terms = tuple(
+        (float(coefficient), gradient)
+        for coefficient, gradient in terms
+        if coefficient != 0 and (isinstance(gradient, _LinearCombination) or gradient)
+    )
+    if not terms:
+        return {}
+    if len(terms) == 1 and terms[0][0] == 1.0:
+        return terms[0][1]
+    return _LinearCombination(terms)
+
+def expand_gradient(gradient: LazyGradient) -> Gradient:
+    """
+    Sum of a (pending) gradient over the sources.
+
+    The pending combinations form a DAG (results are reused); it is walked
+    once in topological order, accumulating the coefficient of every node
+    before passing it on to its inputs.
+    """
+    if not isinstance(gradient, _LinearCombination):
+        return gradient
+    if gradient.expanded is not None:
+        return gradient.expanded
+
+    # depth first post order -> reversed, every node comes before its inputs
+    order: list[_LinearCombination] = []
+    visited: set[int] = set()
+    stack: list[tuple[_LinearCombination, bool]] = [(gradient, False)]
+    while stack:
+        node, inputs_done = stack.pop()
+        if inputs_done:
+            order.append(node)
+            continue
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        stack.append((node, True))
+        for _, child in node.terms:
+            if _is_pending(child) and id(child) not in visited:
+                stack.append((child, False))
+
+    weights = {id(gradient): 1.0}
+    expanded: Gradient = {}
+    for node in reversed(order):
+        weight = weights.pop(id(node), 0.0)
+        if weight == 0:
+            continue
+        for coefficient, child in node.terms:
+            if _is_pending(child):
+                weights[id(child)] = weights.get(id(child), 0.0) + weight * coefficient
+                continue
+            if isinstance(child, _LinearCombination):
+                child = child.expanded
+            for source, derivative in child.items():
+                expanded[source] = expanded.get(source, 0.0) + weight * coefficient * derivative
+
+    gradient.expanded = expanded
+    gradient.terms = ()  # the inputs are no longer needed
+    return expanded
+
+def _is_pending(gradient: LazyGradient) -> bool:
+    return isinstance(gradient, _LinearCombination) and gradient.expanded is None
+
+def error_from_gradient(gradient: LazyGradient) -> float:
+    gradient = expand_gradient(gradient)
+    return float(np.sqrt(sum((derivative * source.std)**2 for source, derivative in gradient.items())))
+
+def covariance(a, b) -> float:
+    """Covariance of two measurements from their shared sources."""
+    grad_a = expand_gradient(gradient_of(a))
+    grad_b = expand_gradient(gradient_of(b))
+    if len(grad_b) < len(grad_a):
+        grad_a, grad_b = grad_b, grad_a
+    return float(sum(
+        derivative * grad_b[source] * source.std**2
+        for source, derivative in grad_a.items()
+        if source in grad_b
+    ))
+
+def covariance_matrix(measurements: Sequence) -> np.ndarray:
+    n = len(measurements)
+    cov = np.zeros((n, n), dtype=float)
+    for i in range(n):
+        for j in range(i, n):
+            cov[i, j] = cov[j, i] = covariance(measurements[i], measurements[j])
+    return cov
+
+# ==================================================
+#    partial derivatives of the supported ufuncs
+# ==================================================
+
+def ufunc_partials(ufunc, values: Sequence[float]) -> tuple[float, list[float]]:
+    """
+    Return `(value, [d/d input_0, d/d input_1, ...])` for `ufunc` at `values`.
+
+    Mirrors the propagation table in `measurementBase._propagate_ufunc`, but
+    keeps the sign of the derivatives (needed for correlations).
+    """
+    a = values[0]
+    b = values[1] if len(values) > 1 else None
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        match ufunc:
+            case np.add:
+                return a + b, [1.0, 1.0]
+            case np.subtract:
+                return a - b, [1.0, -1.0]
+            case np.multiply:
+                return a * b, [b, a]
+            case np.divide:
+                return a / b, [1 / b, -a / b**2]
+            case np.power:
+                val = np.power(a, b)
+                d_exp = val * np.log(a) if a > 0 else (0.0 if val == 0 else np.nan)
+                return val, [b * np.power(a, b - 1), d_exp]
+            case np.sqrt:
+                val = np.sqrt(a)
+                return val, [0.5 / val]
+
+            case np.sin:
+                return np.sin(a), [np.cos(a)]
+            case np.cos:
+                return np.cos(a), [-np.sin(a)]
+            case np.tan:
+                return np.tan(a), [1 / np.cos(a)**2]
+            case np.arcsin:
+                return np.arcsin(a), [1 / (1 - a**2)**0.5]
+            case np.arccos:
+                return np.arccos(a), [-1 / (1 - a**2)**0.5]
+            case np.arctan:
+                return np.arctan(a), [1 / (1 + a**2)]
+            case np.sinh:
+                return np.sinh(a), [np.cosh(a)]
+            case np.cosh:
+                return np.cosh(a), [np.sinh(a)]
+            case np.tanh:
+                return np.tanh(a), [1 / np.cosh(a)**2]
+            case np.arcsinh:
+                return np.arcsinh(a), [1 / np.sqrt(1 + a**2)]
+            case np.arccosh:
+                return np.arccosh(a), [1 / np.sqrt(a - 1) / np.sqrt(a + 1)]
+            case np.arctanh:
+                return np.arctanh(a), [1 / (1 - a**2)]
+
+            case np.exp:
+                val = np.exp(a)
+                return val, [val]
+            case np.log:
+                return np.log(a), [1 / a]
+            case np.log10:
+                return np.log10(a), [1 / a / np.log(10)]
+            case np.logaddexp:
+                val = np.logaddexp(a, b)
+                return val, [np.exp(a - val), np.exp(b - val)]
+            case _ if is_erf(ufunc):
+                return ufunc(a), [(2 / np.sqrt(np.pi)) * np.exp(-a**2)]
+
+            case np.rad2deg:
+                return np.rad2deg(a), [180 / np.pi]
+            case np.deg2rad:
+                return np.deg2rad(a), [np.pi / 180]
+            case np.abs:
+                return np.abs(a), [-1.0 if a < 0 else 1.0]
+            case np.negative:
+                return -a, [-1.0]
+            case np.positive:
+                return +a, [1.0]
+            case np.minimum:
+                first = a <= b or np.isnan(a)
+                return np.minimum(a, b), [1.0, 0.0] if first else [0.0, 1.0]
+            case np.maximum:
+                first = a >= b or np.isnan(a)
+                return np.maximum(a, b), [1.0, 0.0] if first else [0.0, 1.0]
+            case _:
+                raise NotImplementedError(f"not handled function: {ufunc}")
+
+def is_erf(ufunc) -> bool:
+    """`ufunc is scipy.special.erf`, without importing scipy before an erf shows up."""
+    if getattr(ufunc, "__name__", None) != "erf":
+        return False
+    from scipy.special import erf
+    return ufunc is erf
+
+# ==================================================
+#    seeding correlated values
+# ==================================================
+
+def correlated_values(values: Sequence[float], cov, errors: Sequence[float] | None = None) -> list:
+    """
+    Create measurements that share the covariance `cov`.
+
+    The covariance is decomposed into independent unit sources, so the
+    measurements stay correlated in later calculations. If `errors` is given
+    the correlation structure of `cov` is kept but rescaled to these errors
+    (e.g. ODR reports `sd_beta` scaled by the residual variance).
+    """
+    from .measurement import Measurement
+
+    values = np.asarray(values, dtype=float)
+    cov = np.asarray(cov, dtype=float)
+
+    if errors is not None:
+        errors = np.asarray(errors, dtype=float)
+        std = np.sqrt(np.clip(np.diag(cov), 0, None))
+        scale = np.divide(errors, std, out=np.zeros_like(errors), where=std > 0)
+        cov = cov * np.outer(scale, scale)
+
+    eigenvalues, eigenvectors = np.linalg.eigh(cov)
+    transform = eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+    sources = [_Source(1.0) for _ in range(len(values))]
+
+    measurements = []
+    for i, value in enumerate(values):
+        gradient = {
+            source: float(transform[i, k])
+            for k, source in enumerate(sources)
+            if transform[i, k] != 0
+        }
+        measurement = Measurement.from_value_error(value, error_from_gradient(gradient))
+        attach_gradient(measurement, gradient)
+        measurements.append(measurement)
+    return measurements
@@ -1,11 +1,14 @@
 from dataclasses import asdict
 from pathlib import Path
+import io
+import itertools
+import sys
 import numpy as np
 import pandas as pd
 import re
 import copy
 from collections.abc import Mapping, Sequence
-from typing import List, Union, Callable, Optional, Iterable
+from typing import List, Union, Callable, Optional, Iterable, TextIO
 
 from batfloman_praktikum_lib.structs.measurement import Measurement
 from batfloman_praktikum_lib.structs.dataset import Dataset 
@@ -69,6 +72,50 @@ def _parse_embedded_measurement(value):
     except (TypeError, ValueError):
         return None
 
+# rows written per `write` by `DataCluster.to_string`
+_PRINT_BLOCK_ROWS = 1000
+
+def _truncated_positions(length: int, limit: int | None) -> list[int | None]:
+    """Positions to show: all, or head and tail around `None` (the `...`)."""
+    # `...` in place of a single entry would hide nothing
+    if limit is None or length <= limit + 1:
+        return list(range(length))
+    head = max((limit + 1) // 2, 1)
+    tail = max(limit - head, 1)
+    return [*range(head), None, *range(length - tail, length)]
+
+def _display_column(cells: list) -> list[str]:
+    """The cells of one column as `DataCluster.__str__` prints them."""
+    from batfloman_praktikum_lib.io.formatters import format_many
+
+    def to_str(value) -> str:
+        try:
+            return str(value)
+        except Exception:
+            return repr(value)
+
+    formatted = []
+    measurement_indices = []
+    for idx, value in enumerate(cells):
+        if value is None or (isinstance(value, str) and value.strip() == ""):
+            formatted.append("-")
+        elif isinstance(value, Measurement):
+            formatted.append(None)
+            measurement_indices.append(idx)
+        else:
+            formatted.append(to_str(value))
+
+    if measurement_indices:
+        measurements = [cells[idx] for idx in measurement_indices]
+        try:
+            strings = format_many(measurements)
+        except Exception:
+            strings = [to_str(m) for m in measurements]
+        for idx, string in zip(measurement_indices, strings):
+            formatted[idx] = string
+    return formatted
+
+
 def _df_to_Dataset_arr(df: pd.DataFrame):
     arr = []
 
@@ -324,6 +371,19 @@ class DataCluster:
             dtype=float,
         )
 
+    def measurements(self, index: str) -> "MeasurementArray":
+        """Column `index` as an unboxed `MeasurementArray`."""
+        from batfloman_praktikum_lib.structs.measurementArray import MeasurementArray
+        return MeasurementArray(self.values(index), self.errors(index))
+
+    def to_columnar(self) -> "ColumnarDataCluster":
+        """Copy into the column-oriented storage backend."""
+        from batfloman_praktikum_lib.structs.columnarDataCluster import ColumnarDataCluster
+
+        cluster = ColumnarDataCluster(self.data)
+        cluster.metadata_manager = copy.deepcopy(self.metadata_manager)
+        return cluster
+
     # ==================================================
 
     def to_numpy(self, use_indicies = None, exclude_indicies = None, with_header=True) -> np.ndarray:
@@ -392,12 +452,12 @@ class DataCluster:
         return np.vstack([header, data]) # plop header on top
 
     def _format_column_data(self, index):
-        from batfloman_praktikum_lib.io.latex.formatter.format_tables import format_table_value
+        from batfloman_praktikum_lib.io.latex.formatter.format_tables import format_table_column
 
         column_data = self.column(index)
         metadata = self.metadata_manager.get_metadata(index);
 
-        return [format_table_value(value, metadata) for value in column_data]
+        return format_table_column(column_data, metadata)
 
     # ==================================================
 
@@ -452,47 +512,81 @@ class DataCluster:
     #     return DataCluster.from_json(json_str)
 
     # ==================================================
+    # printing
 
-    def __str__(self):
-        columns = self.get_column_names()
-
-        # Prepare rows as lists of strings exactly how they will be printed
-        rows = []
-        for row in self:
-            arr = [(row[i] if i in row else "-") for i in columns]
+    # like pandas: longer / wider tables are shown as head ... tail (None: no limit)
+    display_max_rows: int | None = 60
+    display_max_columns: int | None = 20
 
-            def is_empty_or_none(value):
-                return value is None or (isinstance(value, str) and value.strip() == "")
-
-            def to_str(value) -> str:
-                try:
-                    if isinstance(value, Measurement):
-                        return f"{value}"
-                    return str(value)
-                except Exception:
-                    return repr(value)
-
-
-            arr = [("-" if is_empty_or_none(x) else to_str(x)) for x in arr]
-            rows.append(arr)
-
-        # Compute column widths based on both headers and formatted rows
-        column_widths = [
-            max(len(columns[i]), *(len(r[i]) for r in rows))
-            for i in range(len(columns))
-        ]
-
-        # Build table string
-        table = " | ".join(f"{col:{w}}" for col, w in zip(columns, column_widths)) + "\n"
-        table += "-+-".join("-" * w for w in column_widths) + "\n"
-
-        for arr in rows:
-            table += " | ".join(f"{val:<{w}}" for val, w in zip(arr, column_widths)) + "\n"
-
-        return table
-
-    def print(self):
-        print(self.__str__())
+    def __str__(self):
+        return self.to_string()
+
+    def to_string(
+        self,
+        buf: TextIO | None = None,
+        *,
+        full: bool = False,
+        max_rows: int | None = None,
+        max_columns: int | None = None,
+    ) -> str | None:
+        """
+        The table as text, as `print` shows it.
+
+        Only the first and last rows / columns are formatted if the table is
+        larger than `max_rows` / `max_columns` (default: `display_max_rows` /
+        `display_max_columns`), the skipped part is marked with `...`.
+        `full=True` shows every row and column. With `buf` the table is
+        written into it (row block by row block) and `None` is returned.
+        """
+        if not full:
+            max_rows = self.display_max_rows if max_rows is None else max_rows
+            max_columns = self.display_max_columns if max_columns is None else max_columns
+        else:
+            max_rows = max_columns = None
+
+        names = self.get_column_names()
+        shown_columns = _truncated_positions(len(names), max_columns)
+        shown_rows = _truncated_positions(len(self), max_rows)
+        rows = [self[pos] for pos in shown_rows if pos is not None]
+
+        header = []
+        columns = []
+        for pos in shown_columns:
+            if pos is None:
+                header.append("...")
+                columns.append(["..."] * len(rows))
+                continue
+            name = names[pos]
+            header.append(name)
+            columns.append(_display_column([(row[name] if name in row else "-") for row in rows]))
+
+        # widths only from what is shown
+        widths = [max([len(name), *map(len, column)]) for name, column in zip(header, columns)]
+
+        out = io.StringIO() if buf is None else buf
+        out.write(" | ".join(f"{name:{w}}" for name, w in zip(header, widths)) + "\n")
+        out.write("-+-".join("-" * w for w in widths) + "\n")
+
+        # rows without any (shown) column are printed as empty lines
+        lines = zip(*columns) if columns else itertools.repeat(())
+        for start in range(0, len(shown_rows), _PRINT_BLOCK_ROWS):
+            block = []
+            for pos in shown_rows[start:start + _PRINT_BLOCK_ROWS]:
+                cells = ["..."] * len(widths) if pos is None else next(lines)
+                block.append(" | ".join(f"{cell:<{w}}" for cell, w in zip(cells, widths)) + "\n")
+            out.write("".join(block))
+
+        if None in shown_rows or None in shown_columns:
+            out.write(f"\n[{len(self)} rows x {len(names)} columns]\n")
+
+        return out.getvalue() if buf is None else None
+
+    def print(self, *, full: bool = False):
+        if full:
+            self.to_string(sys.stdout, full=True)
+            print()
+        else:
+            print(self.__str__())
 
     def to_dict(self) -> dict:
         return {
@@ -531,3 +625,12 @@ class DataCluster:
     def load_json(cls, path: PathInput) -> "DataCluster":
         from batfloman_praktikum_lib.io.json import load_json
         return load_json(path)
+
+    def save_npz(self, path: PathInput, *, compressed: bool = False) -> Path:
+        from batfloman_praktikum_lib.io.npz import save_npz
+        return save_npz(self, path, compressed=compressed)
+
+    @classmethod
+    def load_npz(cls, path: PathInput, *, mmap: bool = False) -> "ColumnarDataCluster":
+        from batfloman_praktikum_lib.io.npz import load_npz
+        return load_npz(path, mmap=mmap)
@@ -0,0 +1,319 @@
+from collections.abc import Iterable
+import numpy as np
+
+from .. import util
+from ..significant_rounding.core import round_sig_array, round_sig_fixed_array
+from . import correlation
+from .measurementBase import _COMPARISON_UFUNCS, MeasurementBase, _get_value_and_error, _propagate_ufunc
+from .measurement import Measurement
+
+class MeasurementArray:
+    """
+    Column of measurements stored as two contiguous float64 buffers.
+
+    Behaves like an array of `Measurement` objects, but numpy ufuncs,
+    arithmetic, indexing and concatenation work on the `value` / `error`
+    buffers directly, without creating one Python object per entry.
+    Only integer indexing and iteration return (boxed) `Measurement`s.
+
+    `np.sum`, `np.prod`, `np.mean` and `np.concatenate` propagate the errors
+    as well; other numpy functions raise a TypeError instead of silently
+    working on the nominal values (`np.asarray` still returns those).
+    """
+    __array_priority__ = 20000
+
+    def __init__(self, values, errors=None):
+        if errors is None and isinstance(values, MeasurementArray):
+            values, errors = values.value, values.error
+        elif errors is None and _contains_measurements(values):
+            values, errors = _get_value_and_error(np.asarray(values, dtype=object))
+
+        value = np.asarray(values, dtype=float)
+        error = np.zeros_like(value) if errors is None else np.asarray(errors, dtype=float)
+
+        if value.shape != error.shape:
+            shape = np.broadcast_shapes(value.shape, error.shape)
+            value = np.broadcast_to(value, shape).copy()
+            error = np.broadcast_to(error, shape).copy()
+
+        self.value = value
+        self.error = error
+
+    @classmethod
+    def from_measurements(cls, measurements: Iterable) -> "MeasurementArray":
+        """Unpack a sequence (or object array) of measurements / numbers once."""
+        values, errors = _get_value_and_error(np.asarray(list(measurements), dtype=object))
+        return cls(values, errors)
+
+    @classmethod
+    def concatenate(cls, arrays: Iterable, axis: int = 0) -> "MeasurementArray":
+        parts = [item if isinstance(item, MeasurementArray) else cls(item) for item in arrays]
+        return cls(
+            np.concatenate([part.value for part in parts], axis=axis),
+            np.concatenate([part.error for part in parts], axis=axis),
+        )
+
+    def to_object_array(self) -> np.ndarray:
+        """Box every entry into a `Measurement` (the legacy representation)."""
+        boxed = np.empty(self.shape, dtype=object)
+        for idx in np.ndindex(self.shape):
+            boxed[idx] = Measurement(self.value[idx], self.error[idx])
+        return boxed
+
+    def copy(self) -> "MeasurementArray":
+        return MeasurementArray(self.value.copy(), self.error.copy())
+
+    def round(self, additional_digits=0) -> "MeasurementArray":
+        """Every entry rounded relative to its uncertainty, like `Measurement.round`."""
+        exponent = util.get_exponent_significant(self.error)
+        return self.round_digit(-exponent + additional_digits)
+
+    def round_digit(self, digits=0) -> "MeasurementArray":
+        """Round values and uncertainties to fixed decimal positions (per entry or for all)."""
+        return MeasurementArray(*round_sig_fixed_array(self.value, self.error, digits))
+
+    def round_sig(self) -> "MeasurementArray":
+        """DIN rounding of every entry to the significant digit of its uncertainty."""
+        return MeasurementArray(*round_sig_array(self.value, self.error))
+
+    # ==================================================
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.value.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.value.ndim
+
+    @property
+    def size(self) -> int:
+        return self.value.size
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, index):
+        if isinstance(index, MeasurementArray):
+            index = index.value
+        value = self.value[index]
+        error = self.error[index]
+        if np.ndim(value) == 0:
+            return Measurement(value, error)
+        return MeasurementArray(value, error)
+
+    def __setitem__(self, index, item):
+        value, error = _get_value_and_error(item)
+        self.value[index] = value
+        self.error[index] = error
+
+    def __iter__(self):
+        for value, error in zip(self.value, self.error):
+            if np.ndim(value) == 0:
+                yield Measurement(value, error)
+            else:
+                yield MeasurementArray(value, error)
+
+    def __array__(self, dtype=None, copy=None):
+        # plain numpy conversion sees the nominal values, like `float(Measurement)`
+        if copy:
+            return np.array(self.value, dtype=dtype)
+        return np.asarray(self.value, dtype=dtype)
+
+    # ==================================================
+    #     numpy compatibility
+    # ==================================================
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method == "reduce":
+            return _reduce(ufunc, *inputs, **kwargs)
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if correlation.is_correlation_tracking_enabled() and ufunc not in _COMPARISON_UFUNCS:
+            # the buffers have no gradients: `a - a` would silently get an error
+            raise correlation.untracked_operand_error("MeasurementArray")
+
+        values = []
+        errors = []
+        for item in inputs:
+            value, error = _get_value_and_error(item)
+            values.append(value)
+            errors.append(error)
+
+        val, err = _propagate_ufunc(ufunc, values, errors)
+        if err is None:
+            return val
+        return MeasurementArray(val, err)
+
+    def __array_function__(self, func, types, args, kwargs):
+        # everything else would see the bare values (`__array__`) and drop the
+        # errors; numpy raises a TypeError for NotImplemented instead
+        handler = _ARRAY_FUNCTIONS.get(func)
+        if handler is None:
+            return NotImplemented
+        return handler(*args, **kwargs)
+
+    # ==================================================
+    #     Comparison operations
+    # ==================================================
+
+    def __lt__(self, other):
+        return np.less(self, other)
+
+    def __le__(self, other):
+        return np.less_equal(self, other)
+
+    def __eq__(self, other):
+        return np.equal(self, other)
+
+    def __ne__(self, other):
+        return np.not_equal(self, other)
+
+    def __ge__(self, other):
+        return np.greater_equal(self, other)
+
+    def __gt__(self, other):
+        return np.greater(self, other)
+
+    __hash__ = None
+
+    # ==================================================
+    #     Math Operations
+    # ==================================================
+
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    def __sub__(self, other):
+        return np.subtract(self, other)
+
+    def __rsub__(self, other):
+        return np.subtract(other, self)
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    def __truediv__(self, other):
+        return np.divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.divide(other, self)
+
+    def __pow__(self, other):
+        return np.power(self, other)
+
+    def __rpow__(self, other):
+        return np.power(other, self)
+
+    def __neg__(self):
+        return MeasurementArray(-self.value, self.error.copy())
+
+    def __pos__(self):
+        return self.copy()
+
+    def __abs__(self):
+        return np.abs(self)
+
+    # ==================================================
+
+    def __str__(self):
+        if self.ndim != 1:
+            return repr(self)
+        if len(self) <= 10:
+            return "[" + ", ".join(str(item) for item in self) + "]"
+        head = ", ".join(str(item) for item in self[:3])
+        tail = ", ".join(str(item) for item in self[-3:])
+        return f"[{head}, ..., {tail}]"
+
+    def __repr__(self):
+        return f"MeasurementArray(value={self.value!r}, error={self.error!r})"
+
+# ==================================================
+#     reductions
+# ==================================================
+
+def _wrap(value, error):
+    if np.ndim(value) == 0:
+        return Measurement(value, error)
+    return MeasurementArray(value, error)
+
+def _sum(value, error, axis, keepdims):
+    return (
+        np.sum(value, axis=axis, keepdims=keepdims),
+        np.sqrt(np.sum(error**2, axis=axis, keepdims=keepdims)),
+    )
+
+def _prod(value, error, axis, keepdims):
+    if axis is None:
+        product, product_error = _prod(value.ravel(), error.ravel(), 0, False)
+        if keepdims:
+            return np.reshape(product, (1,) * value.ndim), np.reshape(product_error, (1,) * value.ndim)
+        return product, product_error
+    if not isinstance(axis, (int, np.integer)):
+        raise NotImplementedError("product of a MeasurementArray over several axes at once")
+
+    # d prod / d x_i = product of all other entries (without dividing, so zeros work)
+    value_last = np.moveaxis(value, axis, -1)
+    ones = np.ones(value_last.shape[:-1] + (1,))
+    before = np.cumprod(np.concatenate([ones, value_last[..., :-1]], axis=-1), axis=-1)
+    after = np.cumprod(np.concatenate([ones, value_last[..., :0:-1]], axis=-1), axis=-1)[..., ::-1]
+    partial_error = before * after * np.moveaxis(error, axis, -1)
+
+    product = np.prod(value, axis=axis)
+    product_error = np.sqrt(np.sum(partial_error**2, axis=-1))
+    if keepdims:
+        return np.expand_dims(product, axis), np.expand_dims(product_error, axis)
+    return product, product_error
+
+_REDUCTIONS = {
+    np.add: _sum,
+    np.multiply: _prod,
+}
+
+def _reduce(ufunc, array, axis=0, dtype=None, out=None, keepdims=False, **kwargs):
+    """`np.add.reduce` / `np.multiply.reduce` with error propagation (independent errors)."""
+    reduction = _REDUCTIONS.get(ufunc)
+    if reduction is None or dtype is not None or out is not None or kwargs:
+        return NotImplemented
+    if correlation.is_correlation_tracking_enabled():
+        raise correlation.untracked_operand_error("MeasurementArray")
+    return _wrap(*reduction(array.value, array.error, axis, keepdims))
+
+def _array_sum(a, axis=None, dtype=None, out=None, keepdims=False):
+    return np.add.reduce(a, axis=axis, dtype=dtype, out=out, keepdims=keepdims)
+
+def _array_prod(a, axis=None, dtype=None, out=None, keepdims=False):
+    return np.multiply.reduce(a, axis=axis, dtype=dtype, out=out, keepdims=keepdims)
+
+def _array_mean(a, axis=None, dtype=None, out=None, keepdims=False):
+    total = np.add.reduce(a, axis=axis, dtype=dtype, out=out, keepdims=keepdims)
+    count = a.size // max(np.size(total.value), 1)
+    return total / count
+
+def _array_concatenate(arrays, axis=0):
+    return MeasurementArray.concatenate(arrays, axis=axis)
+
+_ARRAY_FUNCTIONS = {
+    np.sum: _array_sum,
+    np.prod: _array_prod,
+    np.mean: _array_mean,
+    np.concatenate: _array_concatenate,
+    np.shape: lambda a: a.shape,
+    np.ndim: lambda a: a.ndim,
+    np.size: lambda a, axis=None: a.size if axis is None else a.shape[axis],
+}
+
+def _contains_measurements(values) -> bool:
+    if isinstance(values, np.ndarray):
+        if values.dtype != object:
+            return False
+        return any(isinstance(item, MeasurementBase) for item in values.flat)
+    if isinstance(values, (list, tuple)):
+        return any(isinstance(item, MeasurementBase) for item in values)
+    return False
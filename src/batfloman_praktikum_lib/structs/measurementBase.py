@@ -1,9 +1,10 @@
 import numpy as np
-from scipy.special import erf
 import re
 
 from typing import Literal, Sequence, Tuple, TypeAlias, Union
 
+from . import correlation
+
 # ==================================================
 
 ConvertibleToFloat = Union[float, int, np.integer, np.floating]
@@ -66,13 +67,43 @@ def _get_value_and_error(other) -> Tuple[float, float]:
             errors = np.zeros_like(values, dtype=float)
             return (values, errors)
 
-        values = np.vectorize(lambda item: _get_value_and_error(item)[0], otypes=[float])(other)
-        errors = np.vectorize(lambda item: _get_value_and_error(item)[1], otypes=[float])(other)
-        return (values, errors)
+        return _unpack_object_array(other)
     elif isinstance(other, ConvertibleToFloat):
         return (float(other), 0.0)
+    elif _is_measurement_array(other):
+        return (other.value, other.error)
     raise TypeError(f"Unsupported type: {type(other)}")
 
+def _unpack_object_array(arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # one pass per buffer instead of a full `_get_value_and_error` call per item
+    items = arr.ravel()
+    values = np.fromiter(
+        (item.value if isinstance(item, MeasurementBase) else float(item) for item in items),
+        dtype=float,
+        count=items.size,
+    )
+    errors = np.fromiter(
+        (item.error if isinstance(item, MeasurementBase) else 0.0 for item in items),
+        dtype=float,
+        count=items.size,
+    )
+    return (values.reshape(arr.shape), errors.reshape(arr.shape))
+
+# resolved on first use (measurementArray imports this module)
+_MeasurementArray: type | None = None
+
+def _is_measurement_array(other) -> bool:
+    global _MeasurementArray
+    if _MeasurementArray is None:
+        from .measurementArray import MeasurementArray
+        _MeasurementArray = MeasurementArray
+    return isinstance(other, _MeasurementArray)
+
+def _is_array_operand(other) -> bool:
+    if isinstance(other, (MeasurementBase, float, int, np.number)):
+        return False
+    return isinstance(other, np.ndarray) or _is_measurement_array(other)
+
 def _combine_errors(
     errors: Sequence[float],
     method: ErrorCombinationMethod = "linear",
@@ -92,6 +123,8 @@ def _get_value(other):
         return _get_value_and_error(other)[0]
     elif isinstance(other, ConvertibleToFloat):
         return float(other)
+    elif _is_measurement_array(other):
+        return other.value
     raise TypeError(f"Unsupported type: {type(other)}")
 
 
@@ -99,12 +132,199 @@ def _safe_power(base, exp):
     with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
         return np.power(base, exp)
 
+_COMPARISON_UFUNCS = (
+    np.isnan,
+    np.less,
+    np.less_equal,
+    np.equal,
+    np.not_equal,
+    np.greater_equal,
+    np.greater,
+)
+
+def _propagate_ufunc(ufunc, values, errors):
+    """
+    Apply `ufunc` to nominal values and propagate the (independent) errors.
+
+    Works on scalars and arrays alike. Returns `(value, error)`; for ufuncs
+    that do not produce a measurement (comparisons, `isnan`) the error is `None`.
+    """
+    match ufunc:
+        # --------------------
+        # math operations
+
+        case np.add:
+            val = values[0] + values[1]
+            d1 = errors[0]
+            d2 = errors[1]
+            err = (d1**2 + d2**2)**.5
+        case np.subtract:
+            val = values[0] - values[1]
+            d1 = errors[0]
+            d2 = -errors[1]
+            err = (d1**2 + d2**2)**.5
+
+        case np.multiply:
+            val = values[0] * values[1]
+            d1 = (errors[0] * values[1])
+            d2 = (values[0] * errors[1])
+            err = (d1**2 + d2**2)**.5
+        case np.divide:
+            val = values[0] / values[1]
+            d1 = errors[0] / values[1]
+            d2 = - values[0] * errors[1] / values[1]**2
+            err = (d1**2 + d2**2)**.5
+
+        case np.sqrt:
+            val = np.sqrt(values[0])
+            err = .5 * errors[0] / np.sqrt(values[0])
+        case np.power:
+            base = values[0]
+            exp = values[1]
+            val = _safe_power(base, exp)
+            d_base = exp * _safe_power(base, exp - 1) * errors[0]
+
+            d_exp = 0.0
+            if np.any(np.asarray(errors[1]) != 0):
+                with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                    d_exp = np.where(
+                        base > 0,
+                        val * np.log(base) * errors[1],
+                        np.nan,
+                    )
+
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                err = np.sqrt(d_base**2 + d_exp**2)
+
+        # --------------------
+        # trig
+
+        case np.sin:
+            val = np.sin(values[0])
+            err = np.abs(np.cos(values[0]) * errors[0])
+        case np.cos:
+            val = np.cos(values[0])
+            err = np.abs(np.sin(values[0]) * errors[0])
+        case np.tan:
+            val = np.tan(values[0])
+            err = errors[0] / np.cos(values[0])**2
+
+        case np.arcsin:
+            val = np.arcsin(values[0])
+            err = errors[0] / (1 - values[0]**2)**0.5
+        case np.arccos:
+            val = np.arccos(values[0])
+            err = errors[0] / (1 - values[0]**2)**0.5
+        case np.arctan:
+            val = np.arctan(values[0])
+            err = errors[0] / (1 + values[0]**2)
+
+        case np.sinh:
+            val = np.sinh(values[0])
+            err = np.abs(np.cosh(values[0]) * errors[0])
+        case np.cosh:
+            val = np.cosh(values[0])
+            err = np.abs(np.sinh(values[0]) * errors[0])
+        case np.tanh:
+            val = np.tanh(values[0])
+            err = errors[0] / np.cosh(values[0])**2
+
+        case np.arcsinh:
+            val = np.arcsinh(values[0])
+            err = errors[0] / np.sqrt(1 + values[0]**2)
+        case np.arccosh:
+            val = np.arccosh(values[0])
+            err = errors[0] / np.sqrt(values[0] - 1) / np.sqrt(values[0] + 1)
+        case np.arctanh:
+            val = np.arctanh(values[0])
+            err = errors[0] / (1 - values[0]**2)
+
+        # --------------------
+        # exp,log
+
+        case np.exp:
+            val = np.exp(values[0])
+            err = np.exp(values[0]) * errors[0]
+        case np.log:
+            val = np.log(values[0])
+            err = errors[0] / values[0]
+        case np.log10:
+            val = np.log10(values[0])
+            err = errors[0] / values[0] / np.log(10)
+        case np.logaddexp:
+            val = np.logaddexp(values[0], values[1])
+            d1 = np.exp(values[0] - val) * errors[0]
+            d2 = np.exp(values[1] - val) * errors[1]
+            err = (d1**2 + d2**2)**.5
+
+        # --------------------
+        # speical boys 
+
+        case _ if correlation.is_erf(ufunc):
+            val = ufunc(values[0])
+            err = np.abs((2 / np.sqrt(np.pi)) * np.exp(-values[0]**2) * errors[0])
+
+        # --------------------
+        # modifications
+
+        case np.rad2deg:
+            val = np.rad2deg(values[0])
+            err = np.rad2deg(errors[0])
+        case np.deg2rad:
+            val = np.deg2rad(values[0])
+            err = np.deg2rad(errors[0])
+        case np.abs:
+            val = np.abs(values[0])
+            err = np.copy(errors[0])
+        case np.negative:
+            val = np.negative(values[0])
+            err = np.copy(errors[0])
+        case np.positive:
+            val = np.positive(values[0])
+            err = np.copy(errors[0])
+        case np.minimum:
+            val = np.minimum(values[0], values[1])
+            err = np.where(
+                (values[0] <= values[1]) | np.isnan(values[0]),
+                errors[0],
+                errors[1],
+            )
+        case np.maximum:
+            val = np.maximum(values[0], values[1])
+            err = np.where(
+                (values[0] >= values[1]) | np.isnan(values[0]),
+                errors[0],
+                errors[1],
+            )
+        case np.isnan:
+            return np.isnan(values[0]), None
+        case np.less:
+            return values[0] < values[1], None
+        case np.less_equal:
+            return values[0] <= values[1], None
+        case np.equal:
+            return values[0] == values[1], None
+        case np.not_equal:
+            return values[0] != values[1], None
+        case np.greater_equal:
+            return values[0] >= values[1], None
+        case np.greater:
+            return values[0] > values[1], None
+        case _:
+            raise NotImplementedError(f"not handled function: {ufunc}")
+
+    return val, err
+
 # ==================================================
 #    Class
 # ==================================================
 
 class MeasurementBase:
     __array_priority__ = 10000
+    # sparse gradient over independent sources, only used with correlation tracking
+    _gradient: "correlation.Gradient | None" = None
+    # the error `_gradient` belongs to (stale once the error is changed in place)
+    _gradient_error: float | None = None
 
     def __init__(
         self,
@@ -141,11 +361,75 @@ class MeasurementBase:
 
     @classmethod
     def from_value_error(cls, value, error):
-        return cls(value, error)
+        # results of calculations are already numeric -> skip the input parsing of `__init__`
+        measurement = cls.__new__(cls)
+        measurement.value = float(value)
+        measurement.error = abs(float(error))
+        return measurement
 
     def _from_value_error(self, value: float, error: float):
         return self.__class__.from_value_error(value, error)
 
+    def _from_value_error_array(self, value, error):
+        value, error = np.broadcast_arrays(value, error)
+        return np.frompyfunc(self.__class__.from_value_error, 2, 1)(value, error)
+
+    def _correlated_op(self, ufunc, *inputs):
+        values = [_get_value(item) for item in inputs]
+        value, partials = correlation.ufunc_partials(ufunc, values)
+        gradient = correlation.combine_gradients(
+            (partial, correlation.gradient_of(item))
+            for partial, item in zip(partials, inputs)
+        )
+
+        # the error is only summed up from the gradient when it is accessed (`__getattr__`)
+        result = self.__class__.__new__(self.__class__)
+        result.value = float(value)
+        correlation.attach_pending_gradient(result, gradient)
+        return result
+
+    def __getattr__(self, name):
+        # only called for missing attributes, i.e. the pending error of a tracked result
+        if name == "error" and self._gradient is not None:
+            return correlation.materialize_error(self)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _correlated_elementwise(self, ufunc, *inputs):
+        # no np.frompyfunc here: it is a ufunc itself and would dispatch back to us
+        arrays = np.broadcast_arrays(*(np.asarray(item, dtype=object) for item in inputs))
+        result = np.empty(arrays[0].shape, dtype=object)
+        for idx in np.ndindex(result.shape):
+            result[idx] = self._correlated_op(ufunc, *(array[idx] for array in arrays))
+        return result
+
+    def _array_op(self, ufunc, left, right):
+        """
+        Batched path for operations with an array operand.
+
+        Both operands are unpacked into value/error buffers once and the result
+        is computed in one vectorized expression. `MeasurementArray` operands
+        stay unboxed; object arrays get an object array of measurements back.
+        """
+        if correlation.is_correlation_tracking_enabled():
+            if _is_measurement_array(left) or _is_measurement_array(right):
+                raise correlation.untracked_operand_error("MeasurementArray")
+            # gradients live on the individual measurements
+            return self._correlated_elementwise(ufunc, left, right)
+
+        values = []
+        errors = []
+        for item in (left, right):
+            value, error = _get_value_and_error(item)
+            values.append(value)
+            errors.append(error)
+
+        value, error = _propagate_ufunc(ufunc, values, errors)
+
+        if _is_measurement_array(left) or _is_measurement_array(right):
+            from .measurementArray import MeasurementArray
+            return MeasurementArray(value, error)
+        return self._from_value_error_array(value, error)
+
     def _parse_error_value(self, error: str | ConvertibleToFloat) -> float:
         if isinstance(error, str):
             error = _parse_uncertainty_str(self.value, error)
@@ -184,6 +468,11 @@ class MeasurementBase:
     # addition
 
     def __add__(self, other):
+        if _is_array_operand(other):
+            return self._array_op(np.add, self, other)
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.add, self, other)
+
         other_val, other_err = _get_value_and_error(other)
 
         new_value = self.value + other_val
@@ -195,6 +484,11 @@ class MeasurementBase:
         return self.__add__(other)
 
     def __sub__(self, other):
+        if _is_array_operand(other):
+            return self._array_op(np.subtract, self, other)
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.subtract, self, other)
+
         other_val, other_err = _get_value_and_error(other)
 
         new_value = self.value - other_val
@@ -203,14 +497,21 @@ class MeasurementBase:
         return self._from_value_error(new_value, new_uncertainty)
 
     def __rsub__(self, other):
+        if _is_array_operand(other):
+            return self._array_op(np.subtract, other, self)
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.subtract, other, self)
+
         return (-self).__add__(other)
 
     # ==================================================
     # multiplication
 
     def __mul__(self, other):
-        if isinstance(other, np.ndarray):
-            return np.array([self * o for o in other])
+        if _is_array_operand(other):
+            return self._array_op(np.multiply, self, other)
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.multiply, self, other)
 
         other_val, other_err = _get_value_and_error(other)
 
@@ -225,6 +526,11 @@ class MeasurementBase:
         return self.__mul__(other)
 
     def __truediv__(self, other):
+        if _is_array_operand(other):
+            return self._array_op(np.divide, self, other)
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.divide, self, other)
+
         other_val, other_err = _get_value_and_error(other)
 
         new_value = self.value / other_val
@@ -235,6 +541,11 @@ class MeasurementBase:
         return self._from_value_error(new_value, new_uncertainty)
 
     def __rtruediv__(self, other):
+        if _is_array_operand(other):
+            return self._array_op(np.divide, other, self)
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.divide, other, self)
+
         other_val, other_err = _get_value_and_error(other)
 
         new_value = other_val / self.value
@@ -248,9 +559,13 @@ class MeasurementBase:
     # operators & advanced func
 
     def __neg__(self):
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.negative, self)
         return self._from_value_error(-self.value, self.error)
 
     def __abs__(self):
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.abs, self)
         return self._from_value_error(abs(self.value), self.error)
 
     def __mod__(self, other):
@@ -259,6 +574,11 @@ class MeasurementBase:
         return self._from_value_error(val, err)
 
     def __pow__(self, other):
+        if _is_array_operand(other):
+            return self._array_op(np.power, self, other)
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.power, self, other)
+
         other_val, other_err = _get_value_and_error(other)
 
         value = _safe_power(self.value, other_val)
@@ -277,6 +597,11 @@ class MeasurementBase:
         return self._from_value_error(value, error)
 
     def __rpow__(self, other):
+        if _is_array_operand(other):
+            return self._array_op(np.power, other, self)
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.power, other, self)
+
         other_val, other_err = _get_value_and_error(other)
 
         value = _safe_power(other_val, self.value)
@@ -297,12 +622,16 @@ class MeasurementBase:
     # numpy compatibility
 
     def sin(self):
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.sin, self)
         val = np.sin(self.value)
         err = np.abs(np.cos(self.value) * self.error)
 
         return self._from_value_error(val, err)
 
     def sqrt(self):
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.sqrt, self)
         val = np.sqrt(self.value)
         err = 0.5 * self.error / val
         return self._from_value_error(val, err)
@@ -314,6 +643,8 @@ class MeasurementBase:
         return np.log10(self)
 
     def deg2rad(self):
+        if correlation.is_correlation_tracking_enabled():
+            return self._correlated_op(np.deg2rad, self)
         val = np.deg2rad(self.value)
         err = np.deg2rad(self.error)
         return self._from_value_error(val, err)
@@ -327,6 +658,13 @@ class MeasurementBase:
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         if method != "__call__":
             return NotImplemented
+        if any(_is_measurement_array(item) for item in inputs):
+            return NotImplemented
+
+        if correlation.is_correlation_tracking_enabled() and ufunc not in _COMPARISON_UFUNCS:
+            if all(np.ndim(item) == 0 for item in inputs):
+                return self._correlated_op(ufunc, *inputs)
+            return self._correlated_elementwise(ufunc, *inputs)
 
         values = []
         errors = []
@@ -335,169 +673,14 @@ class MeasurementBase:
             values.append(value)
             errors.append(error)
 
-        match ufunc:
-            # --------------------
-            # math operations
-
-            case np.add:
-                val = values[0] + values[1]
-                d1 = errors[0]
-                d2 = errors[1]
-                err = (d1**2 + d2**2)**.5
-            case np.subtract:
-                val = values[0] - values[1]
-                d1 = errors[0]
-                d2 = -errors[1]
-                err = (d1**2 + d2**2)**.5
-
-            case np.multiply:
-                val = values[0] * values[1]
-                d1 = (errors[0] * values[1])
-                d2 = (values[0] * errors[1])
-                err = (d1**2 + d2**2)**.5
-            case np.divide:
-                val = values[0] / values[1]
-                d1 = errors[0] / values[1]
-                d2 = - values[0] * errors[1] / values[1]**2
-                err = (d1**2 + d2**2)**.5
-
-            case np.sqrt:
-                val = np.sqrt(values[0])
-                err = .5 * errors[0] / np.sqrt(values[0])
-            case np.power:
-                base = values[0]
-                exp = values[1]
-                val = _safe_power(base, exp)
-                d_base = exp * _safe_power(base, exp - 1) * errors[0]
-
-                d_exp = 0.0
-                if np.any(np.asarray(errors[1]) != 0):
-                    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
-                        d_exp = np.where(
-                            base > 0,
-                            val * np.log(base) * errors[1],
-                            np.nan,
-                        )
-
-                with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
-                    err = np.sqrt(d_base**2 + d_exp**2)
-
-            # --------------------
-            # trig
-
-            case np.sin:
-                val = np.sin(values[0])
-                err = np.abs(np.cos(values[0]) * errors[0])
-            case np.cos:
-                val = np.cos(values[0])
-                err = np.abs(np.sin(values[0]) * errors[0])
-            case np.tan:
-                val = np.tan(values[0])
-                err = errors[0] / np.cos(values[0])**2
-
-            case np.arcsin:
-                val = np.arcsin(values[0])
-                err = errors[0] / (1 - values[0]**2)**0.5
-            case np.arccos:
-                val = np.arccos(values[0])
-                err = errors[0] / (1 - values[0]**2)**0.5
-            case np.arctan:
-                val = np.arctan(values[0])
-                err = errors[0] / (1 + values[0]**2)
-
-            case np.sinh:
-                val = np.sinh(values[0])
-                err = np.abs(np.cosh(values[0]) * errors[0])
-            case np.cosh:
-                val = np.cosh(values[0])
-                err = np.abs(np.sinh(values[0]) * errors[0])
-            case np.tanh:
-                val = np.tanh(values[0])
-                err = errors[0] / np.cosh(values[0])**2
-
-            case np.arcsinh:
-                val = np.arcsinh(values[0])
-                err = errors[0] / np.sqrt(1 + values[0]**2)
-            case np.arccosh:
-                val = np.arccosh(values[0])
-                err = errors[0] / np.sqrt(values[0] - 1) / np.sqrt(values[0] + 1)
-            case np.arctanh:
-                val = np.arctanh(values[0])
-                err = errors[0] / (1 - values[0]**2)
-
-            # --------------------
-            # exp,log
-
-            case np.exp:
-                val = np.exp(values[0])
-                err = np.exp(values[0]) * errors[0]
-            case np.log:
-                val = np.log(values[0])
-                err = errors[0] / values[0]
-            case np.log10:
-                val = np.log10(values[0])
-                err = errors[0] / values[0] / np.log(10)
-            case np.logaddexp:
-                val = np.logaddexp(values[0], values[1])
-                d1 = np.exp(values[0] - val) * errors[0]
-                d2 = np.exp(values[1] - val) * errors[1]
-                err = (d1**2 + d2**2)**.5
-
-            # --------------------
-            # speical boys 
-
-            case _ if ufunc is erf:
-                val = erf(values[0])
-                err = np.abs((2 / np.sqrt(np.pi)) * np.exp(-values[0]**2) * errors[0])
-
-            # --------------------
-            # modifications
-
-            case np.rad2deg:
-                val = np.rad2deg(values[0])
-                err = np.rad2deg(errors[0])
-            case np.deg2rad:
-                val = np.deg2rad(values[0])
-                err = np.deg2rad(errors[0])
-            case np.abs:
-                val = np.abs(values[0])
-                err = errors[0]
-            case np.minimum:
-                val = np.minimum(values[0], values[1])
-                err = np.where(
-                    (values[0] <= values[1]) | np.isnan(values[0]),
-                    errors[0],
-                    errors[1],
-                )
-            case np.maximum:
-                val = np.maximum(values[0], values[1])
-                err = np.where(
-                    (values[0] >= values[1]) | np.isnan(values[0]),
-                    errors[0],
-                    errors[1],
-                )
-            case np.isnan:
-                return np.isnan(values[0])
-            case np.less:
-                return values[0] < values[1]
-            case np.less_equal:
-                return values[0] <= values[1]
-            case np.equal:
-                return values[0] == values[1]
-            case np.not_equal:
-                return values[0] != values[1]
-            case np.greater_equal:
-                return values[0] >= values[1]
-            case np.greater:
-                return values[0] > values[1]
-            case _:
-                raise NotImplementedError(f"not handled function: {ufunc}")
+        val, err = _propagate_ufunc(ufunc, values, errors)
+        if err is None:
+            return val
 
         if np.ndim(val) == 0 and np.ndim(err) == 0:
             return self._from_value_error(float(val), float(err))
 
-        val, err = np.broadcast_arrays(val, err)
-        return np.vectorize(self._from_value_error, otypes=[object])(val, err)
+        return self._from_value_error_array(val, err)
 
     # ==================================================
 
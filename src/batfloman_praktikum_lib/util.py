@@ -43,10 +43,28 @@ def get_exponent_significant(value):
     - 1.1 would give 0
     - 0.1 would give -1
     """
-    value_str = f"{value:.2e}"
-    if 'e' not in value_str: 
-        return 0
-    return int(value_str.split('e')[1])
+    if np.ndim(value) == 0:
+        # a single value: printing is exact and cheaper than the array path
+        value_str = f"{value:.2e}"
+        if 'e' not in value_str: 
+            return 0
+        return int(value_str.split('e')[1])
+
+    values = np.abs(np.asarray(value, dtype=float))
+    regular = np.isfinite(values) & (values != 0)
+    safe = np.where(regular, values, 1.0)
+
+    exponent = np.floor(np.log10(safe)).astype(int)
+    # exponent of the value shown with 3 significant digits: 9.996 -> 1.00e+01
+    with np.errstate(divide="ignore", over="ignore"):
+        mantissa = safe / 10.0**exponent
+    exponent[mantissa >= 10] += 1
+    # rounding ties and subnormal values: as printed
+    undecided = regular & (((mantissa >= 9.99) & (mantissa < 10)) | ~np.isfinite(mantissa))
+    for idx in zip(*np.nonzero(undecided)):
+        exponent[idx] = int(f"{values[idx]:.2e}".split("e")[1])
+
+    return np.where(regular, exponent, 0)
 
 def get_exponent_closest_3n(value):
     exponent = get_exponent_significant(value);
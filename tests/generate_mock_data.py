@@ -38,3 +38,47 @@ def generate_random_dataset(
             d[name] = setting
     return Dataset(d)
 
+
+# ==================================================
+#    large (vectorized) mock data
+# ==================================================
+
+def generate_random_values(
+    n: int,
+    mu: float=10,
+    sigma: float=2,
+    err_factor: float=0.05,
+    seed: Optional[int] = None,
+):
+    """`n` values and errors with the distribution of `generate_random_measurement`."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    values = rng.normal(mu, sigma, n)
+    errors = np.abs(rng.normal(0, err_factor*mu, n))
+    return values, errors
+
+def generate_random_columns(
+    n: int,
+    measurement_settings: List[Union[MeasurementSetting, float]],
+    seed: Optional[int] = None,
+):
+    """Column-wise version of `generate_random_dataset` for `n` rows: name -> (values, errors)."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for idx, setting in enumerate(measurement_settings):
+        if isinstance(setting, MeasurementSetting):
+            name = setting.name or f"param_{idx}"
+            columns[name] = generate_random_values(
+                n,
+                mu=setting.mu,
+                sigma=setting.sigma,
+                err_factor=setting.err_factor,
+                seed=int(rng.integers(2**32)),
+            )
+        else:
+            name = f"param_{idx}"
+            columns[name] = (np.full(n, float(setting)), np.zeros(n))
+    return columns
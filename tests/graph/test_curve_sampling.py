@@ -0,0 +1,105 @@
+import math
+
+from matplotlib import pyplot as plt
+import numpy as np
+import pytest
+
+from batfloman_praktikum_lib import graph
+from batfloman_praktikum_lib.graph.curve_sampling import batch_evaluator, sample_curve, sampling_for_axes
+from batfloman_praktikum_lib.graph_fit.fitResult import generate_fit_result
+
+
+def test_sample_curve_keeps_straight_lines_coarse():
+    x, y, err = sample_curve(batch_evaluator(lambda x: 3 * x + 1), 0, 1, max_points=5000)
+
+    assert x[0] == 0 and x[-1] == 1
+    assert len(x) < 200
+    np.testing.assert_allclose(y, 3 * x + 1)
+    assert np.all(err == 0)
+
+
+def test_sample_curve_refines_where_the_curve_bends():
+    x, y, _ = sample_curve(
+        batch_evaluator(lambda x: np.exp(-x**2 / (2 * 0.01**2))),
+        -1, 1,
+        max_points=5000,
+        tolerance=1e-3,
+    )
+
+    assert np.all(np.diff(x) > 0)
+    spacing_at_peak = np.diff(x)[np.argmin(np.abs(x[:-1]))]
+    spacing_at_edge = np.diff(x)[0]
+    assert spacing_at_peak < spacing_at_edge / 10
+
+    # linear interpolation of the samples stays within the tolerance
+    x_fine = np.linspace(-1, 1, 200001)
+    exact = np.exp(-x_fine**2 / (2 * 0.01**2))
+    assert np.max(np.abs(np.interp(x_fine, x, y) - exact)) < 5e-3
+
+
+def test_sample_curve_respects_max_points():
+    x, _, _ = sample_curve(batch_evaluator(lambda x: np.sin(1 / x)), 1e-3, 1, max_points=300)
+
+    assert len(x) <= 300
+
+
+def test_batch_evaluator_falls_back_to_scalar_calls():
+    calls = []
+
+    def func(x):
+        calls.append(x)
+        return math.sin(x)
+
+    evaluate = batch_evaluator(func)
+    y, err = evaluate(np.array([0.0, 1.0]))
+    evaluate(np.array([2.0]))
+
+    np.testing.assert_allclose(y, [0.0, math.sin(1.0)])
+    assert np.all(err == 0)
+    # one failed array call, then only scalar calls
+    assert len(calls) == 1 + 2 + 1
+
+
+def test_sample_curve_returns_error_band_of_fit_result():
+    fit = generate_fit_result(lambda x, a: a * x, values=[2.0], errors=[0.1], cov=[[0.01]])
+
+    x, y, err = sample_curve(batch_evaluator(fit.func), 0, 1)
+
+    np.testing.assert_allclose(y, 2 * x)
+    np.testing.assert_allclose(err, 0.1 * x, atol=1e-9)
+
+
+def test_plot_fit_result_samples_up_to_axes_width():
+    plot = graph.create_plot()
+    fit = generate_fit_result(
+        lambda x, a, mu, s: a * np.exp(-(x - mu)**2 / (2 * s**2)),
+        values=[1.0, 0.0, 0.02],
+        errors=[0.01, 0.001, 0.001],
+        cov=None,
+        quality=1.0,
+    )
+
+    result = graph.plot(fit, plot=plot, interval=(-1, 1))
+
+    assert len(result.line.get_xdata()) <= sampling_for_axes(plot[1])["max_points"]
+    assert result.fill is not None
+    plt.close(plot[0])
+
+
+@pytest.mark.parametrize("sigma", [0.05, 0.1])
+def test_plot_func_resolves_features_of_about_one_pixel(sigma):
+    plot = graph.create_plot()
+    gaussian = lambda x: 5.37 * np.exp(-(x - 37.3)**2 / (2 * sigma**2))
+
+    result = graph.plot(gaussian, plot=plot, interval=(0, 100), with_error=False)
+
+    assert sampling_for_axes(plot[1])["initial_points"] > 100
+    assert max(result.line.get_ydata()) > 0.95 * 5.37
+    plt.close(plot[0])
+
+
+def test_sample_curve_does_not_spend_the_budget_on_straight_stretches():
+    x, y, _ = sample_curve(batch_evaluator(lambda x: np.abs(x - 0.3)), 0, 1, initial_points=500, max_points=1000)
+
+    assert len(x) < 510
+    assert 0.3 in x or np.min(y) < 1e-3
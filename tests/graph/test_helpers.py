@@ -0,0 +1,11 @@
+import numpy as np
+
+from batfloman_praktikum_lib.graph.helpers import extract_value_error
+
+
+def test_extract_value_error_of_plain_array_has_float_errors():
+    values, errors = extract_value_error(np.array([1, 2, 3]))
+
+    np.testing.assert_array_equal(values, [1, 2, 3])
+    assert errors.dtype == float
+    assert np.all(errors == 0)
@@ -0,0 +1,106 @@
+import importlib
+
+import numpy as np
+import pytest
+
+from batfloman_praktikum_lib.graph_fit.init_params.fitSetup import ManualFitSetup
+from batfloman_praktikum_lib.graph_fit.models import Gaussian, Linear
+
+
+workspace_module = importlib.import_module(
+    "batfloman_praktikum_lib.graph_fit.fit_session.session"
+)
+
+
+@pytest.fixture
+def fit_calls(monkeypatch):
+    calls = []
+    original_fit = ManualFitSetup.fit
+
+    def counting_fit(self, **kwargs):
+        calls.append(kwargs.get("method"))
+        return original_fit(self, **kwargs)
+
+    monkeypatch.setattr(ManualFitSetup, "fit", counting_fit)
+    return calls
+
+
+def _data(offset=1.0):
+    x = np.linspace(0, 10, 60)
+    y = 5.0 * np.exp(-((x - 4.0) ** 2) / 2) + 0.3 * x + offset
+    return x, y, np.full(x.size, 0.1)
+
+
+def _make_session(cache_path, offset=1.0):
+    x, y, yerr = _data(offset)
+    return workspace_module.FitSession(x, y, yerr=yerr, cache_path=cache_path)
+
+
+def _add_peak(session):
+    model_id = session.add_model(name="peak")
+    session.add_component(model_id, Gaussian)
+    session.add_component(model_id, Linear)
+    return model_id
+
+
+def test_refitting_an_unchanged_model_is_a_cache_lookup(tmp_path, fit_calls):
+    session = _make_session(tmp_path / "session.json")
+    model_id = _add_peak(session)
+
+    first = session.fit_model(model_id)
+    session.invalidate_model(model_id)
+    second = session.fit_model(model_id)
+
+    assert len(fit_calls) == 1
+    assert list(second.params) == list(first.params)
+    np.testing.assert_allclose(
+        [param.value for param in second.params.values()],
+        [param.value for param in first.params.values()],
+    )
+
+    # a different method is a different fit
+    session.fit_model(model_id, method="ODR")
+    assert fit_calls == [None, "ODR"]
+
+
+def test_changed_interval_refits_and_old_interval_is_still_cached(tmp_path, fit_calls):
+    session = _make_session(tmp_path / "session.json")
+    model_id = session.add_model(Linear, interval=(0, 20), interval_kind="index")
+
+    session.fit_model(model_id)
+    session.set_interval(model_id, (10, 40), interval_kind="index")
+    session.fit_model(model_id)
+    session.set_interval(model_id, (0, 20), interval_kind="index")
+    session.fit_model(model_id)
+
+    assert len(fit_calls) == 2
+
+
+def test_reopened_session_restores_results_without_refitting(tmp_path, fit_calls):
+    cache_path = tmp_path / "session.json"
+    session = _make_session(cache_path)
+    model_id = _add_peak(session)
+    fitted = session.fit_model(model_id)
+    assert (tmp_path / "session.fits.json").exists()
+
+    reopened = _make_session(cache_path)
+    restored = reopened.get_model(model_id).result
+    assert restored is not None
+    analysis = reopened.analyze(model_id)
+
+    assert len(fit_calls) == 1
+    assert analysis.fit_result is restored
+    np.testing.assert_allclose(restored.func(np.array([4.0])).value, fitted.func(np.array([4.0])).value)
+
+
+def test_reopened_session_with_changed_data_is_refitted(tmp_path, fit_calls):
+    cache_path = tmp_path / "session.json"
+    session = _make_session(cache_path)
+    model_id = _add_peak(session)
+    session.fit_model(model_id)
+
+    changed = _make_session(cache_path, offset=2.0)
+    assert changed.get_model(model_id).result is None
+
+    changed.analyze(model_id)
+    assert len(fit_calls) == 2
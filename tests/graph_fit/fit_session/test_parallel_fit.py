@@ -0,0 +1,93 @@
+import importlib
+
+import numpy as np
+import pytest
+
+from batfloman_praktikum_lib.graph_fit.models import Gaussian, Linear
+
+
+workspace_module = importlib.import_module(
+    "batfloman_praktikum_lib.graph_fit.fit_session.session"
+)
+
+
+def _make_session(tmp_path, name="session.json"):
+    rng = np.random.default_rng(3)
+    x = np.linspace(0, 10, 80)
+    y = 8.0 * np.exp(-((x - 6.0) ** 2) / (2 * 0.7**2)) + 0.4 * x + 1.0 + rng.normal(0, 0.05, x.size)
+    session = workspace_module.FitSession(
+        x,
+        y,
+        yerr=np.full(x.size, 0.05),
+        cache_path=tmp_path / "cache" / name,
+    )
+    line_id = session.add_model(Linear, name="background", interval=(0, 30))
+    peak_id = session.add_model(name="peak")
+    session.add_component(peak_id, Gaussian)
+    session.add_component(peak_id, Linear)
+    return session, line_id, peak_id
+
+
+def test_parallel_fit_matches_serial_fit(tmp_path):
+    session, line_id, peak_id = _make_session(tmp_path)
+    serial = session.fit(method="least squares")
+    serial_values = {
+        model_id: [param.value for param in result.params.values()]
+        for model_id, result in serial.items()
+    }
+
+    # a separate session, so the results are not taken from the fit cache
+    other, _, _ = _make_session(tmp_path, "other.json")
+    parallel = other.fit(method="least squares", parallel=True, max_workers=2)
+
+    assert set(parallel) == {line_id, peak_id}
+    for model_id, result in parallel.items():
+        assert other.get_model(model_id).result is result
+        assert other.get_model(model_id).last_error is None
+        assert list(result.params) == list(serial[model_id].params)
+        np.testing.assert_allclose([param.value for param in result.params.values()], serial_values[model_id], rtol=1e-6)
+
+    # the rebuilt result functions work like the serial ones
+    x = np.linspace(4, 8, 5)
+    np.testing.assert_allclose(parallel[peak_id].func(x).value, serial[peak_id].func(x).value, rtol=1e-6)
+
+
+def test_parallel_fit_saves_state_once(tmp_path, monkeypatch):
+    session, _, _ = _make_session(tmp_path)
+    calls = []
+    monkeypatch.setattr(session, "save_state", lambda: calls.append(1))
+
+    session.fit(parallel=True, max_workers=2)
+
+    assert len(calls) == 1
+
+
+def test_parallel_fit_records_errors_for_every_model_and_raises_the_first(tmp_path):
+    session, line_id, peak_id = _make_session(tmp_path)
+    # 2 points for a 5 parameter model
+    session.set_interval(peak_id, (0, 1), interval_kind="index")
+
+    with pytest.raises(Exception):
+        session.fit(method="least squares", parallel=True, max_workers=2)
+
+    assert session.get_model(line_id).result is not None
+    assert session.get_model(line_id).last_error is None
+    assert session.get_model(peak_id).result is None
+    assert session.get_model(peak_id).last_error
+
+    results = session.try_fit_models(method="least squares", parallel=True, max_workers=2)
+    assert set(results) == {line_id}
+
+
+def test_parallel_fit_falls_back_to_threads_for_local_models(tmp_path, capsys):
+    def offset(x, c):
+        return c + 0 * x
+
+    session, line_id, _ = _make_session(tmp_path)
+    offset_id = session.add_model(offset, name="offset")
+
+    results = session.fit(method="least squares", model_ids=[line_id, offset_id], parallel=True)
+
+    assert "using threads" in capsys.readouterr().out
+    assert set(results) == {line_id, offset_id}
+    assert results[offset_id].params["c"].value == pytest.approx(np.mean(session.y.astype(float)), rel=1e-3)
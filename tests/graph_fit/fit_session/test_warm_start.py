@@ -0,0 +1,78 @@
+import importlib
+
+import numpy as np
+
+from batfloman_praktikum_lib.graph_fit.init_params.fitSetup import ManualFitSetup
+from batfloman_praktikum_lib.graph_fit.models import ConstFunc, Gaussian, Linear
+
+
+workspace_module = importlib.import_module(
+    "batfloman_praktikum_lib.graph_fit.fit_session.session"
+)
+
+
+def _data():
+    x = np.linspace(0, 10, 200)
+    y = 6.0 * np.exp(-((x - 5.0) ** 2) / (2 * 0.8**2)) + 0.2 * x + 1.0
+    y = y + 0.02 * np.sin(37 * x)
+    return x, y, np.full(x.size, 0.05)
+
+
+def _make_session(tmp_path, name):
+    x, y, yerr = _data()
+    session = workspace_module.FitSession(x, y, yerr=yerr, cache_path=tmp_path / name)
+    model_id = session.add_model(name="peak", interval=(20, 180), interval_kind="index")
+    session.add_component(model_id, Gaussian)
+    session.add_component(model_id, Linear)
+    return session, model_id
+
+
+def test_fit_results_report_model_evaluations():
+    x, y, yerr = _data()
+    setup = ManualFitSetup(model=Linear, x=x, y=y, yerr=yerr)
+
+    assert setup.fit(method="least squares").n_evaluations > 0
+    assert setup.fit(method="ODR", xerr=np.full(x.size, 0.01)).n_evaluations > 0
+
+
+def test_warm_start_after_moving_the_interval_needs_fewer_evaluations(tmp_path):
+    session, model_id = _make_session(tmp_path, "warm.json")
+    session.fit_model(model_id)
+    session.set_interval(model_id, (23, 183), interval_kind="index")
+    warm = session.fit_model(model_id, warm_start=True)
+
+    cold_session, cold_id = _make_session(tmp_path, "cold.json")
+    cold_session.set_interval(cold_id, (23, 183), interval_kind="index")
+    cold = cold_session.fit_model(cold_id)
+
+    assert warm.n_evaluations < cold.n_evaluations
+    np.testing.assert_allclose(
+        [param.value for param in warm.params.values()],
+        [param.value for param in cold.params.values()],
+        rtol=1e-5,
+    )
+
+
+def test_failed_warm_start_falls_back_to_the_initial_guess():
+    x, y, yerr = _data()
+    setup = ManualFitSetup(model=Gaussian + Linear, x=x, y=y, yerr=yerr)
+    names = list((Gaussian + Linear).get_param_names())
+
+    result = setup.fit(warm_start={name: np.nan for name in names})
+
+    assert np.all(np.isfinite([param.value for param in result.params.values()]))
+
+
+def test_warm_start_params_survive_invalidation_but_not_component_changes(tmp_path):
+    session, model_id = _make_session(tmp_path, "session.json")
+    session.fit_model(model_id)
+    instance = session.get_model(model_id)
+
+    session.set_interval(model_id, (10, 150), interval_kind="index")
+    assert instance.result is None
+    assert set(instance.warm_start_params) == set(session._component_param_names(instance.build_model()))
+
+    session.add_component(model_id, ConstFunc)
+    assert instance.warm_start_params is None
+    # nothing to start from -> a normal fit
+    assert session.fit_model(model_id, warm_start=True) is not None
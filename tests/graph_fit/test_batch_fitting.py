@@ -0,0 +1,115 @@
+import threading
+import time
+
+import numpy as np
+
+from batfloman_praktikum_lib import DataCluster
+from batfloman_praktikum_lib.graph_fit import Linear, batch_fit
+from batfloman_praktikum_lib.structs.measurement import Measurement
+
+
+def _line_datasets(slopes):
+    x = np.linspace(0, 10, 20)
+    return [(x, m * x + 1.0, np.full_like(x, 0.1)) for m in slopes]
+
+
+def test_batch_fit_keeps_input_order():
+    slopes = [0.5, 1.0, 1.5, 2.0, 2.5]
+
+    result = batch_fit(Linear, _line_datasets(slopes), executor="thread", max_workers=3)
+
+    assert list(result.column("dataset")) == list(range(len(slopes)))
+    np.testing.assert_allclose(result.values("m"), slopes)
+    np.testing.assert_allclose(result.values("n"), 1.0)
+    assert list(result.column("method")) == ["least squares"] * len(slopes)
+
+
+def test_batch_fit_process_pool_with_labels():
+    datasets = dict(zip(["a", "b"], _line_datasets([1.0, 3.0])))
+
+    result = batch_fit(Linear, datasets, executor="process", max_workers=2)
+
+    assert list(result.column("dataset")) == ["a", "b"]
+    np.testing.assert_allclose(result.values("m"), [1.0, 3.0])
+
+
+def test_batch_fit_captures_errors_per_dataset():
+    datasets = _line_datasets([1.0, 2.0])
+    datasets.insert(1, (np.arange(3.0), np.arange(2.0), np.ones(2)))
+
+    result = batch_fit(Linear, datasets, executor="serial")
+
+    errors = list(result.column("error"))
+    assert errors[0] == "" and errors[2] == ""
+    assert errors[1] != ""
+    assert np.isnan(result.values("m")[1])
+    np.testing.assert_allclose(result.values("m")[[0, 2]], [1.0, 2.0])
+
+
+def test_batch_fit_timeout_marks_slow_fit():
+    release = threading.Event()
+
+    def slow_model(x, m, n):
+        if m > 5:
+            release.wait(5)
+        return m * x + n
+
+    x = np.linspace(0, 1, 10)
+    fast = (x, 2 * x, np.ones_like(x))
+    slow = (x, 10 * x, np.ones_like(x))
+
+    try:
+        result = batch_fit(
+            slow_model,
+            [fast, fast],
+            initial_guess=[2.0, 0.0],
+            executor="thread",
+            timeout=0.2,
+        )
+        assert list(result.column("error")) == ["", ""]
+
+        result = batch_fit(slow_model, [slow, slow], initial_guess=[10.0, 0.0], executor="thread", timeout=0.2)
+        assert all(error.startswith("TimeoutError") for error in result.column("error"))
+    finally:
+        release.set()
+
+
+def _sleepy_line(x, m, n):
+    # datasets at x >= 100 never finish, the others take a moment per call
+    time.sleep(30 if np.min(x) >= 100 else 0.01)
+    return m * x + n
+
+
+def test_batch_fit_process_timeout_counts_from_start_and_stops_the_worker():
+    x = np.linspace(0, 1, 10)
+    fast = (x, 2 * x, np.ones_like(x))
+    stuck = (x + 100, 2 * x, np.ones_like(x))
+
+    start = time.monotonic()
+    result = batch_fit(
+        _sleepy_line,
+        [fast] * 4 + [stuck] + [fast] * 4,
+        initial_guess=[2.0, 0.0],
+        executor="process",
+        max_workers=2,
+        timeout=1.0,
+    )
+
+    errors = list(result.column("error"))
+    assert errors[4].startswith("TimeoutError")
+    assert errors[:4] + errors[5:] == [""] * 8
+    np.testing.assert_allclose(np.delete(result.values("m"), 4), 2.0)
+    assert time.monotonic() - start < 20
+
+
+def test_batch_fit_on_dataclusters_with_fixed_params():
+    clusters = [
+        DataCluster([{"x": float(x), "y": Measurement(m * x + 1.0, 0.1)} for x in range(10)])
+        for m in (2.0, 4.0)
+    ]
+
+    result = batch_fit(Linear, clusters, x_index="x", y_index="y", fixed_params={"n": 1.0}, executor="serial")
+
+    np.testing.assert_allclose(result.values("m"), [2.0, 4.0])
+    np.testing.assert_allclose(result.values("n"), [1.0, 1.0])
+    np.testing.assert_allclose(result.errors("n"), [0.0, 0.0])
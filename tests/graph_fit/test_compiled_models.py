@@ -0,0 +1,60 @@
+import pickle
+
+import numpy as np
+
+from batfloman_praktikum_lib.graph_fit.fixed_params import build_fixed_param_binding
+from batfloman_praktikum_lib.graph_fit.jacobian import numerical_jacobian
+from batfloman_praktikum_lib.graph_fit.models.models_impl import (
+    ConstFunc,
+    Gaussian,
+    InverseSquare,
+    Linear,
+)
+
+
+X = np.linspace(-3, 3, 41)
+
+
+def test_composite_model_sums_the_components():
+    model = 3 * Gaussian + ConstFunc
+    params = [2.0, 0.5, -1.0, 1.0, 0.8, 0.0, 0.5, 0.3, 1.5, 0.2]
+
+    expected = (
+        Gaussian.model(X, *params[0:3])
+        + Gaussian.model(X, *params[3:6])
+        + Gaussian.model(X, *params[6:9])
+        + ConstFunc.model(X, params[9])
+    )
+    np.testing.assert_allclose(model.model(X, *params), expected)
+
+
+def test_composite_jacobian_matches_finite_differences():
+    # InverseSquare has no analytic jacobian -> differentiated on its own
+    model = Gaussian + Linear + InverseSquare
+    params = [2.0, 0.7, 0.3, 0.5, -1.0, 1.5, 2.0, 0.1, 4.0]
+
+    jacobian = model.jacobian(X, *params)
+
+    assert jacobian.shape == (X.size, len(params))
+    np.testing.assert_allclose(jacobian, numerical_jacobian(model.model, X, params), rtol=1e-5, atol=1e-8)
+
+
+def test_fixed_param_binding_fills_in_fixed_values():
+    model = Gaussian + ConstFunc
+    binding = build_fixed_param_binding(model, fixed_params={"sigma_1": 0.5, "b_2": 0.25})
+    wrapped = binding.wrap_model()
+
+    assert binding.wrap_model() is wrapped
+    np.testing.assert_allclose(wrapped(X, 2.0, 0.1), model.model(X, 2.0, 0.5, 0.1, 0.25))
+
+    jacobian = binding.wrap_jacobian(model.jacobian)(X, 2.0, 0.1)
+    np.testing.assert_allclose(jacobian, model.jacobian(X, 2.0, 0.5, 0.1, 0.25)[:, [0, 2]])
+
+
+def test_fixed_param_binding_can_be_pickled_after_compiling():
+    binding = build_fixed_param_binding(Linear, fixed_params={"n": 1.0})
+    binding.wrap_model()
+
+    restored = pickle.loads(pickle.dumps(binding))
+
+    np.testing.assert_allclose(restored.wrap_model()(X, 2.0), Linear.model(X, 2.0, 1.0))
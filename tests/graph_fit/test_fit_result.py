@@ -0,0 +1,105 @@
+import math
+
+import numpy as np
+
+from batfloman_praktikum_lib.graph_fit.fitResult import generate_fit_result
+from batfloman_praktikum_lib.structs.correlation import enable_correlation_tracking
+from batfloman_praktikum_lib.structs.measurement import Measurement
+from batfloman_praktikum_lib.structs.measurementArray import MeasurementArray
+
+
+def quadratic(x, a, b, c):
+    return a * x**2 + b * x + c
+
+VALUES = [0.5, -1.2, 3.0]
+COV = np.array([
+    [0.04, -0.01, 0.002],
+    [-0.01, 0.09, -0.03],
+    [0.002, -0.03, 0.25],
+])
+ERRORS = np.sqrt(np.diag(COV))
+
+
+def test_band_matches_jacobian_covariance():
+    result = generate_fit_result(quadratic, VALUES, ERRORS, COV)
+    x = np.linspace(-2, 4, 50)
+
+    jac = np.stack([x**2, x, np.ones_like(x)], axis=-1)
+    expected_sigma = np.sqrt(np.einsum("ni,ij,nj->n", jac, COV, jac))
+
+    evaluated = result.func(x)
+    assert isinstance(evaluated, MeasurementArray)
+    np.testing.assert_allclose(evaluated.value, quadratic(x, *VALUES))
+    np.testing.assert_allclose(evaluated.error, expected_sigma, rtol=1e-6)
+    np.testing.assert_allclose(result.min_1sigma(x), quadratic(x, *VALUES) - expected_sigma, rtol=1e-6)
+    np.testing.assert_allclose(result.max_1sigma(x), quadratic(x, *VALUES) + expected_sigma, rtol=1e-6)
+
+
+def test_band_agrees_with_correlated_measurement_path():
+    x = np.linspace(-1, 1, 7)
+    band = generate_fit_result(quadratic, VALUES, ERRORS, COV).func(x)
+
+    enable_correlation_tracking(True)
+    try:
+        tracked = generate_fit_result(quadratic, VALUES, ERRORS, COV).func(x)
+    finally:
+        enable_correlation_tracking(False)
+
+    np.testing.assert_allclose(band.error, [m.error for m in tracked], rtol=1e-6)
+
+
+def test_scalar_input_returns_measurement_and_floats():
+    result = generate_fit_result(quadratic, VALUES, ERRORS, COV)
+
+    value = result.func(1.5)
+    assert isinstance(value, Measurement)
+    assert isinstance(result.min_1sigma(1.5), float)
+    assert result.min_1sigma(1.5) < value.value < result.max_1sigma(1.5)
+
+
+def test_min_and_max_share_one_evaluation():
+    calls = []
+
+    def model(x, a, b, c):
+        calls.append(1)
+        return quadratic(x, a, b, c)
+
+    result = generate_fit_result(model, VALUES, ERRORS, COV)
+    x = np.linspace(0, 1, 1000)
+
+    result.min_1sigma(x)
+    n_calls = len(calls)
+    result.max_1sigma(x)
+
+    # value + two calls per parameter, all on the whole array
+    assert n_calls == 1 + 2 * len(VALUES)
+    assert len(calls) == n_calls
+
+
+def test_uncorrelated_fallback_and_scalar_only_model():
+    def model(x, a, b):
+        return a * math.exp(b * x)
+
+    result = generate_fit_result(model, [2.0, 0.3], [0.1, 0.01], None)
+    x = np.array([0.0, 1.0, 2.0])
+
+    expected_sigma = np.sqrt((0.1 * np.exp(0.3 * x))**2 + (0.01 * 2.0 * x * np.exp(0.3 * x))**2)
+    np.testing.assert_allclose(result.func(x).error, expected_sigma, rtol=1e-6)
+
+
+def test_measurement_x_adds_x_error_to_the_full_covariance_band():
+    result = generate_fit_result(quadratic, VALUES, ERRORS, COV)
+
+    evaluated = result.func(Measurement(1.0, 0.1))
+    assert isinstance(evaluated, Measurement)
+    # parameter part with the cross terms of COV, x error in quadrature on top
+    jac = np.array([1.0, 1.0, 1.0])
+    slope = 2 * VALUES[0] * 1.0 + VALUES[1]
+    expected = np.sqrt(jac @ COV @ jac + (slope * 0.1)**2)
+    assert math.isclose(evaluated.error, expected, rel_tol=1e-6)
+
+    x = [Measurement(0.0, 0.2), 2.0, Measurement(3.0, 0.0)]
+    evaluated = result.func(x)
+    assert isinstance(evaluated, MeasurementArray)
+    np.testing.assert_allclose(evaluated.value, quadratic(np.array([0.0, 2.0, 3.0]), *VALUES))
+    np.testing.assert_allclose(evaluated.error[1:], result.func(np.array([2.0, 3.0])).error, rtol=1e-9)
@@ -0,0 +1,132 @@
+import math
+
+import numpy as np
+import pytest
+
+from batfloman_praktikum_lib.graph_fit.jacobian import numerical_jacobian, symbolic_jacobian
+from batfloman_praktikum_lib.graph_fit.least_squares import generic_fit
+from batfloman_praktikum_lib.graph_fit.models.models_impl import (
+    ConstFunc,
+    Exponential,
+    Gaussian,
+    LimitedGrowth,
+    Linear,
+    LinearShifted,
+    Quadratic,
+)
+from batfloman_praktikum_lib.graph_fit.orthogonal_distance import generic_fit as odr_fit
+
+
+@pytest.mark.parametrize(
+    ("model", "params"),
+    [
+        (ConstFunc, [2.0]),
+        (Linear, [2.0, 1.0]),
+        (LinearShifted, [2.0, 0.5, 1.0]),
+        (Quadratic, [1.0, -2.0, 3.0]),
+        (Exponential, [0.5, 1.0, 0.2]),
+        (LimitedGrowth, [1.0, -0.5, 3.0]),
+        (Gaussian, [2.0, 0.7, 0.3]),
+    ],
+)
+def test_analytic_jacobian_matches_finite_differences(model, params):
+    x = np.linspace(-2, 3, 41)
+
+    analytic = model.jacobian(x, *params)
+
+    assert analytic.shape == (len(x), len(params))
+    np.testing.assert_allclose(analytic, numerical_jacobian(model.model, x, params), atol=1e-7)
+
+
+def test_numerical_jacobian_supports_scalar_only_models():
+    def model(x, a, b):
+        return a * math.exp(b * x) if x > 0 else a
+
+    x = np.array([-1.0, 0.5, 1.0])
+    jac = numerical_jacobian(model, x, [2.0, 0.3])
+
+    expected = np.array([[1.0, 0.0], [math.exp(0.15), 2.0 * 0.5 * math.exp(0.15)], [math.exp(0.3), 2.0 * math.exp(0.3)]])
+    np.testing.assert_allclose(jac, expected, rtol=1e-7, atol=1e-9)
+
+
+def _values(fit_result):
+    return np.array([param.value for param in fit_result.params.values()])
+
+
+def _gaussian_data():
+    rng = np.random.default_rng(4)
+    x = np.linspace(-3, 3, 300)
+    y = Gaussian.model(x, 2.0, 0.7, 0.3) + rng.normal(0, 0.05, x.size)
+    return x, y, np.full_like(x, 0.05)
+
+
+def test_least_squares_with_analytic_jacobian_matches_finite_differences():
+    x, y, y_err = _gaussian_data()
+
+    with_jac = Gaussian.ls_fit(x, y, y_err, initial_guess=[1.5, 1.0, 0.0])
+    without_jac = generic_fit(Gaussian.model, x, y, y_err, initial_guess=[1.5, 1.0, 0.0])
+
+    np.testing.assert_allclose(_values(with_jac), _values(without_jac), rtol=1e-6)
+    np.testing.assert_allclose(with_jac.cov, without_jac.cov, rtol=1e-4, atol=1e-12)
+
+
+def test_jacobian_respects_fixed_params():
+    x, y, y_err = _gaussian_data()
+
+    result = generic_fit(Gaussian, x, y, y_err, initial_guess={"A": 1.5, "sigma": 1.0}, fixed_params={"x0": 0.3})
+
+    assert result.params["x0"].value == 0.3
+    assert result.params["x0"].error == 0.0
+    assert math.isclose(result.params["A"].value, 2.0, rel_tol=0.01)
+
+
+def test_odr_uses_analytic_jacobian():
+    x, y, y_err = _gaussian_data()
+
+    with_jac = odr_fit(Gaussian, x, y, x_err=np.full_like(x, 0.01), y_err=y_err, initial_guess=[1.5, 1.0, 0.0])
+    without_jac = odr_fit(Gaussian.model, x, y, x_err=np.full_like(x, 0.01), y_err=y_err, initial_guess=[1.5, 1.0, 0.0])
+
+    np.testing.assert_allclose(_values(with_jac), _values(without_jac), rtol=1e-4)
+
+
+
+class _Lorentz(Gaussian):
+    # same parameters as the Gaussian, but its own model and no jacobian
+    @staticmethod
+    def model(x, A, sigma, x0):
+        return A / (1 + ((x - x0) / sigma)**2)
+
+
+def _lorentz_data():
+    x = np.linspace(-5, 5, 100)
+    return x, _Lorentz.model(x, 2.0, 1.0, 0.3), np.full_like(x, 0.01)
+
+
+def test_subclass_with_own_model_does_not_inherit_the_jacobian():
+    x, y, y_err = _lorentz_data()
+
+    assert _Lorentz.jacobian is None
+    result = _Lorentz.fit(x, y, yerr=y_err)
+    odr = _Lorentz.fit(x, y, xerr=np.full_like(x, 0.01), yerr=y_err)
+
+    np.testing.assert_allclose(_values(result), [2.0, 1.0, 0.3], rtol=1e-6)
+    np.testing.assert_allclose(_values(odr), [2.0, 1.0, 0.3], rtol=1e-6)
+
+
+def test_odr_falls_back_to_finite_differences_for_a_wrong_jacobian(capsys):
+    x, y, y_err = _lorentz_data()
+
+    result = odr_fit(_Lorentz.model, x, y, x_err=np.full_like(x, 0.01), y_err=y_err, initial_guess=[1.5, 1.2, 0.0], jacobian=Gaussian.jacobian)
+
+    assert "jacobian does not match" in capsys.readouterr().out
+    np.testing.assert_allclose(_values(result), [2.0, 1.0, 0.3], rtol=1e-6)
+
+
+def test_symbolic_jacobian():
+    pytest.importorskip("sympy")
+    pytest.importorskip("IPython")  # required by the equations package
+
+    jacobian = symbolic_jacobian(Gaussian.model)
+    x = np.linspace(-2, 2, 9)
+
+    np.testing.assert_allclose(jacobian(x, 2.0, 0.7, 0.3), Gaussian.jacobian(x, 2.0, 0.7, 0.3))
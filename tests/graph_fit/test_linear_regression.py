@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from batfloman_praktikum_lib.graph_fit import Linear, Quadratic
+from batfloman_praktikum_lib.graph_fit.least_squares import generic_fit
+from batfloman_praktikum_lib.graph_fit.linear_regression import linear_fit, york_fit
+from batfloman_praktikum_lib.graph_fit.orthogonal_distance import generic_fit as odr_fit
+
+
+def _line_data():
+    rng = np.random.default_rng(7)
+    x = np.linspace(0, 10, 40)
+    x_err = np.full(x.size, 0.1) + 0.01 * x
+    y_err = np.full(x.size, 0.3)
+    y = 2.0 * x + 1.0 + rng.normal(0, y_err)
+    return x, y, x_err, y_err
+
+
+def _values(result):
+    return [param.value for param in result.params.values()]
+
+
+def _errors(result):
+    return [param.error for param in result.params.values()]
+
+
+def test_linear_model_fit_matches_curve_fit_without_iterating():
+    x, y, _, y_err = _line_data()
+    y = y + 0.05 * x**2
+
+    result = Quadratic.fit(x, y, yerr=y_err)
+    reference = generic_fit(Quadratic, x, y, y_err, initial_guess=[0.0, 0.0, 0.0])
+
+    assert result.n_evaluations == 1
+    np.testing.assert_allclose(_values(result), _values(reference), rtol=1e-7)
+    np.testing.assert_allclose(result.cov, reference.cov, rtol=1e-6)
+    assert result.quality == pytest.approx(reference.quality)
+
+
+def test_linear_fit_with_fixed_params():
+    x, y, _, y_err = _line_data()
+
+    result = Linear.fit(x, y, yerr=y_err, fixed_params={"n": 1.0})
+    reference = generic_fit(Linear, x, y, y_err, fixed_params={"n": 1.0}, initial_guess=[1.0, 1.0])
+
+    np.testing.assert_allclose(_values(result), _values(reference), rtol=1e-7)
+    assert result.params["n"].error == 0
+    assert result.params["m"].error == pytest.approx(reference.params["m"].error)
+
+
+def test_linear_fit_requires_a_basis():
+    with pytest.raises(ValueError):
+        linear_fit(lambda x, a: np.exp(a * x), np.arange(3.0), np.arange(3.0))
+
+
+def test_york_fit_matches_odr_for_a_line():
+    x, y, x_err, y_err = _line_data()
+
+    result = Linear.fit(x, y, xerr=x_err, yerr=y_err)
+    reference = odr_fit(Linear, x, y, x_err=x_err, y_err=y_err, initial_guess=[1.0, 1.0])
+
+    # up to the convergence tolerance of ODR
+    assert result.method == "ODR"
+    np.testing.assert_allclose(_values(result), _values(reference), rtol=1e-5)
+    np.testing.assert_allclose(result.cov, reference.cov, rtol=1e-5)
+    np.testing.assert_allclose(_errors(result), _errors(reference), rtol=1e-5)
+    assert result.quality == pytest.approx(reference.quality, rel=1e-6)
+
+
+def test_linear_odr_without_x_errors_keeps_scipy_odr():
+    x, y, _, y_err = _line_data()
+
+    result = Linear.odr_fit(x, y, yerr=y_err)
+    reference = odr_fit(Linear, x, y, y_err=y_err, initial_guess=Linear.get_initial_guess(x, y), ignore_warning_x_errors=True)
+
+    np.testing.assert_allclose(_errors(result), _errors(reference), rtol=1e-9)
+    with pytest.raises(ValueError):
+        york_fit(Linear.model, x, y, y_err=y_err)
+
+
+def test_york_fit_without_x_errors_is_weighted_least_squares():
+    x, y, _, y_err = _line_data()
+
+    result = york_fit(Linear.model, x, y, x_err=np.full(x.size, 1e-9), y_err=y_err)
+
+    np.testing.assert_allclose(_values(result), _values(Linear.fit(x, y, yerr=y_err)), rtol=1e-9)
+
+
+class _PowerLaw(Linear):
+    # reuses the names and the initial guess of Linear, but is not linear in m
+    @staticmethod
+    def model(x, m, n):
+        return n * x**m
+
+    @staticmethod
+    def jacobian(x, m, n):
+        x = np.asarray(x, dtype=float)
+        return np.stack([n * x**m * np.log(x), x**m], axis=-1)
+
+    @staticmethod
+    def get_initial_guess(x, y):
+        return [1.0, 1.0]
+
+
+def test_subclass_with_own_model_drops_the_linear_shortcuts():
+    x = np.linspace(1, 5, 30)
+    x_err = np.full(x.size, 0.01)
+    y_err = np.full(x.size, 0.1)
+    y = 3.0 * x**2
+
+    assert _PowerLaw.basis is None
+    ls = _PowerLaw.fit(x, y, yerr=y_err)
+    odr = _PowerLaw.fit(x, y, xerr=x_err, yerr=y_err)
+
+    assert ls.n_evaluations > 1
+    np.testing.assert_allclose(_values(ls), [2.0, 3.0], rtol=1e-6)
+    np.testing.assert_allclose(_values(odr), [2.0, 3.0], rtol=1e-6)
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from batfloman_praktikum_lib.graph_fit import array_chunks, streaming_linear_fit
+from batfloman_praktikum_lib.graph_fit.least_squares import generic_fit
+from batfloman_praktikum_lib.graph_fit.models.models_impl import ConstFunc, Gaussian, Linear, Quadratic
+
+
+def _quadratic_data(n=5000):
+    rng = np.random.default_rng(4)
+    x = np.linspace(-5, 5, n)
+    y_err = np.full(n, 0.2) + 0.1 * (x > 0)
+    y = 0.3 * x**2 - 1.2 * x + 4.0 + rng.normal(0, y_err)
+    return x, y, y_err
+
+
+def test_streaming_fit_matches_least_squares():
+    x, y, y_err = _quadratic_data()
+
+    streamed = streaming_linear_fit(Quadratic, array_chunks(x, y, y_err, chunk_size=333))
+    reference = generic_fit(Quadratic, x, y, y_err, initial_guess=[1.0, 1.0, 1.0])
+
+    for name in ("a", "b", "c"):
+        assert streamed.params[name].value == pytest.approx(reference.params[name].value, rel=1e-7)
+        assert streamed.params[name].error == pytest.approx(reference.params[name].error, rel=1e-6)
+    np.testing.assert_allclose(streamed.cov, reference.cov, rtol=1e-6, atol=1e-14)
+    assert streamed.quality == pytest.approx(reference.quality, rel=1e-6)
+
+
+def test_streaming_fit_skips_nan_rows_and_reads_memmaps(tmp_path):
+    x, y, _ = _quadratic_data()
+    y[::50] = np.nan
+    np.save(tmp_path / "y.npy", y)
+    y_mapped = np.load(tmp_path / "y.npy", mmap_mode="r")
+
+    result = streaming_linear_fit(Quadratic, array_chunks(x, y_mapped, 0.2, chunk_size=1000))
+
+    valid = np.isfinite(y)
+    expected = np.polyfit(x[valid], y[valid], 2)
+    np.testing.assert_allclose([result.params[name].value for name in "abc"], expected, rtol=1e-8)
+
+
+def test_streaming_fit_of_composite_and_custom_basis():
+    x = np.linspace(0, 1, 200)
+    y = 2.0 * x + 0.5 + 3.0
+
+    composite = streaming_linear_fit(Linear + ConstFunc, [(x[:100], y[:100]), (x[100:], y[100:])])
+    # Linear + ConstFunc is degenerate in the offsets, their sum is determined
+    assert composite.params["m_1"].value == pytest.approx(2.0)
+
+    custom = streaming_linear_fit(
+        lambda x, a, b: a * np.sin(x) + b,
+        [(x, 1.5 * np.sin(x) - 0.5)],
+        basis=lambda x: np.stack([np.sin(x), np.ones_like(x)], axis=-1),
+    )
+    assert custom.params["a"].value == pytest.approx(1.5)
+    assert custom.params["b"].value == pytest.approx(-0.5)
+
+
+def test_streaming_fit_requires_linear_model():
+    with pytest.raises(ValueError):
+        streaming_linear_fit(Gaussian, [])
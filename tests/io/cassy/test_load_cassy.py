@@ -0,0 +1,53 @@
+import numpy as np
+
+from batfloman_praktikum_lib.structs import ColumnarDataCluster
+from batfloman_praktikum_lib.io import load_cassy, load_cassy_datacluster
+
+EXPORT = 'MIN=0\tMIN=0\nDEF="t / s"\t"U / V"\n0\t1,5\n0,1\tNAN\n0,2\t-2,25\n'
+
+
+def _write(tmp_path, text: str = EXPORT):
+    path = tmp_path / "run.txt"
+    path.write_text(text)
+    return path
+
+
+def test_load_cassy_dataframe(tmp_path):
+    df = load_cassy(_write(tmp_path))
+
+    assert list(df.columns) == ["t / s", "U / V"]
+    np.testing.assert_array_equal(df["t / s"].to_numpy(), [0.0, 0.1, 0.2])
+    np.testing.assert_array_equal(df["U / V"].to_numpy(), [1.5, np.nan, -2.25])
+
+
+def test_ragged_rows_fall_back_to_row_parsing(tmp_path):
+    df = load_cassy(_write(tmp_path, 'DEF="a"\t"b"\n1,5\t2\n3\n'))
+
+    assert df["a"].tolist() == [1.5, 3.0]
+    assert np.isnan(df["b"][1])
+
+
+def test_load_cassy_datacluster(tmp_path):
+    cluster = load_cassy_datacluster(_write(tmp_path))
+
+    assert isinstance(cluster, ColumnarDataCluster)
+    assert cluster.get_column_names() == ["t / s", "U / V"]
+    np.testing.assert_array_equal(cluster.values("U / V"), [1.5, np.nan, -2.25])
+
+
+def test_load_cassy_datacluster_keeps_repeated_column_names_apart(tmp_path):
+    cluster = load_cassy_datacluster(_write(tmp_path, 'DEF="U / V"\t"U / V"\t"U / V 2"\n1\t2\t3\n'))
+
+    assert cluster.get_column_names() == ["U / V", "U / V 2", "U / V 2 2"]
+    assert [cluster.values(name)[0] for name in cluster.get_column_names()] == [1.0, 2.0, 3.0]
+
+
+def test_cache_is_invalidated_by_content(tmp_path):
+    path = _write(tmp_path)
+
+    first = load_cassy(path, cache=True)
+    assert (tmp_path / "run.txt.npz").exists()
+    assert load_cassy(path, cache=True).equals(first)
+
+    path.write_text(EXPORT.replace("-2,25", "4"))
+    assert load_cassy(path, cache=True)["U / V"][2] == 4.0
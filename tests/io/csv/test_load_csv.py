@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from batfloman_praktikum_lib.io.csv import load_csv
+
+
+def _write(tmp_path, text: str):
+    path = tmp_path / "data.csv"
+    path.write_text(text)
+    return path
+
+
+def test_numeric_block_with_header_and_comments(tmp_path):
+    path = _write(tmp_path, "// measurement\n# t, U\n0, 1.5 // first\n1, 2.5\n\n2, 0.1\n")
+
+    df = load_csv(path)
+
+    assert list(df.columns) == ["t", "U"]
+    assert df["t"].dtype == float
+    np.testing.assert_array_equal(df["U"].to_numpy(), [1.5, 2.5, 0.1])
+
+
+def test_section_selects_block(tmp_path):
+    path = _write(tmp_path, "[a]\n# x\n1\n[b]\n# y, z\n3, 4\n5, 6\n")
+
+    df = load_csv(path, section="b")
+
+    assert list(df.columns) == ["y", "z"]
+    np.testing.assert_array_equal(df.to_numpy(), [[3.0, 4.0], [5.0, 6.0]])
+
+    with pytest.raises(ValueError):
+        load_csv(path, section="c")
+
+
+def test_non_numeric_columns_fall_back_to_cells(tmp_path):
+    path = _write(tmp_path, "# value, rel, note\n1.0, 1.23(4), a\n2.0, 5%, 3\n3.0, nan, \n")
+
+    df = load_csv(path)
+
+    assert df["value"].dtype == float
+    assert list(df["rel"][:2]) == ["1.23(4)", "5%"]
+    assert np.isnan(df["rel"][2])
+    assert list(df["note"]) == ["a", 3.0, ""]
+
+
+def test_floats_match_python_parsing(tmp_path):
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(200, 2)) * 10.0**rng.integers(-150, 150, size=(200, 1))
+    text = "\n".join(f"{float(a)!r}, {float(b)!r}" for a, b in values)
+    path = _write(tmp_path, text)
+
+    df = load_csv(path)
+
+    assert list(df.columns) == [0, 1]
+    np.testing.assert_array_equal(df.to_numpy(), values)
+
+
+def test_short_rows_are_padded(tmp_path, capsys):
+    path = _write(tmp_path, "# a, b\n1, 2\n3\n")
+
+    df = load_csv(path)
+
+    assert "Warning" in capsys.readouterr().out
+    assert df["a"].tolist() == [1.0, 3.0]
+    assert np.isnan(df["b"][1])
+
+
+def test_quoted_cells_use_csv_reader(tmp_path):
+    path = _write(tmp_path, '# a, b\n"1", 2\n')
+
+    df = load_csv(path)
+
+    pd.testing.assert_frame_equal(df, pd.DataFrame([[1.0, 2.0]], columns=["a", "b"]))
@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+
+from batfloman_praktikum_lib.io.csv import iter_csv_oszi, load_csv_oszi, load_csv_oszi_with_x
+
+HEADER = "Record Length,{n}\nSampling Period,2e-6\n\nSource,CH1\nWaveform Data,\n"
+
+
+def _write_capture(tmp_path, values):
+    path = tmp_path / "capture.csv"
+    with open(path, "w") as f:
+        f.write(HEADER.format(n=len(values)))
+        np.savetxt(f, values, fmt="%.17g")
+    return path
+
+
+def test_waveform_is_read_in_chunks(tmp_path):
+    values = np.random.default_rng(1).normal(size=1000)
+    path = _write_capture(tmp_path, values)
+
+    data, metadata = load_csv_oszi(path, chunk_lines=64)
+
+    np.testing.assert_array_equal(data, values)
+    assert metadata == {"Record Length": "1000", "Sampling Period": "2e-6", "Source": "CH1"}
+
+
+def test_non_numeric_lines_are_skipped(tmp_path):
+    path = tmp_path / "capture.csv"
+    path.write_text('Source,CH1\nWaveform Data\n1.0,3\n\nfoo\n"2.5"\n3e2,\n')
+
+    data, _ = load_csv_oszi(path, chunk_lines=2)
+
+    np.testing.assert_array_equal(data, [1.0, 2.5, 300.0])
+
+
+def test_x_axis_from_sampling_period(tmp_path):
+    path = _write_capture(tmp_path, np.arange(5.0))
+
+    x, y, _ = load_csv_oszi_with_x(path)
+
+    np.testing.assert_allclose(x, np.arange(5) * 2e-6)
+    np.testing.assert_array_equal(y, np.arange(5.0))
+
+
+def test_sidecar_cache_is_used_until_file_changes(tmp_path):
+    values = np.linspace(0, 1, 100)
+    path = _write_capture(tmp_path, values)
+
+    data, metadata = load_csv_oszi(path, cache=True)
+    assert (tmp_path / "capture.csv.npy").exists()
+
+    cached, cached_metadata = load_csv_oszi(path, cache=True)
+    assert isinstance(cached, np.memmap)
+    np.testing.assert_array_equal(cached, data)
+    assert cached_metadata == metadata
+
+    path.write_text(HEADER.format(n=2) + "7\n8\n")
+    os.utime(path, ns=(0, 0))
+    changed, _ = load_csv_oszi(path, cache=True)
+    np.testing.assert_array_equal(changed, [7.0, 8.0])
+
+
+def test_iter_chunks_match_full_load(tmp_path):
+    values = np.random.default_rng(2).normal(size=300)
+    path = _write_capture(tmp_path, values)
+
+    chunks = list(iter_csv_oszi(path, chunk_lines=64))
+
+    assert max(len(y) for _, y in chunks) <= 64
+    x_full, y_full, _ = load_csv_oszi_with_x(path)
+    np.testing.assert_allclose(np.concatenate([x for x, _ in chunks]), x_full)
+    np.testing.assert_array_equal(np.concatenate([y for _, y in chunks]), y_full)
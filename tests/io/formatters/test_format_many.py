@@ -0,0 +1,44 @@
+import numpy as np
+
+from batfloman_praktikum_lib import Measurement, MeasurementArray
+from batfloman_praktikum_lib.io.formatters import compile_format_spec, custom_format, format_many
+from batfloman_praktikum_lib.io.formatters.spec import UncertaintyNotation
+
+
+def _column():
+    rng = np.random.default_rng(8)
+    values = rng.normal(0, 5, 300) * 10.0 ** rng.integers(-5, 6, 300)
+    errors = np.abs(rng.normal(0.3, 0.2, 300)) * 10.0 ** rng.integers(-5, 6, 300)
+    errors[::40] = 0
+    return values, errors
+
+
+def test_spec_is_compiled_once():
+    compiled = compile_format_spec(".2fpm")
+
+    assert compile_format_spec(".2fpm") is compiled
+    assert compiled.notation == UncertaintyNotation.PlusMinus
+    assert compiled.measurement_spec == ".2f"
+    assert (compiled.decimals, compiled.plusminus_style) == (2, "f")
+
+
+def test_format_many_matches_custom_format():
+    values, errors = _column()
+    measurements = [Measurement(v, e) for v, e in zip(values, errors)]
+
+    for spec in ["", ".1f", ".2e", "e3"]:
+        expected = [custom_format(m, spec) for m in measurements if spec != "e3" or m.error > 0]
+        if spec == "e3":
+            got = format_many(values[errors > 0], errors[errors > 0], spec)
+        else:
+            got = format_many(values, errors, spec)
+        assert got == expected, spec
+
+    assert format_many(MeasurementArray(values, errors)) == [custom_format(m) for m in measurements]
+
+
+def test_format_many_mixed_numbers_and_measurements():
+    column = [1.5, Measurement(2.345, 0.012), 3, np.float64(12345.678)]
+
+    assert format_many(column, format_spec=".1f") == [custom_format(item, ".1f") for item in column]
+    assert format_many([1234.5, 0.0123], format_spec=".1e3") == ["1.2e3", "12.3e-3"]
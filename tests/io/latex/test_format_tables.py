@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from batfloman_praktikum_lib.io.formatters.measurement import custom_format_measurement, format_measurement_array
+from batfloman_praktikum_lib.io.latex.formatter import format_dataframe
+from batfloman_praktikum_lib.io.latex.formatter.format_tables import format_table_column, format_table_value
+from batfloman_praktikum_lib.structs.measurement import Measurement
+
+
+def _measurements(n=500):
+    rng = np.random.default_rng(3)
+    values = rng.normal(0, 3, n) * 10.0 ** rng.integers(-6, 7, n)
+    errors = np.abs(rng.normal(0.2, 0.3, n)) * 10.0 ** rng.integers(-6, 7, n)
+    values[::50] = 0
+    # DIN: leading digit 1 or 2 -> two significant digits
+    errors[::7] = np.resize([0.1, 0.2, 0.3, 0.29999999, 2.5, 3e-5, 0.0299], errors[::7].size)
+    errors[::61] = 0
+    return values, errors
+
+
+def test_array_formatting_matches_single_measurements():
+    values, errors = _measurements()
+
+    for spec in ["", "f", ".2f", ".1", ".2e"]:
+        expected = [
+            custom_format_measurement(Measurement(value, error), spec)
+            for value, error in zip(values, errors)
+        ]
+        assert format_measurement_array(values, errors, spec) == expected, spec
+
+    # notations need an uncertainty
+    errors = np.where(errors > 0, errors, 0.5)
+    for spec in ["brk.1f", ".1fpm"]:
+        expected = [
+            custom_format_measurement(Measurement(value, error), spec)
+            for value, error in zip(values, errors)
+        ]
+        assert format_measurement_array(values, errors, spec) == expected, spec
+
+
+def test_table_column_matches_cell_formatting():
+    values, errors = _measurements(200)
+    column = [Measurement(v, e) for v, e in zip(values, errors)] + [1.5, np.nan, "text", "2.5", 3]
+
+    for metadata in [{}, {"display_exponent": 3}, {"display_exponent": -2, "enforce_display_exponent": True}, {"format_spec": ".2f"}]:
+        expected = [format_table_value(value, metadata) for value in column]
+        assert format_table_column(column, metadata) == expected
+
+
+def test_format_dataframe_renders_rows():
+    df = pd.DataFrame({
+        "a": [Measurement(1.234, 0.012), Measurement(20.0, 3.0)],
+        "b": [0.5, np.nan],
+    })
+
+    latex = format_dataframe(df, options={"metadata": {"b": {"format_spec": ".1f"}}})
+
+    assert latex == (
+        "\\begin{tabular}{cc}\n"
+        "\t\\toprule\n"
+        "\t$a$ & $b$\\\\\n"
+        "\t\\midrule\n"
+        "\t\\num{1.234(12)} & \\num{0.5}\\\\\n"
+        "\t\\num{20(3)} & NaN\\\\\n"
+        "\t\\bottomrule\n"
+        "\\end{tabular}\n"
+    )
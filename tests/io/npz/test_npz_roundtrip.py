@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from batfloman_praktikum_lib import DataCluster, Dataset, Measurement
+from batfloman_praktikum_lib.io.npz import load_npz, save_npz
+from batfloman_praktikum_lib.structs.columnarDataCluster import ColumnarDataCluster
+from batfloman_praktikum_lib.structs.measurementArray import MeasurementArray
+
+
+def _cluster() -> DataCluster:
+    cluster = DataCluster([
+        Dataset({"x": Measurement(1.0, 0.1), "y": 2.0, "label": "a", "n": 1}),
+        {"x": Measurement(3.0, 0.2), "y": None, "label": "b", "n": 2},
+        {"y": 6.0, "label": Measurement(7.0, 0.5), "n": 3},
+    ])
+    cluster.metadata_manager.set_metadata("x", {"unit": "Hz", "format_spec": ".2f"})
+    return cluster
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_datacluster_roundtrip_preserves_cells_and_metadata(tmp_path, mmap):
+    original = _cluster()
+
+    path = save_npz(original, tmp_path / "calibration")
+    restored = load_npz(path, mmap=mmap)
+
+    assert path.suffix == ".npz"
+    assert isinstance(restored, ColumnarDataCluster)
+    assert restored.get_column_names() == ["x", "y", "label", "n"]
+    assert [dict(row.measurements) for row in restored] == [dict(row.measurements) for row in original.to_columnar()]
+    assert isinstance(restored[2]["label"], Measurement)
+    assert isinstance(restored[0]["n"], int)
+    assert "x" not in restored[2]
+    np.testing.assert_array_equal(restored.errors("x"), original.errors("x"))
+    assert restored.metadata_manager.get_field("x", "unit") == "Hz"
+    assert restored.metadata_manager.get_field("x", "format_spec") == ".2f"
+
+
+def test_memory_mapped_columns_are_not_copied_and_stay_editable(tmp_path):
+    values = np.linspace(0, 1, 1000)
+    original = ColumnarDataCluster.from_columns({"U": MeasurementArray(values, np.full(1000, 0.01))})
+
+    path = original.save_npz(tmp_path / "scan")
+    restored = DataCluster.load_npz(path, mmap=True)
+
+    assert isinstance(restored._columns["U"].values, np.memmap)
+    np.testing.assert_array_equal(restored.values("U"), values)
+
+    restored[0]["U"] = Measurement(5.0, 0.1)
+    assert restored[0]["U"].value == 5.0
+    assert DataCluster.load_npz(path)[0]["U"].value == 0.0
+
+
+def test_compressed_and_empty_clusters(tmp_path):
+    compressed = load_npz(save_npz(_cluster(), tmp_path / "small", compressed=True), mmap=True)
+    empty = load_npz(save_npz(DataCluster(), tmp_path / "empty"))
+
+    assert compressed[1]["x"].value == 3.0
+    assert len(empty) == 0
+    assert empty.get_column_names() == []
+
+
+def test_load_rejects_other_npz_files(tmp_path):
+    np.savez(tmp_path / "plain.npz", x=np.arange(3))
+
+    with pytest.raises(ValueError):
+        load_npz(tmp_path / "plain.npz")
@@ -1,4 +1,13 @@
-from batfloman_praktikum_lib.significant_rounding import get_sig_digit_position
+import numpy as np
+
+from batfloman_praktikum_lib.significant_rounding import (
+    get_sig_digit_position,
+    get_sig_digit_positions,
+    round_sig,
+    round_sig_array,
+    round_sig_fixed,
+    round_sig_fixed_array,
+)
 
 def test_sig_pos():
     # Values < 1
@@ -33,3 +42,48 @@ def test_sig_pos():
         get_sig_digit_position(0)
     with pytest.raises(ValueError):
         get_sig_digit_position(-1)
+
+
+def _errors():
+    rng = np.random.default_rng(5)
+    errors = np.abs(rng.normal(0.3, 0.3, 2000)) * 10.0 ** rng.integers(-9, 9, 2000)
+    errors[:10] = [0.1, 0.15, 0.29, 0.3, 1.0, 2.0, 2.3, 3.0, 25, 30]
+    return errors
+
+
+def test_sig_positions_match_scalar():
+    errors = _errors()
+    expected = [get_sig_digit_position(err) for err in errors]
+    assert get_sig_digit_positions(errors).tolist() == expected
+
+    import pytest
+    with pytest.raises(ValueError):
+        get_sig_digit_positions([0.1, 0.0])
+
+
+def test_round_sig_array_matches_scalar_and_skips_missing_errors():
+    errors = _errors()
+    values = np.random.default_rng(6).normal(0, 10, errors.size)
+    errors[::97] = 0
+    errors[1::97] = np.nan
+    errors[2::97] = np.inf
+
+    rounded_values, rounded_errors = round_sig_array(values, errors)
+
+    for value, error, rounded_value, rounded_error in zip(values, errors, rounded_values, rounded_errors):
+        if np.isfinite(error) and error > 0:
+            assert (rounded_value, rounded_error) == round_sig(value, error)
+        else:
+            assert rounded_value == value
+            assert rounded_error == error or np.isnan(error)
+
+
+def test_round_sig_fixed_array_per_entry_decimals():
+    values = np.array([1.2345, 12.345, 0.012345])
+    errors = np.array([0.0123, 0.123, 0.00123])
+    decimals = np.array([2, 1, 4])
+
+    rounded_values, rounded_errors = round_sig_fixed_array(values, errors, decimals)
+
+    expected = [round_sig_fixed(v, e, d) for v, e, d in zip(values, errors, decimals)]
+    assert list(zip(rounded_values, rounded_errors)) == expected
@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+
+from batfloman_praktikum_lib import DataCluster, Dataset, Measurement, MeasurementArray
+from batfloman_praktikum_lib.structs import ColumnarDataCluster
+
+
+def make_cluster():
+    return ColumnarDataCluster([
+        {"label": "A", "x": Measurement(1.0, 0.1), "n": 3},
+        {"label": "B", "x": Measurement(2.0, 0.2), "n": 1},
+        {"label": "C", "n": 2},
+    ])
+
+
+def test_values_and_errors_are_copies_of_the_buffers():
+    data = make_cluster()
+
+    values = data.values("x")
+    assert values[:2].tolist() == [1.0, 2.0]
+    assert np.isnan(values[2])
+    assert data.errors("x")[:2].tolist() == [0.1, 0.2]
+    assert data.mask("x").tolist() == [True, True, False]
+
+    # in-place changes of the result do not reach the cluster, like for DataCluster
+    values[data.mask("x")] = 0.0
+    data.errors("x")[0] = 1.0
+    assert data.values("x")[:2].tolist() == [1.0, 2.0]
+    assert data[0]["x"].error == 0.1
+
+    measurements = data.measurements("x")
+    assert isinstance(measurements, MeasurementArray)
+    assert measurements.value[:2].tolist() == [1.0, 2.0]
+
+
+def test_column_returns_unboxed_copies_for_numeric_columns():
+    data = ColumnarDataCluster.from_columns({
+        "t": np.array([0.0, 1.0, 2.0]),
+        "U": MeasurementArray([1.0, 2.0, 3.0], [0.1, 0.1, 0.1]),
+    })
+    data.add({"t": 3.0, "label": "x"})
+
+    t = data.column("t")
+    assert t.dtype == float
+    assert t.tolist() == [0.0, 1.0, 2.0, 3.0]
+    t[0] = 5.0
+    assert data[0]["t"] == 0.0
+
+    # a row without a measurement: boxed like DataCluster.column
+    U = data.column("U")
+    assert U.dtype == object
+    assert isinstance(U[0], Measurement) and np.isnan(U[3])
+
+    data.remove(data[3])
+    U = data.column("U")
+    assert isinstance(U, MeasurementArray)
+    U[0] = Measurement(9.0, 0.9)
+    assert data[0]["U"].value == 1.0
+
+
+def test_row_views_are_cached_until_rows_change():
+    data = make_cluster()
+
+    assert data.data is data.data
+    assert isinstance(data.data, tuple)
+    rows = data.data
+    data.sort("n")
+    assert data.data is not rows
+    assert [row["label"] for row in data] == ["B", "C", "A"]
+
+
+def test_rows_are_views_that_write_through():
+    data = make_cluster()
+
+    row = data[2]
+    assert isinstance(row, Dataset)
+    assert "x" not in row
+    assert row["n"] == 2 and isinstance(row["n"], int)
+
+    row["x"] = Measurement(5.0, 0.5)
+    assert data.values("x")[2] == 5.0
+    assert data.errors("x")[2] == 0.5
+
+    data[0]["label"] = "Z"
+    assert list(data["label"]) == ["Z", "B", "C"]
+
+
+def test_schema_and_mixed_columns():
+    data = make_cluster()
+
+    assert data.get_column_names() == ["label", "x", "n"]
+
+    data.add({"n": "many", "extra": 1.5})
+    assert data.get_column_names() == ["label", "x", "n", "extra"]
+    assert list(data["n"]) == [3, 1, 2, "many"]
+    assert np.isnan(data.values("n")[3])
+    assert np.isnan(data.values("extra")[0])
+
+
+def test_sort_keeps_row_views_attached():
+    data = make_cluster()
+    first = data[0]
+
+    data.sort("n")
+
+    assert list(data["label"]) == ["B", "C", "A"]
+    assert first["label"] == "A"
+
+    data.sort("x")
+    assert list(data["label"]) == ["C", "A", "B"]
+
+
+def test_filter_remove_and_conversion():
+    data = make_cluster()
+
+    filtered = data.filter(lambda row: row["n"] > 1)
+    assert isinstance(filtered, ColumnarDataCluster)
+    assert list(filtered["label"]) == ["A", "C"]
+
+    data.remove(data[1])
+    assert list(data["label"]) == ["A", "C"]
+
+    rows = data.to_rows()
+    assert type(rows) is DataCluster
+    assert list(rows["label"]) == ["A", "C"]
+
+    columnar = rows.to_columnar()
+    assert isinstance(columnar, ColumnarDataCluster)
+    assert columnar[0]["x"].error == 0.1
+
+
+def test_from_columns_and_column_assignment():
+    data = ColumnarDataCluster.from_columns({
+        "t": np.array([0.0, 1.0, 2.0]),
+        "U": MeasurementArray([1.0, 2.0, 3.0], [0.1, 0.1, 0.1]),
+    })
+
+    data["P"] = data.measurements("U") ** 2
+    assert np.allclose(data.values("P"), [1.0, 4.0, 9.0])
+    assert isinstance(data[1]["P"], Measurement)
+
+    with pytest.raises(ValueError):
+        data["bad"] = [1, 2]
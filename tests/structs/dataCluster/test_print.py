@@ -0,0 +1,59 @@
+import io
+
+from batfloman_praktikum_lib import DataCluster, Measurement
+
+
+def _cluster(n_rows: int, n_columns: int = 2) -> DataCluster:
+    return DataCluster([
+        {f"c{col}": (Measurement(row + 0.5, 0.1) if col == 0 else row) for col in range(n_columns)}
+        for row in range(n_rows)
+    ])
+
+
+def test_small_table_is_printed_completely():
+    cluster = DataCluster([{"x": 1, "U": Measurement(1.234, 0.012)}, {"x": None, "U": "  "}])
+
+    assert str(cluster) == (
+        "x | U        \n"
+        "--+----------\n"
+        "1 | 1.234(12)\n"
+        "- | -        \n"
+    )
+
+def test_long_table_shows_head_and_tail():
+    cluster = _cluster(1000)
+
+    lines = cluster.to_string(max_rows=4).splitlines()
+
+    assert lines[2].startswith("0.50(10) ")
+    assert lines[4].startswith("...")
+    assert lines[6].startswith("999.50(10)")
+    assert lines[-1] == "[1000 rows x 2 columns]"
+    assert len(str(cluster).splitlines()) == 2 + DataCluster.display_max_rows + 1 + 2
+
+def test_wide_table_shows_first_and_last_columns():
+    cluster = _cluster(3, n_columns=10)
+
+    header = cluster.to_string(max_columns=4).splitlines()[0]
+
+    assert [name.strip() for name in header.split("|")] == ["c0", "c1", "...", "c8", "c9"]
+
+def test_full_table_is_written_to_buffer():
+    cluster = _cluster(200)
+    buf = io.StringIO()
+
+    assert cluster.to_string(buf, full=True) is None
+    assert buf.getvalue() == cluster.to_string(full=True)
+    assert len(buf.getvalue().splitlines()) == 202
+    assert str(cluster.to_columnar()) == str(cluster)
+
+def test_rows_without_columns_print_empty_lines():
+    assert str(DataCluster([{}, {}])) == "\n\n\n\n"
+
+def test_no_truncation_that_would_hide_a_single_entry():
+    rows = _cluster(5).to_string(max_rows=4)
+    columns = _cluster(2, n_columns=5).to_string(max_columns=4)
+
+    assert "..." not in rows and "rows x" not in rows
+    assert "..." not in columns and "rows x" not in columns
+    assert _cluster(6).to_string(max_rows=4).splitlines()[-1] == "[6 rows x 2 columns]"
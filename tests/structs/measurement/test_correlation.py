@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from batfloman_praktikum_lib import Measurement
+from batfloman_praktikum_lib.graph_fit import Linear
+from batfloman_praktikum_lib.structs import covariance, track_correlations
+from batfloman_praktikum_lib.structs.measurementArray import MeasurementArray
+
+
+def test_tracking_is_opt_in():
+    x = Measurement(2.0, 0.1)
+
+    assert np.isclose((x - x).error, np.hypot(0.1, 0.1))
+    with track_correlations():
+        assert (x - x).error == 0.0
+        assert np.isclose((x * x).error, 2 * 2.0 * 0.1)
+        assert (np.sin(x) - np.sin(x)).error == 0.0
+    assert np.isclose((x - x).error, np.hypot(0.1, 0.1))
+
+
+def test_independent_measurements_still_add_in_quadrature():
+    with track_correlations():
+        x = Measurement(2.0, 0.3)
+        y = Measurement(3.0, 0.4)
+
+        assert np.isclose((x + y).error, 0.5)
+        assert np.isclose(((x + y) - y).error, 0.3)
+        assert covariance(x, y) == 0.0
+
+
+def test_object_arrays_keep_correlations_elementwise():
+    with track_correlations():
+        x = Measurement(2.0, 0.1)
+        arr = np.array([x, Measurement(3.0, 0.2)], dtype=object)
+
+        result = arr - x
+
+        assert result[0].error == 0.0
+        assert np.isclose(result[1].error, np.hypot(0.1, 0.2))
+
+
+def test_fit_parameters_are_seeded_with_fit_covariance():
+    x = np.linspace(0, 10, 20)
+    y = 2 * x + 1 + np.random.default_rng(0).normal(0, 0.1, 20)
+
+    with track_correlations():
+        result = Linear.fit(x, y, yerr=np.full(20, 0.1))
+        m = result.params["m"]
+        n = result.params["n"]
+        cov = np.asarray(result.cov)
+
+        assert np.isclose(m.error, np.sqrt(cov[0, 0]))
+        assert np.isclose(covariance(m, n), cov[0, 1])
+        assert np.isclose((m + n).error, np.sqrt(cov[0, 0] + cov[1, 1] + 2 * cov[0, 1]))
+
+
+def test_changing_the_error_in_place_drops_the_old_gradient():
+    with track_correlations():
+        x = Measurement(2.0, 0.1)
+        assert (x - x).error == 0.0
+
+        x.modify.set_error(0.5)
+        assert (x + x).error == 1.0
+
+        y = x * 1.0
+        y.modify.add_error(0.2)
+        assert np.isclose(covariance(x, y), 0.0)
+        assert np.isclose((y + 0.0).error, 0.7)
+
+        x.modify.round()
+        assert (x + x).error == 2 * x.error
+
+
+def test_long_chains_and_shared_intermediates_expand_once():
+    with track_correlations():
+        xs = [Measurement(1.0, 0.1) for _ in range(20000)]
+        total = xs[0]
+        for x in xs[1:]:
+            total = total + x
+
+        doubled = xs[0]
+        for _ in range(40):
+            doubled = doubled + doubled
+
+        assert np.isclose(total.error, np.sqrt(20000) * 0.1)
+        assert np.isclose(covariance(total, xs[-1]), 0.01)
+        assert np.isclose(doubled.error, 2**40 * 0.1)
+
+
+def test_measurement_array_refuses_tracked_arithmetic():
+    a = MeasurementArray([1.0, 2.0], [0.1, 0.2])
+    with track_correlations():
+        with pytest.raises(TypeError):
+            a - a
+        with pytest.raises(TypeError):
+            Measurement(1.0, 0.1) * a
+        assert list(a < 1.5) == [True, False]
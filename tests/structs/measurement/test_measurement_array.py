@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+
+from batfloman_praktikum_lib import Measurement, MeasurementArray
+
+
+def test_ufunc_matches_object_array_propagation():
+    values = np.array([1.0, 4.0, 9.0])
+    errors = np.array([0.1, 0.4, 0.9])
+    arr = MeasurementArray(values, errors)
+    legacy = np.array([Measurement(v, e) for v, e in zip(values, errors)], dtype=object)
+
+    for ufunc in (np.sqrt, np.sin, np.log, np.log10):
+        result = ufunc(arr)
+        expected = ufunc(legacy)
+
+        assert isinstance(result, MeasurementArray)
+        assert np.allclose(result.value, [item.value for item in expected])
+        assert np.allclose(result.error, [item.error for item in expected])
+
+
+def test_binary_operations_with_scalars_measurements_and_arrays():
+    arr = MeasurementArray([1.0, 2.0], [0.1, 0.2])
+    scale = Measurement(2.0, 0.5)
+
+    for result in (scale * arr, arr * scale):
+        assert isinstance(result, MeasurementArray)
+        assert np.allclose(result.value, [2.0, 4.0])
+        assert np.allclose(result.error, np.hypot(2.0 * arr.error, 0.5 * arr.value))
+
+    shifted = np.array([1.0, 1.0]) + arr
+    assert isinstance(shifted, MeasurementArray)
+    assert np.allclose(shifted.value, [2.0, 3.0])
+    assert np.allclose(shifted.error, [0.1, 0.2])
+
+    assert np.allclose((1 / arr).value, [1.0, 0.5])
+    assert np.allclose((arr ** 2).error, [0.2, 0.8])
+    assert (arr < 1.5).tolist() == [True, False]
+
+
+def test_indexing_slicing_masking_and_concatenation_stay_unboxed():
+    arr = MeasurementArray([1.0, 2.0, 3.0], [0.1, 0.2, 0.3])
+
+    item = arr[1]
+    assert isinstance(item, Measurement)
+    assert (item.value, item.error) == (2.0, 0.2)
+
+    assert isinstance(arr[1:], MeasurementArray)
+    assert arr[1:].value.tolist() == [2.0, 3.0]
+
+    masked = arr[arr > 1.5]
+    assert isinstance(masked, MeasurementArray)
+    assert masked.error.tolist() == [0.2, 0.3]
+
+    joined = MeasurementArray.concatenate([arr, masked])
+    assert len(joined) == 5
+    assert joined.value.tolist() == [1.0, 2.0, 3.0, 2.0, 3.0]
+
+
+def test_round_trip_with_object_arrays():
+    legacy = np.array([Measurement(1.0, 0.1), 2.0], dtype=object)
+
+    arr = MeasurementArray.from_measurements(legacy)
+    assert arr.value.tolist() == [1.0, 2.0]
+    assert arr.error.tolist() == [0.1, 0.0]
+
+    boxed = arr.to_object_array()
+    assert all(isinstance(item, Measurement) for item in boxed)
+    assert np.asarray(arr).tolist() == [1.0, 2.0]
+
+
+def test_round_matches_single_measurements():
+    arr = MeasurementArray([1.23456, 123.456, 0.0123456, 5.0], [0.0234, 1.7, 0.00093, 0.0])
+
+    rounded = arr.round()
+    for item, expected in zip(rounded, (m.round() for m in arr)):
+        assert (item.value, item.error) == (expected.value, expected.error)
+
+    din = arr.round_sig()
+    assert din.value.tolist() == [1.235, 123.5, 0.0123, 5.0]
+    assert din.error.tolist() == [0.024, 1.7, 0.001, 0.0]
+
+
+def test_negation_does_not_share_the_error_buffer():
+    array = MeasurementArray([1.0, 2.0], [0.1, 0.2])
+
+    negated = -array
+    negated.error[0] = 5.0
+
+    assert array.error.tolist() == [0.1, 0.2]
+    assert negated.value.tolist() == [-1.0, -2.0]
+
+
+def test_sum_and_product_propagate_errors():
+    arr = MeasurementArray([1.0, 2.0, 0.0, 4.0], [0.1, 0.2, 0.3, 0.4])
+    legacy = arr.to_object_array()
+
+    for total in (np.sum(arr), np.add.reduce(arr)):
+        assert isinstance(total, Measurement)
+        assert np.isclose(total.value, 7.0)
+        assert np.isclose(total.error, np.sqrt(0.3))
+
+    expected = legacy[0] * legacy[1] * legacy[2] * legacy[3]
+    for product in (np.prod(arr), np.multiply.reduce(arr)):
+        assert product.value == 0.0
+        assert np.isclose(product.error, expected.error)
+
+
+def test_reductions_along_an_axis():
+    arr = MeasurementArray([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], np.full((2, 3), 0.1))
+
+    total = np.sum(arr, axis=0)
+    assert isinstance(total, MeasurementArray)
+    assert total.value.tolist() == [5.0, 7.0, 9.0]
+    assert np.allclose(total.error, np.hypot(0.1, 0.1))
+    assert np.sum(arr, axis=1, keepdims=True).shape == (2, 1)
+
+    product = np.prod(arr, axis=1)
+    assert product.value.tolist() == [6.0, 120.0]
+    assert np.allclose(product.error, [0.1 * np.sqrt(36 + 9 + 4), 0.1 * np.sqrt(900 + 576 + 400)])
+
+    mean = np.mean(arr, axis=0)
+    assert mean.value.tolist() == [2.5, 3.5, 4.5]
+    assert np.allclose(mean.error, np.hypot(0.1, 0.1) / 2)
+
+
+def test_mean_and_concatenate_keep_the_errors():
+    arr = MeasurementArray([1.0, 2.0, 3.0], [0.3, 0.3, 0.3])
+
+    mean = np.mean(arr)
+    assert isinstance(mean, Measurement)
+    assert (mean.value, mean.error) == (2.0, np.sqrt(0.27) / 3)
+
+    joined = np.concatenate([arr, arr[:1]])
+    assert isinstance(joined, MeasurementArray)
+    assert joined.error.tolist() == [0.3, 0.3, 0.3, 0.3]
+
+
+def test_unsupported_numpy_functions_raise_instead_of_dropping_errors():
+    arr = MeasurementArray([1.0, 2.0], [0.1, 0.2])
+
+    with pytest.raises(TypeError):
+        np.median(arr)
+    with pytest.raises(TypeError):
+        np.stack([arr, arr])
+    assert np.shape(arr) == (2,)
+    assert np.asarray(arr).tolist() == [1.0, 2.0]
+
+
+def test_negative_and_positive_ufuncs():
+    arr = MeasurementArray([1.0, -2.0], [0.1, 0.2])
+
+    negative = np.negative(arr)
+    positive = np.positive(arr)
+    assert negative.value.tolist() == [-1.0, 2.0]
+    assert positive.value.tolist() == [1.0, -2.0]
+    for result in (negative, positive):
+        assert result.error.tolist() == [0.1, 0.2]
+        assert not np.shares_memory(result.error, arr.error)
+
+    single = np.negative(Measurement(1.0, 0.1))
+    assert (single.value, single.error) == (-1.0, 0.1)
@@ -102,3 +102,29 @@ def test_log_methods_match_numpy_dispatch():
     assert np.isclose(natural.error, 0.5 / (np.e**2))
     assert np.isclose(common.value, np.log10(np.e**2))
     assert np.isclose(common.error, 0.5 / (np.e**2 * np.log(10)))
+
+
+def test_scalar_measurement_with_object_array_uses_batched_path():
+    column = np.array([Measurement(1.0, 0.1), Measurement(2.0, 0.2), 4.0], dtype=object)
+    scale = Measurement(2.0, 0.5)
+
+    for result in (scale * column, column * scale):
+        assert result.dtype == object
+        assert all(isinstance(item, Measurement) for item in result)
+        assert [item.value for item in result] == [2.0, 4.0, 8.0]
+        assert np.allclose([item.error for item in result], [
+            np.hypot(2.0 * 0.1, 0.5 * 1.0),
+            np.hypot(2.0 * 0.2, 0.5 * 2.0),
+            0.5 * 4.0,
+        ])
+
+    shifted = scale - np.array([1.0, 3.0])
+    assert [item.value for item in shifted] == [1.0, -1.0]
+    assert [item.error for item in shifted] == [0.5, 0.5]
+
+    divided = np.array([1.0, 4.0]) / scale
+    assert [item.value for item in divided] == [0.5, 2.0]
+
+    powered = scale ** np.array([1.0, 2.0])
+    assert [item.value for item in powered] == [2.0, 4.0]
+    assert np.isclose(powered[1].error, 2.0 * 2.0 * 0.5)
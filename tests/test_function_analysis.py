@@ -0,0 +1,62 @@
+import math
+
+import numpy as np
+
+from batfloman_praktikum_lib import function_analysis
+from batfloman_praktikum_lib.graph_fit.fitResult import generate_fit_result
+from batfloman_praktikum_lib.structs.measurement import Measurement
+
+
+def test_find_x_for_y_finds_all_crossings():
+    roots = function_analysis.find_x_for_y(np.sin, 0.5, (0, 4 * np.pi))
+
+    expected = [np.pi / 6, 5 * np.pi / 6, 13 * np.pi / 6, 17 * np.pi / 6]
+    np.testing.assert_allclose(roots, expected, atol=1e-10)
+
+
+def test_find_x_for_y_includes_grid_zeros_once():
+    roots = function_analysis.find_x_for_y(lambda x: x**3 - x, 0, (-2, 2), num_points=5)
+
+    np.testing.assert_allclose(roots, [-1, 0, 1], atol=1e-10)
+
+
+def test_find_x_for_y_supports_scalar_only_functions():
+    roots = function_analysis.find_x_for_y(lambda x: math.cos(x) if x < 10 else 1.0, 0, (0, 9))
+
+    np.testing.assert_allclose(roots, [np.pi / 2, 3 * np.pi / 2, 5 * np.pi / 2], atol=1e-10)
+
+
+def test_find_x_for_y_propagates_fit_uncertainty():
+    fit = generate_fit_result(lambda x, m, n: m * x + n, [2.0, 1.0], [0.1, 0.2], [[0.01, 0.0], [0.0, 0.04]])
+
+    root, = function_analysis.find_x_for_y(fit, Measurement(5.0, 0.3), (0, 10))
+
+    # x = (y - n) / m
+    expected = (Measurement(5.0, 0.3) - Measurement(1.0, 0.2)) / Measurement(2.0, 0.1)
+    assert isinstance(root, Measurement)
+    assert math.isclose(root.value, expected.value, rel_tol=1e-10)
+    assert math.isclose(root.error, expected.error, rel_tol=1e-4)
+
+
+def test_find_intersections():
+    roots = function_analysis.find_intersections(np.sin, np.cos, 0, 10)
+
+    np.testing.assert_allclose(roots, np.pi / 4 + np.pi * np.arange(3), atol=1e-10)
+
+
+def test_find_max_returns_global_maximum():
+    x_max, y_max = function_analysis.find_max(lambda x: np.sin(x) + 0.1 * x, (0, 15))
+
+    assert math.isclose(x_max, 2 * np.pi * 2 + np.arccos(-0.1), rel_tol=1e-6)
+    assert math.isclose(y_max, np.sin(x_max) + 0.1 * x_max)
+
+
+def test_find_max_on_boundary():
+    assert function_analysis.find_max(lambda x: x, (0, 1)) == (1.0, 1.0)
+
+
+def test_find_max_all_maxima():
+    maxima = function_analysis.find_max(np.sin, (0, 20), all_maxima=True)
+
+    np.testing.assert_allclose([x for x, _ in maxima], np.pi / 2 + 2 * np.pi * np.arange(3), atol=1e-6)
+    np.testing.assert_allclose([y for _, y in maxima], 1.0)
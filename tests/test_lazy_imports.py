@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
+import batfloman_praktikum_lib as bpl
+
+
+def _loaded_after(statement: str) -> set[str]:
+    code = f"import sys\n{statement}\nprint(','.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return set(out.strip().split(","))
+
+
+def test_measurement_does_not_import_heavy_dependencies():
+    loaded = _loaded_after("from batfloman_praktikum_lib import Measurement")
+
+    for name in ("pandas", "scipy", "matplotlib", "PyQt6"):
+        assert name not in loaded
+
+
+def test_graph_fit_does_not_import_gui():
+    loaded = _loaded_after("import batfloman_praktikum_lib.graph_fit")
+
+    assert "PyQt6" not in loaded
+    assert "pyqtgraph" not in loaded
+    assert "batfloman_praktikum_lib.graph_fit.fit_session.windows" not in loaded
+
+
+def test_lazy_attributes_resolve_to_the_real_objects():
+    from batfloman_praktikum_lib.structs.dataCluster import DataCluster
+
+    assert bpl.DataCluster is DataCluster
+    assert bpl.graph_fit.ManualFitSetup.__module__.endswith("init_params.fitSetup")
+    assert "significant_rounding" in dir(bpl)
+
+    with pytest.raises(AttributeError):
+        bpl.does_not_exist